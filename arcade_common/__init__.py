@@ -0,0 +1,2 @@
+# Bits and pieces shared by all of the arcade games (sounds, and more to come).
+# Each game folder adds the folder above it to sys.path so it can do: from arcade_common import synth
@@ -0,0 +1,60 @@
+# How much does the frame timer (frame_timer.py) cost a game?
+# Run it with: python benchmark_frame_timer.py
+# We make the same calls a game makes every frame - handle() for a couple of events, the
+# marks for every phase, one tick through wait(), a few counts and end() - FRAMES times over,
+# with no actual game in between. So this is the timer's own cost per frame:
+#   off       - the timer is there but switched off (what every game pays normally)
+#   on        - timing every phase and keeping the p50/p99 history (with the overlay)
+#   on + file - ...and writing every frame to a JSON lines file too
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # So we can find arcade_common
+from arcade_common.frame_timer import FrameTimer
+
+FRAMES = 100_000
+FRAME_BUDGET = 1 / 60  # One frame at 60 fps
+
+
+def time_frames(timer, screen):
+    events = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE), pygame.event.Event(pygame.KEYUP, key=pygame.K_SPACE)]
+    ticks = range(1)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        for event in events:
+            timer.handle(event)
+        timer.mark("input")
+        for _ in timer.wait(ticks):
+            timer.mark("update")
+            timer.mark("collision")
+        timer.draw(screen)
+        timer.mark("render")
+        timer.mark("flip")
+        timer.count("asteroids", frame & 15)
+        timer.count("bullets", frame & 7)
+        timer.end()
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((800, 600))
+    with tempfile.TemporaryDirectory() as folder:
+        timers = [("off", FrameTimer(enabled=False)),
+                  ("on", FrameTimer(enabled=True)),
+                  ("on + file", FrameTimer(enabled=True, path=os.path.join(folder, "frames.jsonl")))]
+        print(f"{'timer':>10} {'per frame':>12} {'of a frame':>11}")
+        for name, timer in timers:
+            per_frame = time_frames(timer, screen)
+            print(f"{name:>10} {per_frame * 1e6:9.2f} us {per_frame / FRAME_BUDGET:10.3%}")
+            timer.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
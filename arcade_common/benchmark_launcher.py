@@ -0,0 +1,131 @@
+# How fast the launcher (launcher.py) switches games, and whether switching leaks anything.
+# Run it with: python benchmark_launcher.py
+# A "switch" is from pressing Esc in one game to the next game's first frame: the old game
+# finishing, the menu coming back, and the new game setting up (window, sounds, pictures).
+# Instead of a keyboard, every game gets an Esc after FRAMES frames, and the launcher goes
+# round all the games ROUNDS times, in a Python of its own:
+#   cold - no warm-up, so the first time round each game is imported during its switch
+#   warm - the menu was left alone long enough for the background warm-up to finish first
+# The first round is the one a player notices; the rounds after it show what a switch costs
+# once everything's loaded. For comparison, "standalone" is starting the game on its own
+# ("python asteroids.py") up to its first frame - what switching cost before the launcher.
+#
+# To spot leaks, the memory used and the sizes of the shared caches are printed after the first
+# round and after the last one: they should stay (about) the same however many times you switch.
+import json
+import os
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("ARCADE_FAST_FORWARD", "1")  # (Before the launcher imports game_loop.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pygame
+
+from arcade_common import launcher
+from arcade_common import text
+
+FRAMES = 30     # Frames each game runs before it gets its Esc
+ROUNDS = 20     # Times round all the games
+LIMIT_MS = 100  # A switch should take well under this
+
+
+def memory_mb():
+    # How much memory this Python is using right now (Linux), or its most ever (elsewhere)
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def cache_sizes():
+    return {"memory MB": round(memory_mb(), 1), "text pictures": len(text._cache),
+            "digit atlases": len(text._atlases), "fonts": len(text._fonts), "modules": len(sys.modules)}
+
+
+class EscAfter:
+    # Stands in for pygame.event.get(): notes each game's first frame, and presses Esc after FRAMES
+    def __init__(self):
+        self.get_events = pygame.event.get
+        self.frame = 0
+        self.escaped = None     # When the last game got its Esc
+        self.first_frame = None  # When the game that's playing now started its first frame
+
+    def get(self, *args, **kwargs):
+        events = self.get_events(*args, **kwargs)
+        if self.frame == 0:
+            self.first_frame = time.perf_counter()
+        self.frame += 1
+        if self.frame == FRAMES:
+            self.escaped = time.perf_counter()
+            events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE, mod=0, unicode="", scancode=0))
+        return events
+
+
+def child(mode):
+    # (In a Python of its own) go round the games and print the switch times and cache sizes as JSON
+    if mode == "cold":
+        launcher.Launcher.warm = lambda self: None  # Nothing warmed up: every game loads when it's picked
+    keys = EscAfter()
+    pygame.event.get = keys.get
+    arcade = launcher.Launcher()
+    arcade.warm_up.join()  # (Cold: there was nothing to do. Warm: the menu sat there while it ran.)
+    switches = {name: [] for name, folder, module in launcher.GAMES}
+    sizes = []
+    for round_number in range(ROUNDS):
+        for name, folder, module in launcher.GAMES:
+            start = keys.escaped or time.perf_counter()  # (The very first game: from picking it)
+            keys.frame = 0
+            arcade.play(folder, module)
+            switches[name].append((keys.first_frame - start) * 1000)
+            if pygame.mixer.get_busy() or pygame.mixer.music.get_busy():
+                raise RuntimeError(f"{name} was still making noise after it closed")
+        if round_number in (0, ROUNDS - 1):
+            sizes.append(cache_sizes())
+    print(json.dumps({"switches": switches, "sizes": sizes}))
+
+
+def standalone(script):
+    # Starting the game on its own, up to the end of its first frame (plus Python quitting again)
+    env = dict(os.environ, ARCADE_MAX_TICKS="1")
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(launcher.ROOT, script)], env=env, capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def run_child(mode):
+    run = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode],
+                         capture_output=True, text=True)
+    if run.returncode:
+        raise RuntimeError(f"The {mode} launcher crashed:\n{run.stderr}")
+    return json.loads(run.stdout.splitlines()[-1])
+
+
+def main():
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2])
+        return 0
+    results = {mode: run_child(mode) for mode in ("cold", "warm")}
+    print(f"{ROUNDS} rounds of {len(launcher.GAMES)} games, {FRAMES} frames each, switch times in ms")
+    print(f"{'game':>16} {'standalone':>11} {'cold 1st':>9} {'warm 1st':>9} {'later p50':>10} {'later max':>10}")
+    slowest = 0
+    for name, folder, module in launcher.GAMES:
+        alone = standalone(os.path.join(folder, module + ".py"))
+        cold, warm = results["cold"]["switches"][name], results["warm"]["switches"][name]
+        later = sorted(warm[1:])
+        slowest = max(slowest, warm[0], later[-1])
+        print(f"{name:>16} {alone:11.0f} {cold[0]:9.1f} {warm[0]:9.1f} {later[len(later) // 2]:10.1f} {later[-1]:10.1f}")
+    for mode in ("cold", "warm"):
+        first, last = results[mode]["sizes"]
+        print(f"{mode} caches after round 1: {first}")
+        print(f"{' ' * len(mode)}       after round {ROUNDS}: {last}")
+    print(f"slowest warm switch {slowest:.1f} ms (limit {LIMIT_MS} ms)")
+    return 1 if slowest > LIMIT_MS else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
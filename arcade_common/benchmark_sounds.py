@@ -0,0 +1,98 @@
+# How long does each game spend making its sounds when it starts up?
+# Run it with: python benchmark_sounds.py
+# Every game start is a brand new Python, so each test runs in its own fresh Python (a
+# "subprocess") and times everything sound related - importing, making and loading:
+#   old   - the way the game used to do it (a Python loop for beeps, or NumPy sine waves)
+#   cold  - the shared synth with an empty sound bank (the very first time you play)
+#   warm  - the shared synth again, now that the bank has every sound (every time after that)
+import os
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPEATS = 5  # Run each test a few times and keep the best
+
+# The sounds each game makes: (pitch, seconds, wave, volume, release) - same as in the games
+GAME_SOUNDS = {
+    "asteroids": [(800, 0.1, "square", 0.5, 0), (200, 0.2, "square", 0.5, 0), (1000, 0.15, "square", 0.5, 0),
+                  (400, 0.3, "square", 0.5, 0), (300, 0.2, "square", 0.5, 0)],
+    "breakout": [(800, 0.1, "square", 0.5, 0), (200, 0.15, "square", 0.5, 0), (300, 0.2, "square", 0.5, 0),
+                 (1000, 0.15, "square", 0.5, 0)],
+    "space_invaders": [(800, 0.1, "square", 0.5, 0), (200, 0.2, "square", 0.5, 0), (500, 0.15, "square", 0.5, 0)],
+    "pong_breakout": [(800, 0.1, "sine", 1.0, 0), (600, 0.1, "sine", 1.0, 0), (400, 0.5, "sine", 1.0, 0)],
+    "tetris": [(440, 0.1, "sine", 1.0, 0), (523, 0.1, "sine", 1.0, 0), (261, 0.2, "sine", 1.0, 0),
+               (659, 0.3, "sine", 1.0, 0), (196, 0.5, "sine", 1.0, 0.2)],
+}
+
+# What runs inside each fresh Python. pygame itself is started before the clock, since every
+# game needs that no matter how it makes its sounds.
+SETUP = """
+import os, sys, time
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+import pygame
+pygame.init()
+sounds = {sounds!r}
+start = time.perf_counter()
+"""
+OLD = """
+def create_beep_sound(frequency, duration=100):
+    sample_rate = 44100
+    samples = int(sample_rate * duration / 1000)
+    buffer = bytearray()
+    for i in range(samples):
+        value = int(127 * (1 + (i * frequency % sample_rate > sample_rate // 2) - 0.5))
+        buffer.append(value)
+    return pygame.mixer.Sound(buffer)
+
+def create_sound(frequency, duration):
+    import numpy as np
+    sample_rate = 44100
+    t = np.linspace(0, duration, int(sample_rate * duration), False)
+    wave = np.sin(frequency * t * 2 * np.pi)
+    mono_array = (wave * 32767).astype(np.int16)
+    return pygame.sndarray.make_sound(np.column_stack((mono_array, mono_array)))
+
+for frequency, duration, wave, volume, release in sounds:
+    if wave == "square":
+        create_beep_sound(frequency, int(duration * 1000))
+    else:
+        create_sound(frequency, duration)
+"""
+SYNTH = """
+sys.path.append({repo!r})
+from arcade_common import synth
+for frequency, duration, wave, volume, release in sounds:
+    synth.tone(frequency, duration, wave=wave, volume=volume, release=release)
+"""
+REPORT = """
+print(time.perf_counter() - start)
+"""
+
+
+def run(code, bank):
+    env = dict(os.environ, ARCADE_SOUND_BANK=bank, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    output = subprocess.run([sys.executable, "-c", code], env=env, check=True,
+                            capture_output=True, text=True).stdout.split()  # The time is the last thing printed
+    return float(output[-1])
+
+
+def main():
+    print(f"{'game':>15} {'old':>10} {'cold':>10} {'warm':>10} {'warm vs old':>12}")
+    with tempfile.TemporaryDirectory() as folder:
+        for game, sounds in GAME_SOUNDS.items():
+            setup = SETUP.format(sounds=sounds)
+            bank = os.path.join(folder, game + ".bank")  # Each game starts with its own empty bank
+            old = min(run(setup + OLD + REPORT, bank) for _ in range(REPEATS))
+            cold = []
+            for _ in range(REPEATS):
+                if os.path.exists(bank):
+                    os.remove(bank)  # Empty the bank so every sound has to be made
+                cold.append(run(setup + SYNTH.format(repo=REPO) + REPORT, bank))
+            warm = min(run(setup + SYNTH.format(repo=REPO) + REPORT, bank) for _ in range(REPEATS))
+            print(f"{game:>15} {old * 1000:7.1f} ms {min(cold) * 1000:7.1f} ms {warm * 1000:7.1f} ms "
+                  f"{old / warm:11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
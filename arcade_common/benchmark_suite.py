@@ -0,0 +1,235 @@
+# The whole arcade's benchmark: every game, run for real, to catch anything getting slower.
+# Run it with: python benchmark_suite.py                (every game, compared with the baseline)
+#          or: python benchmark_suite.py tetris pong    (just those games)
+#          or: python benchmark_suite.py --baseline     (...and make this run the new baseline)
+# Each game's own script (asteroids.py, breakout.py, ...) runs in a Python of its own with SDL's
+# "dummy" video and sound drivers, so there's no window and no noise, but all the drawing still
+# happens. ARCADE_SEED makes the random numbers the same every run, and instead of a keyboard
+# the game gets a script of key presses (SCRIPTS below), so every run plays the exact same game.
+# ARCADE_FAST_FORWARD=1 runs one tick per frame without waiting for the clock, and the frame
+# timer (frame_timer.py) splits every frame up:
+#   update - moving things and collisions (the "update" and "collision" phases)
+#   render - drawing and sending the picture to the screen (the "render" and "flip" phases)
+# Every game runs at a few sizes (WORKLOADS) using its stress mode: more asteroids, more chaos
+# balls, bigger waves of invaders, more junk on the Tetris board.
+#
+# Every run is added to HISTORY (one JSON line each) and compared with the last baseline run:
+# any p50 more than THRESHOLD slower (and by more than NOISE_MS) is a regression, and the
+# benchmark exits with 1 so a script can spot it. Times depend on the computer, so make a
+# baseline on the same machine you compare on.
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED = 2024
+WARMUP = 120       # Frames left out at the start (the sound bank, the first pictures being made...)
+FRAMES = 600       # Frames measured for every workload (10 seconds of game)
+THRESHOLD = 0.25   # 25% slower than the baseline is a regression...
+NOISE_MS = 0.05    # ...as long as it's at least this much slower too (tiny times jiggle a lot)
+TAP_EVERY = 8      # Frames between the script's key taps
+
+# game -> its script
+GAMES = {
+    "asteroids": "asteroids/asteroids.py",
+    "breakout": "breakout/breakout.py",
+    "space_invaders": "space_invaders/space_invaders.py",
+    "tetris": "tetris/tetris.py",
+    "pong": "pong_breakout/pong.py",
+}
+
+# game, what gets bigger, the stress setting that does it, sizes (0 is the normal game)
+WORKLOADS = [
+    ("asteroids", "asteroids", "ARCADE_STRESS_ASTEROIDS", [0, 100, 500]),
+    ("breakout", "chaos balls", "ARCADE_STRESS_BALLS", [0, 500, 2000]),
+    ("space_invaders", "invaders", "ARCADE_STRESS_INVADERS", [0, 100, 1000]),
+    ("tetris", "junk rows", "ARCADE_STRESS_FILL", [0, 8, 14]),
+    ("pong", "", None, [0]),
+]
+
+# The scripted player. Every game's script is a list of steps, played round and round:
+# (how many frames, the keys held down, the keys tapped every TAP_EVERY frames)
+SCRIPTS = {
+    "asteroids": [(90, [pygame.K_LEFT, pygame.K_UP], [pygame.K_SPACE]),
+                  (90, [pygame.K_RIGHT], [pygame.K_SPACE]),
+                  (30, [pygame.K_DOWN, pygame.K_r], [pygame.K_h])],
+    "breakout": [(100, [pygame.K_LEFT], [pygame.K_SPACE]),
+                 (100, [pygame.K_RIGHT], [pygame.K_SPACE, pygame.K_r])],
+    "space_invaders": [(80, [pygame.K_LEFT], [pygame.K_SPACE]),
+                       (80, [pygame.K_RIGHT], [pygame.K_SPACE, pygame.K_r])],
+    "tetris": [(24, [], [pygame.K_LEFT, pygame.K_LEFT, pygame.K_UP]),
+               (24, [], [pygame.K_RIGHT, pygame.K_SPACE]),
+               (24, [], [pygame.K_UP, pygame.K_RIGHT, pygame.K_RIGHT, pygame.K_RIGHT, pygame.K_SPACE]),
+               (24, [pygame.K_DOWN], [pygame.K_LEFT])],
+    "pong": [(40, [pygame.K_w], []), (50, [pygame.K_s], []), (20, [], [])],
+}
+
+
+def history_path():
+    # Where the history lives. Set ARCADE_BENCHMARK_HISTORY to put it somewhere else.
+    if "ARCADE_BENCHMARK_HISTORY" in os.environ:
+        return os.environ["ARCADE_BENCHMARK_HISTORY"]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "arcade_arcadia", "benchmark_history.jsonl")
+
+
+class ScriptedKeys:
+    # Stands in for the keyboard: pygame.event.get() and pygame.key.get_pressed() play the script
+    def __init__(self, script):
+        self.steps = []  # One (held, tapped) for every frame of one time round the script
+        for frames, held, tapped in script:
+            self.steps += [(set(held), tapped if frame % TAP_EVERY == 0 else []) for frame in range(frames)]
+        self.frame = 0
+        self.held = set()
+        self.get_events = pygame.event.get
+
+    def get(self, *args, **kwargs):
+        # The game reads its events once a frame, so this is where the script moves on
+        events = self.get_events(*args, **kwargs)
+        self.held, tapped = self.steps[self.frame % len(self.steps)]
+        self.frame += 1
+        return events + [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0) for key in tapped]
+
+    def get_pressed(self):
+        return self
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+def play(game):
+    # (In the game's own Python) run the game's script with the scripted keys
+    keys = ScriptedKeys(SCRIPTS[game])
+    pygame.event.get = keys.get
+    pygame.key.get_pressed = keys.get_pressed
+    path = os.path.join(ROOT, GAMES[game])
+    sys.path.insert(0, os.path.dirname(path))  # So it finds the modules next to it, like "python asteroids.py" does
+    sys.argv = [path]
+    runpy.run_path(path, run_name="__main__")
+
+
+def percentile(values, p):
+    # values must be sorted
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def measure(game, setting, size, folder):
+    # Run one workload and sum up its frames (in milliseconds)
+    frames_file = os.path.join(folder, f"{game}-{size}.jsonl")
+    env = dict(os.environ, ARCADE_SEED=str(SEED), ARCADE_FAST_FORWARD="1", ARCADE_MAX_TICKS=str(WARMUP + FRAMES),
+               ARCADE_PROFILE="1", ARCADE_PROFILE_FILE=frames_file, ARCADE_REPLAY_DIR=folder,
+               SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    if setting:
+        env[setting] = str(size)
+    run = subprocess.run([sys.executable, os.path.abspath(__file__), "--play", game], env=env,
+                         capture_output=True, text=True)
+    if run.returncode:
+        raise RuntimeError(f"{game} ({setting}={size}) crashed:\n{run.stderr}")
+    with open(frames_file) as f:
+        frames = [json.loads(line) for line in f][WARMUP:]
+    update = sorted(frame.get("update", 0) + frame.get("collision", 0) for frame in frames)
+    render = sorted(frame.get("render", 0) + frame.get("flip", 0) for frame in frames)
+    result = {"frames": len(frames),
+              "update_p50": percentile(update, 50), "update_p99": percentile(update, 99),
+              "update_mean": sum(update) / len(update),
+              "render_p50": percentile(render, 50), "render_p99": percentile(render, 99),
+              "render_mean": sum(render) / len(render)}
+    # The games' own counts (asteroids, bricks, ...), averaged, to check the workload was what we asked for
+    names = {name for frame in frames for name in frame} - {"frame", "ticks", "total", "input", "wait",
+                                                            "update", "collision", "render", "flip"}
+    result["counts"] = {name: sum(frame.get(name, 0) for frame in frames) / len(frames) for name in sorted(names)}
+    return {name: round(value, 4) if isinstance(value, float) else value for name, value in result.items()}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None  # Not a git checkout (or no git) - the history just won't say which commit
+
+
+def load_history(path):
+    try:
+        with open(path) as f:
+            return [json.loads(line) for line in f if line.strip()]
+    except FileNotFoundError:
+        return []
+
+
+def regressions(results, baseline):
+    # Every (workload, "update" or "render", how much slower) that's past the THRESHOLD
+    slower = []
+    for name, result in results.items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue  # A new workload - nothing to compare with
+        for part in ("update", "render"):
+            now, then = result[f"{part}_p50"], before[f"{part}_p50"]
+            if now - then > NOISE_MS and now > then * (1 + THRESHOLD):
+                slower.append((name, part, now / then - 1 if then else float("inf")))
+    return slower
+
+
+def change(now, then):
+    return f"{now / then - 1:+7.0%}" if then else "    new"
+
+
+def main():
+    if sys.argv[1:2] == ["--play"]:
+        play(sys.argv[2])
+        return 0
+    make_baseline = "--baseline" in sys.argv
+    games = [arg for arg in sys.argv[1:] if not arg.startswith("--")] or list(GAMES)
+    for game in games:
+        if game not in GAMES:
+            sys.exit(f"Unknown game {game!r}, pick from {', '.join(GAMES)}")
+    path = history_path()
+    baseline = next((run for run in reversed(load_history(path)) if run.get("baseline")), None)
+
+    print(f"seed {SEED}, {FRAMES} frames per workload (after {WARMUP} warm-up frames), times in ms"
+          + (f", vs baseline from {baseline['time']} ({baseline['commit']})" if baseline else ", no baseline yet"))
+    print(f"{'workload':>30} {'update p50':>11} {'p99':>7} {'render p50':>11} {'p99':>7} "
+          f"{'update':>8} {'render':>8}")
+    results = {}
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as folder:
+        for game, what, setting, sizes in WORKLOADS:
+            if game not in games:
+                continue
+            for size in sizes:
+                name = f"{game}/{size}"
+                result = results[name] = measure(game, setting, size, folder)
+                before = baseline["results"].get(name) if baseline else None
+                versus = (f"{change(result['update_p50'], before['update_p50'])} "
+                          f"{change(result['render_p50'], before['render_p50'])}" if before else "")
+                label = f"{game} {size} {what}" if size else game
+                print(f"{label:>30} {result['update_p50']:11.3f} {result['update_p99']:7.3f} "
+                      f"{result['render_p50']:11.3f} {result['render_p99']:7.3f} {versus}")
+    elapsed = time.perf_counter() - start
+
+    run = {"time": time.strftime("%Y-%m-%dT%H:%M:%S"), "commit": git_commit(), "baseline": make_baseline,
+           "python": platform.python_version(), "pygame": pygame.version.ver, "machine": platform.platform(),
+           "seed": SEED, "warmup": WARMUP, "frames": FRAMES, "seconds": round(elapsed, 1), "results": results}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a") as f:
+        f.write(json.dumps(run) + "\n")
+    print(f"{len(results)} workloads in {elapsed:.1f} s, saved to {path}" + (" as the new baseline" if make_baseline else ""))
+
+    slower = regressions(results, baseline) if baseline and not make_baseline else []
+    for name, part, how_much in slower:
+        print(f"REGRESSION: {name} {part} p50 is {how_much:.0%} slower than the baseline")
+    return 1 if slower else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# How long does each game spend on its text every frame?
+# Run it with: python benchmark_text.py
+# For each game we draw the same text it shows FRAMES times, onto a surface the size of its
+# window. The counters change along the way like in a busy game (the score every half second,
+# the power-up timers every second):
+#   old     - the way the games used to do it: font.render() every frame (and a brand new
+#             Font every frame for pong)
+#   cached  - arcade_common/text.py: words from the cache, numbers put together from the
+#             digit pictures, and the finished line reused until a number changes
+# What's left in "cached" is mostly the blits themselves - the letters are never drawn again.
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from arcade_common import text
+
+FRAMES = 3000
+WHITE = (255, 255, 255)
+
+
+def asteroids_old(screen, fonts, frame):
+    font, small = fonts
+    screen.blit(font.render(f"Score: {frame // 30 * 20}  Lives: {3 - frame // 1000}", True, WHITE), (10, 10))
+    screen.blit(font.render(f"Power: Double {(600 - frame % 600) // 60}s", True, WHITE), (10, 40))
+    for i, line in enumerate(["= Double Fire", "= 500 Points", "= Extra Life"]):
+        screen.blit(small.render(line, True, WHITE), (670, 12 + i * 22))
+
+
+def asteroids_cached(screen, fonts, frame):
+    font, small = fonts
+    text.draw(screen, font, WHITE, (10, 10), "Score: ", frame // 30 * 20, "  Lives: ", 3 - frame // 1000)
+    text.draw(screen, font, WHITE, (10, 40), "Power: Double ", (600 - frame % 600) // 60, "s")
+    for i, line in enumerate(["= Double Fire", "= 500 Points", "= Extra Life"]):
+        screen.blit(text.render(small, line, WHITE), (670, 12 + i * 22))
+
+
+BREAKOUT_HUD = ["Press Space to start", "Press Enter to remove this list", "Powerups:",
+                "Extra Life", "Faster Paddle", "Wider Paddle", "Multiball Chaos", "Press Enter to remove this HUD"]
+
+
+def breakout_old(screen, fonts, frame):
+    font, = fonts
+    screen.blit(font.render(f"Lives: {3 - frame // 1000}", True, WHITE), (10, 10))
+    screen.blit(font.render(f"Faster Paddle: {(600 - frame % 600) // 60}s", True, WHITE), (10, 40))
+    screen.blit(font.render(f"Wider Paddle: {(600 - frame % 600) // 60}s", True, WHITE), (10, 70))
+    for i, line in enumerate(BREAKOUT_HUD):
+        screen.blit(font.render(line, True, WHITE), (420, 340 + i * 30))
+
+
+def breakout_cached(screen, fonts, frame):
+    font, = fonts
+    text.draw(screen, font, WHITE, (10, 10), "Lives: ", 3 - frame // 1000)
+    text.draw(screen, font, WHITE, (10, 40), "Faster Paddle: ", (600 - frame % 600) // 60, "s")
+    text.draw(screen, font, WHITE, (10, 70), "Wider Paddle: ", (600 - frame % 600) // 60, "s")
+    for i, line in enumerate(BREAKOUT_HUD):
+        screen.blit(text.render(font, line, WHITE), (420, 340 + i * 30))
+
+
+def pong_old(screen, fonts, frame):
+    font = pygame.font.Font(None, 36)  # pong.py made a new font every frame
+    screen.blit(font.render(f"Player: {frame // 300}", True, WHITE), (100, 10))
+    screen.blit(font.render(f"AI: {frame // 400}", True, WHITE), (600, 10))
+
+
+def pong_cached(screen, fonts, frame):
+    font, = fonts
+    text.draw(screen, font, WHITE, (100, 10), "Player: ", frame // 300)
+    text.draw(screen, font, WHITE, (600, 10), "AI: ", frame // 400)
+
+
+def space_invaders_old(screen, fonts, frame):
+    font, = fonts
+    screen.blit(font.render(f"Score: {frame // 30 * 15}  Level: {1 + frame // 500}", True, WHITE), (10, 10))
+
+
+def space_invaders_cached(screen, fonts, frame):
+    font, = fonts
+    text.draw(screen, font, WHITE, (10, 10), "Score: ", frame // 30 * 15, "  Level: ", 1 + frame // 500)
+
+
+GAMES = [
+    ("asteroids", (800, 600), [36, 24], asteroids_old, asteroids_cached),
+    ("breakout", (800, 600), [36], breakout_old, breakout_cached),
+    ("pong_breakout", (800, 600), [36], pong_old, pong_cached),
+    ("space_invaders", (800, 600), [36], space_invaders_old, space_invaders_cached),
+]
+
+
+def time_frames(draw, screen, fonts):
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        draw(screen, fonts, frame)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    pygame.init()
+    print(f"{'game':>15} {'old':>11} {'cached':>11} {'speedup':>8}")
+    for name, size, sizes, old, cached in GAMES:
+        screen = pygame.Surface(size)
+        fonts = [pygame.font.Font(None, points) for points in sizes]
+        text.clear()
+        old_time = time_frames(old, screen, fonts)
+        cached_time = time_frames(cached, screen, fonts)
+        print(f"{name:>15} {old_time * 1e6:8.1f} us {cached_time * 1e6:8.1f} us {old_time / cached_time:7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Where does a frame's time go? A stopwatch for every game in the arcade.
+# At 60 frames a second each frame has 16.6 ms. This splits it up into "phases" - reading
+# the keys, waiting for the next tick, moving things, checking collisions, drawing and
+# sending the picture to the screen - so we can see which one is eating it:
+#     timer = FrameTimer()
+#     while running and not loop.finished:
+#         for event in pygame.event.get():
+#             timer.handle(event)                  # F3 turns the timer on and off
+#             ...
+#         timer.mark("input")                      # Time since the last mark goes to "input"
+#         for _ in timer.wait(loop.ticks_due()):   # The loop's sleep goes to "wait"
+#             ...move everything one tick...
+#             timer.mark("update")                 # Marks add up over all the frame's ticks
+#         if loop.render:
+#             ...draw...
+#             timer.draw(screen)                   # The p50/p99 overlay (when it's on)
+#             timer.mark("render")
+#             pygame.display.flip()
+#             timer.mark("flip")
+#         timer.count("asteroids", len(game.asteroids))  # Any numbers you want to keep an eye on
+#         timer.end()                              # One frame done
+#
+#     ARCADE_PROFILE=1 python asteroids.py                     # Start with the timer on
+#     ARCADE_PROFILE_FILE=frames.jsonl python asteroids.py     # Every frame to a file (JSON lines)
+#     ARCADE_PROFILE_FILE=frames.csv ...                       # ...or a spreadsheet (CSV)
+# The file gets one line per frame while the timer is on: the frame number, how many ticks
+# it ran, its total time and each phase's time (in milliseconds), and the counts.
+#
+# When it's off, every call just checks one True/False and goes straight back, so it's
+# cheap enough to leave in every game (benchmark_frame_timer.py measures it).
+import atexit
+import csv
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+from arcade_common import text
+
+PHASES = ("input", "wait", "update", "collision", "render", "flip")  # In the order the overlay shows them
+WINDOW = 300          # How many frames the p50/p99 look back over (5 seconds at 60 fps)
+REFRESH = 30          # Frames between overlay updates (new numbers twice a second is plenty)
+TOGGLE_KEY = pygame.K_F3
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_FONT_SIZE = 18
+OVERLAY_BACKGROUND = (0, 0, 0, 170)  # See-through black, so the game still shows behind it
+
+ENABLED = os.environ.get("ARCADE_PROFILE", "0") not in ("", "0")
+OUTPUT = os.environ.get("ARCADE_PROFILE_FILE", "")
+
+
+def percentile(values, p):
+    # values must be sorted
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+class FrameTimer:
+    def __init__(self, enabled=ENABLED, path=OUTPUT):
+        self.path = path
+        self.file = self.writer = None
+        self.frames = 0                  # Frames timed so far
+        self.history = {}                # "total" or a phase -> its last WINDOW frames (seconds)
+        self.overlay = None              # The overlay picture, remade every REFRESH frames
+        self.font = None
+        self.enabled = False
+        if enabled:
+            self.toggle()
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.times = {}   # This frame's phases so far
+        self.counts = {}  # ...and counts
+        self.ticks = 0
+        self.start = self.last = time.perf_counter()
+        if self.enabled and self.path and self.file is None:
+            self.file = open(self.path, "w", newline="")
+            atexit.register(self.close)  # The last lines get written even if the game forgets
+        if not self.enabled:
+            self.overlay = None
+
+    def handle(self, event):
+        # Give it every event: the TOGGLE_KEY turns the timer on and off
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.toggle()
+
+    def mark(self, phase):
+        # Everything since the last mark was this phase
+        if self.enabled:
+            now = time.perf_counter()
+            self.times[phase] = self.times.get(phase, 0.0) + now - self.last
+            self.last = now
+
+    def wait(self, ticks):
+        # Wrap loop.ticks_due() in this: its sleep counts as "wait", not as the next phase
+        if self.enabled:
+            self.mark("wait")
+            self.ticks += len(ticks)
+        return ticks
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counts[name] = value
+
+    def end(self):
+        # The frame's over: keep its times, write them out and start the next one
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        times = self.times
+        times["total"] = now - self.start
+        for phase, seconds in times.items():
+            history = self.history.get(phase)
+            if history is None:
+                history = self.history[phase] = deque(maxlen=WINDOW)
+            history.append(seconds)
+        if self.file:
+            self.write(times)
+        self.frames += 1
+        if self.overlay is None or self.frames % REFRESH == 0:
+            self.overlay = self.make_overlay()
+        self.times, self.counts, self.ticks = {}, {}, 0
+        self.start = self.last = time.perf_counter()  # (Writing the line isn't part of the next frame)
+
+    def write(self, times):
+        record = {"frame": self.frames, "ticks": self.ticks}
+        record.update((phase, round(seconds * 1000, 4)) for phase, seconds in times.items())
+        record.update(self.counts)
+        if self.path.endswith(".csv"):
+            if self.writer is None:
+                # The columns are whatever the first frame had, plus every phase (a phase that
+                # doesn't happen in a frame is left empty)
+                columns = ["frame", "ticks", "total", *PHASES]
+                columns += [name for name in record if name not in columns]
+                self.writer = csv.DictWriter(self.file, columns, extrasaction="ignore")
+                self.writer.writeheader()
+            self.writer.writerow(record)
+        else:
+            self.file.write(json.dumps(record) + "\n")
+
+    def make_overlay(self):
+        # A little table: p50 and p99 of every phase over the last WINDOW frames, and the counts
+        if self.font is None:
+            self.font = text.font(OVERLAY_FONT_SIZE)
+        rows = [("ms", "p50", "p99")]
+        for phase in ("total", *PHASES, *sorted(set(self.history) - set(PHASES) - {"total"})):
+            history = self.history.get(phase)
+            if history:
+                values = sorted(history)
+                rows.append((phase, f"{percentile(values, 50) * 1000:.2f}", f"{percentile(values, 99) * 1000:.2f}"))
+        rows += [(name, str(value), "") for name, value in self.counts.items()]
+        # Every cell is its own little picture, so the numbers can line up on the right
+        cells = [[self.font.render(cell, True, OVERLAY_COLOR) for cell in row] for row in rows]
+        widths = [max(row[column].get_width() for row in cells) for column in range(3)]
+        line_height = self.font.get_linesize()
+        overlay = pygame.Surface((sum(widths) + 30, len(rows) * line_height + 10), pygame.SRCALPHA)
+        overlay.fill(OVERLAY_BACKGROUND)
+        for i, (name, p50, p99) in enumerate(cells):
+            y = 5 + i * line_height
+            overlay.blit(name, (5, y))
+            overlay.blit(p50, (15 + widths[0] + widths[1] - p50.get_width(), y))
+            overlay.blit(p99, (25 + sum(widths) - p99.get_width(), y))
+        return overlay
+
+    def draw(self, screen, pos=None):
+        # Put the overlay on the screen (bottom left unless you say where). Returns the
+        # rectangle it covered, or None when the timer's off.
+        if self.enabled and self.overlay:
+            if pos is None:
+                pos = (0, screen.get_height() - self.overlay.get_height())
+            return screen.blit(self.overlay, pos)
+        return None
+
+    def close(self):
+        # Finish the file (a game calls this when it ends, so the launcher can start it again)
+        if self.file:
+            self.file.close()
+            self.file = self.writer = None
+            atexit.unregister(self.close)
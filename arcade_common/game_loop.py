@@ -0,0 +1,89 @@
+# One game loop for every game in the arcade, with a "fixed timestep".
+# The games used to move everything once per frame and then wait with clock.tick(60). That
+# ties the game's speed to drawing: if a frame takes too long to draw, the whole game slows
+# down, and it can never go faster than 60 moves a second either.
+# Now the game moves in ticks - always exactly TICK_RATE ticks for every second of real time -
+# and drawing just shows wherever the game has got to:
+#     loop = GameLoop()
+#     while running and not loop.finished:
+#         ...handle events...
+#         for _ in loop.ticks_due():   # 0, 1 or a few ticks, whatever real time says is due
+#             ...move everything one tick...
+#         if loop.render:
+#             ...draw and flip...
+# When drawing is slow, a frame simply runs a couple of ticks before it draws (a dropped
+# frame), so the game itself never slows down or skips a tick.
+#
+# It can also run faster than real time, which is handy for testing and for bots:
+#     ARCADE_FAST_FORWARD=10 python breakout.py   # 10 ticks per frame, as fast as it can go
+#     ARCADE_HEADLESS=1 python breakout.py         # No window at all, just the game running
+#     ARCADE_MAX_TICKS=36000 ...                   # Stop after this many ticks (10 minutes of game)
+#     ARCADE_SEED=1 ...                            # The same random numbers every run (same game)
+import os
+import time
+
+TICK_RATE = 60             # Game ticks per second of real time
+MAX_TICKS_PER_FRAME = 10   # If the computer falls further behind than this, let the game slow down instead of freezing to catch up
+
+FAST_FORWARD = int(os.environ.get("ARCADE_FAST_FORWARD") or 0)   # Ticks per frame, 0 means real time
+HEADLESS = os.environ.get("ARCADE_HEADLESS", "0") not in ("", "0")
+MAX_TICKS = int(os.environ.get("ARCADE_MAX_TICKS") or 0)         # 0 means keep going until the window is closed
+SEED = int(os.environ["ARCADE_SEED"]) if os.environ.get("ARCADE_SEED") else None  # The games pass this to their random numbers
+
+if HEADLESS:
+    # No screen and no speakers: SDL's "dummy" drivers pretend to be them. This has to
+    # happen before pygame starts, so the games import this before pygame.init().
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+class GameLoop:
+    latest_start = None  # When the newest loop began its first frame (the launcher times switching games with it)
+
+    def __init__(self, tick_rate=TICK_RATE, fast_forward=FAST_FORWARD, headless=HEADLESS, max_ticks=MAX_TICKS):
+        self.tick_time = 1 / tick_rate  # Seconds per tick
+        self.fast_forward = fast_forward
+        self.headless = headless
+        self.max_ticks = max_ticks
+        self.render = not headless      # Should the game draw this frame?
+        self.ticks = 0                  # Ticks run so far
+        self.frames = 0                 # Frames so far
+        self.dropped = 0                # Ticks that didn't get a frame of their own
+        self.lag = 0.0                  # Real time the game hasn't caught up with yet
+        self.start = self.last = None
+
+    @property
+    def finished(self):
+        return 0 < self.max_ticks <= self.ticks
+
+    def ticks_due(self):
+        # How many ticks to run before drawing the next frame (use it as: for _ in loop.ticks_due())
+        now = time.perf_counter()
+        if self.start is None:
+            self.start = self.last = now
+            self.lag = self.tick_time  # The very first frame gets one tick
+            GameLoop.latest_start = now
+        if self.fast_forward or self.headless:
+            due = max(1, self.fast_forward)  # Don't wait for the clock at all
+        else:
+            if self.lag + now - self.last < self.tick_time:
+                # Ahead of time - sleep until the next tick is due (this is what clock.tick did)
+                time.sleep(self.tick_time - self.lag - (now - self.last))
+                now = time.perf_counter()
+            self.lag = min(self.lag + now - self.last, MAX_TICKS_PER_FRAME * self.tick_time)
+            due = int(self.lag / self.tick_time)
+            self.lag -= due * self.tick_time
+        self.last = now
+        if self.max_ticks:
+            due = min(due, self.max_ticks - self.ticks)
+        self.ticks += due
+        self.frames += 1
+        self.dropped += max(0, due - 1)
+        if self.finished and (self.fast_forward or self.headless):
+            print(self.summary())
+        return range(due)
+
+    def summary(self):
+        seconds = time.perf_counter() - self.start
+        return (f"{self.ticks} ticks ({self.ticks * self.tick_time:.0f} s of game) in {seconds:.2f} s: "
+                f"{self.ticks / seconds:,.0f} ticks/sec, {self.frames} frames")
@@ -0,0 +1,170 @@
+# The arcade cabinet: one menu for every game, all in one Python.
+# Run it with: python launcher.py
+# Up and down pick a game, Enter plays it, and Esc in a game comes back here (Esc here quits).
+#
+# Running each game on its own means starting Python again every time - importing everything,
+# opening a window, getting the sound going - about a second before you can play. The
+# launcher does all that once: it owns the one window and the one mixer, and each game's
+# main() draws into that window and plays through that mixer.
+# Importing a game's file doesn't start it (everything happens in its main()), so the games
+# are loaded lazily: while the menu sits there, a background thread warms things up -
+# opens the sound bank (arcade_common/synth.py), reads the list of the computer's fonts and
+# imports every game - so picking one only has to call its main().
+#
+# Two games can have files with the same name (asteroids and space_invaders both have a
+# simulation.py, tetris and pong_breakout both have an engine.py), and Python only keeps one
+# module per name. So each game's own modules are put away when it's not playing, and put
+# back when it is (see use_folder()).
+#
+# When a game ends, anything still playing is stopped, and its main() is over, so its
+# pictures and sounds go with it. The shared things (fonts and their text pictures in
+# arcade_common/text.py, the sound bank) are made once and stay - benchmark_launcher.py
+# checks that switching games again and again doesn't make the memory grow.
+import importlib
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # So we can find arcade_common
+from arcade_common.game_loop import GameLoop  # (Importing it first lets ARCADE_HEADLESS pick the dummy drivers)
+import pygame
+
+from arcade_common import synth
+from arcade_common import text
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WIDTH, HEIGHT = 800, 600
+WHITE = (255, 255, 255)
+GRAY = (128, 128, 128)
+YELLOW = (255, 255, 0)
+BLACK = (0, 0, 0)
+
+# name on the menu, the game's folder, its file (without .py)
+GAMES = [
+    ("Asteroids", "asteroids", "asteroids"),
+    ("Breakout", "breakout", "breakout"),
+    ("Space Invaders", "space_invaders", "space_invaders"),
+    ("Tetris", "tetris", "tetris"),
+    ("Pong + Breakout", "pong_breakout", "pong"),
+]
+FOLDERS = [os.path.join(ROOT, folder) for name, folder, module in GAMES]
+
+
+def module_folder(module):
+    # The game folder a module's file is in (None if it's not one of the games')
+    path = getattr(module, "__file__", None)
+    folder = os.path.dirname(os.path.abspath(path)) if path else None
+    return folder if folder in FOLDERS else None
+
+
+class Launcher:
+    def __init__(self):
+        pygame.init()
+        pygame.mixer.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Arcade Arcadia")
+        self.parked = {folder: {} for folder in FOLDERS}  # folder -> its modules, while another game has the names
+        self.folder = None    # The game folder whose modules are in sys.modules right now
+        self.games = {}       # file name -> the imported game
+        self.switch_time = 0.0  # How long the last switch took, up to the game's first frame (the menu shows it)
+        self.warm_up = threading.Thread(target=self.warm, daemon=True)
+        self.warm_up.start()
+
+    def use_folder(self, folder):
+        # Park the modules of whichever game was loaded last, and bring this game's back
+        if folder == self.folder:
+            return
+        for name, module in list(sys.modules.items()):
+            home = module_folder(module)
+            if home is not None and home != folder:
+                self.parked[home][name] = sys.modules.pop(name)
+        sys.modules.update(self.parked[folder])
+        self.parked[folder].clear()
+        for other in FOLDERS:  # Its folder first, so "import engine" finds its own engine.py
+            while other in sys.path:
+                sys.path.remove(other)
+        sys.path.insert(0, folder)
+        self.folder = folder
+
+    def load(self, folder, module):
+        # Import a game (just the first time - after that it's already there)
+        if module not in self.games:
+            self.use_folder(os.path.join(ROOT, folder))
+            self.games[module] = importlib.import_module(module)
+        return self.games[module]
+
+    def warm(self):
+        # (In the background, while the menu is up) everything a game would otherwise do first.
+        # The menu never imports anything, so this thread has sys.modules to itself.
+        synth.bank()              # Open the sound bank and read its index
+        pygame.sysfont.get_fonts()  # The computer's font list (SysFont needs it - it can be slow)
+        for name, folder, module in GAMES:
+            self.load(folder, module)
+
+    def play(self, folder, module):
+        # Switch to a game, play it until it's closed, and come back to the menu
+        start = time.perf_counter()
+        self.warm_up.join()  # (Usually long finished - if not, it was doing this game's work anyway)
+        game = self.load(folder, module)
+        self.use_folder(os.path.join(ROOT, folder))
+        game.main()  # It sets the window to its own size and title, and returns when you press Esc
+        # (Its setup - window, sounds, pictures - counts too: the switch is over at its first frame)
+        if GameLoop.latest_start is not None and GameLoop.latest_start > start:
+            self.switch_time = GameLoop.latest_start - start
+        pygame.mixer.stop()  # Stop its sounds and music (so nothing is still using them)
+        pygame.mixer.music.stop()
+        pygame.mixer.music.unload()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("Arcade Arcadia")
+        pygame.event.clear()  # Forget the Esc that closed the game, so the menu doesn't quit too
+
+    def draw_menu(self, choice):
+        font, small = text.font(48), text.font(24)
+        self.screen.fill(BLACK)
+        title = text.render(font, "Arcade Arcadia", YELLOW)
+        self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 80))
+        for i, (name, folder, module) in enumerate(GAMES):
+            label = text.render(font, ("> " if i == choice else "  ") + name, WHITE if i == choice else GRAY)
+            self.screen.blit(label, (WIDTH // 2 - 160, 200 + i * 60))
+        if self.warm_up.is_alive():
+            status = text.render(small, "Warming up...", GRAY)
+        else:
+            status = text.line(small, GRAY, "Ready - last switch ", round(self.switch_time * 1000), " ms to the first frame")
+        self.screen.blit(status, (10, HEIGHT - 30))
+        hint = text.render(small, "Up/Down to pick, Enter to play, Esc to go back (or quit)", GRAY)
+        self.screen.blit(hint, (WIDTH - hint.get_width() - 10, HEIGHT - 30))
+        pygame.display.flip()
+
+    def run(self):
+        loop = GameLoop()
+        choice = 0
+        running = True
+        while running and not loop.finished:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_UP:
+                        choice = (choice - 1) % len(GAMES)
+                    elif event.key == pygame.K_DOWN:
+                        choice = (choice + 1) % len(GAMES)
+                    elif event.key == pygame.K_RETURN:
+                        name, folder, module = GAMES[choice]
+                        self.play(folder, module)
+                        loop = GameLoop()  # Start the clock again (the game's time isn't the menu's)
+            for _ in loop.ticks_due():
+                pass  # The menu doesn't move - this just keeps it at 60 frames a second
+            if loop.render:
+                self.draw_menu(choice)
+
+
+def main():
+    Launcher().run()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# One little sound maker for every game in the arcade - no sound files needed!
+# Each game used to have its own beep function. Some built the sound one sample at a time in
+# a Python loop, which is slow. Here a whole sound is made in one go with NumPy:
+#     shoot_sound = synth.tone(800, 0.1)                  # A square wave beep (the classic!)
+#     land_sound = synth.tone(261, 0.2, wave="sine")      # A smooth sine wave tone
+#     boom = synth.tone(200, 0.3, attack=0.01, release=0.2)  # Fade in and out (an "envelope")
+#
+# Even NumPy takes a moment, so every sound we make is also saved in a "sound bank" file
+# (in your cache folder, see bank_path()). Each sound is stored under a fingerprint: its
+# settings written out as text - same settings, same fingerprint - so the next time any game
+# asks for that sound it is read straight out of the file and nothing has to be made again.
+# The file is memory-mapped, which means the computer lets us use it as if it was already
+# in memory, and only the parts we actually use get read from the disk.
+import mmap
+import os
+import struct
+
+import pygame
+
+try:
+    import fcntl  # File locks, so two games saving sounds at once take turns
+except ImportError:
+    fcntl = None  # (Not on Windows - there the games just don't take turns)
+
+MAGIC = b"ARCSND1\n"           # The first bytes of a sound bank file, so we know it's ours
+RECORD = struct.Struct("<HI")  # Before each sound: how long its fingerprint is, and how many bytes of sound
+WAVES = ("square", "sine")
+
+
+def bank_path():
+    # Where the sound bank lives. Set ARCADE_SOUND_BANK to put it somewhere else.
+    if "ARCADE_SOUND_BANK" in os.environ:
+        return os.environ["ARCADE_SOUND_BANK"]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "arcade_arcadia", "sounds.bank")
+
+
+def render(wave, frequency, duration, volume=1.0, attack=0.0, release=0.0, sample_rate=44100):
+    # Make the sound as NumPy numbers between -1 and 1 (one number per sample)
+    import numpy as np  # Only needed when a sound isn't in the bank yet
+    if wave not in WAVES:
+        raise ValueError(f"Unknown wave {wave!r}, pick one of {WAVES}")
+    samples = int(sample_rate * duration)
+    i = np.arange(samples)
+    if wave == "square":
+        # High for the second half of every wave, low for the first half
+        audio = np.where(i * frequency % sample_rate > sample_rate // 2, 1.0, -1.0)
+    else:
+        audio = np.sin(2 * np.pi * frequency * i / sample_rate)
+    # The envelope: ramp up over `attack` seconds at the start, down over `release` at the end
+    level = np.ones(samples)
+    if attack > 0:
+        level = np.minimum(level, i / (attack * sample_rate))
+    if release > 0:
+        level = np.minimum(level, (samples - i) / (release * sample_rate))
+    return audio * level * volume
+
+
+def to_pcm(audio, size, channels):
+    # Turn numbers between -1 and 1 into the raw bytes the mixer plays
+    import numpy as np
+    if size == 8:      # 8-bit, 0 to 255 with 128 in the middle
+        pcm = (audio * 127 + 128).astype(np.uint8)
+    elif size == -8:   # 8-bit, -128 to 127
+        pcm = (audio * 127).astype(np.int8)
+    elif size == 16:   # 16-bit, 0 to 65535
+        pcm = (audio * 32767 + 32768).astype(np.uint16)
+    else:              # 16-bit, -32768 to 32767 (what pygame uses unless you ask for something else)
+        pcm = (audio * 32767).astype(np.int16)
+    return np.repeat(pcm, channels).tobytes()  # Left, right, left, right... for stereo
+
+
+class SoundBank:
+    # The sound bank file: MAGIC, then for each sound a RECORD header followed by its bytes
+    def __init__(self, path):
+        self.path = path
+        self.index = {}     # fingerprint -> the sound's bytes, straight out of the file
+        self.added = {}     # Sounds made this time (they're not in the memory-mapped file yet)
+        self.file = None
+        self.map = None
+        self.end = 0        # Where the last whole sound we know of ends (0: no bank yet)
+        self.load()
+
+    def load(self):
+        try:
+            self.file = open(self.path, "rb")
+        except OSError:
+            return  # No bank yet (or we can't read it) - we'll make sounds as we need them
+        if os.fstat(self.file.fileno()).st_size < len(MAGIC):
+            return
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            return  # Not a sound bank - ignore it (add() starts a new one over it)
+        view = memoryview(self.map)
+        offset = self.end = len(MAGIC)
+        while offset + RECORD.size <= len(self.map):
+            key_length, length = RECORD.unpack_from(self.map, offset)
+            start = offset + RECORD.size + key_length
+            if start + length > len(self.map):
+                break  # A sound that was only half written - skip it, it'll be made again
+            key = self.map[start - key_length:start]
+            self.index[key] = view[start:start + length]  # No copying - it stays in the file
+            offset = self.end = start + length
+
+    def get(self, key):
+        pcm = self.index.get(key)
+        return pcm if pcm is not None else self.added.get(key)
+
+    def add(self, key, pcm):
+        self.added[key] = pcm
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644), "r+b") as bank:
+                # Other games can have the bank open (and memory-mapped) too, so: one at a time
+                # (the lock goes when the file's closed), and never cut off a sound someone else
+                # might be reading - only a half-written one, which nobody has read.
+                if fcntl:
+                    fcntl.flock(bank, fcntl.LOCK_EX)
+                if bank.read(len(MAGIC)) != MAGIC:
+                    # No bank yet, or a file that isn't one (no one has read sounds from it): start it afresh
+                    bank.seek(0)
+                    bank.write(MAGIC)
+                    bank.truncate()
+                    self.end = 0
+                end = self.end or len(MAGIC)
+                size = os.fstat(bank.fileno()).st_size
+                while end + RECORD.size <= size:  # Skip the sounds other games saved since we opened it
+                    bank.seek(end)
+                    key_length, length = RECORD.unpack(bank.read(RECORD.size))
+                    if end + RECORD.size + key_length + length > size:
+                        break
+                    end += RECORD.size + key_length + length
+                if end < size:
+                    bank.truncate(end)  # A sound that was only half written (that game was stopped halfway)
+                bank.seek(end)
+                bank.write(RECORD.pack(len(key), len(pcm)) + key + pcm)
+                self.end = end + RECORD.size + len(key) + len(pcm)
+        except OSError:
+            pass  # Can't save it? No problem, the sound still works - it just gets made next time
+
+
+_bank = None
+
+
+def bank():
+    # The sound bank everyone shares, opened the first time a sound is asked for
+    global _bank
+    if _bank is None:
+        _bank = SoundBank(bank_path())
+    return _bank
+
+
+def tone(frequency, duration, wave="square", volume=1.0, attack=0.0, release=0.0):
+    # Get a pygame Sound for these settings - from the bank if it's there, made fresh if not.
+    # duration, attack and release are in seconds.
+    sample_rate, size, channels = pygame.mixer.get_init()  # Match the mixer, or it plays at the wrong pitch
+    settings = (wave, frequency, duration, volume, attack, release, sample_rate, size, channels)
+    key = repr(settings).encode()  # The sound's fingerprint: exactly what it's made from
+    sounds = bank()
+    pcm = sounds.get(key)
+    if pcm is None:
+        pcm = to_pcm(render(wave, frequency, duration, volume, attack, release, sample_rate), size, channels)
+        sounds.add(key, pcm)
+    return pygame.mixer.Sound(buffer=pcm)
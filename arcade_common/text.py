@@ -0,0 +1,112 @@
+# Text for every game in the arcade, drawn once and then reused.
+# font.render() turns letters into a picture, and that's slow-ish work - but the games were
+# doing it every single frame for words that hardly ever change ("Powerups:", "Lives: 3"...).
+# Now each picture is made once and kept:
+#     screen.blit(text.render(font, "Press R to Restart", WHITE), (10, 10))
+# Only the most recently used CACHE_SIZE pictures are kept, so text that changes a lot (like
+# a score) can't fill up the memory - the one used longest ago is thrown away first (that's
+# called "LRU", least recently used).
+#
+# Numbers change all the time, so drawing all the letters again for every new score would
+# still be slow. Instead each digit is drawn just once (a "glyph atlas" - a set of little
+# letter pictures), and a number is put together from them:
+#     text.draw(screen, font, WHITE, (10, 10), "Score: ", score, "  Lives: ", lives)
+# Words come from the cache and numbers from the digits, and the finished line is cached
+# as well - so a frame where the score didn't change is just one blit.
+#
+# The pictures are kept per font, so the games get their fonts from here too:
+#     font = text.font(36)                 # pygame.font.Font(None, 36), made only once
+#     font = text.sysfont("Arial", 24)     # pygame.font.SysFont("Arial", 24), made only once
+# Playing a game again (in the arcade launcher) gets the very same font back, and with it all
+# the text pictures it made last time - instead of a new font and a new pile of pictures.
+from collections import OrderedDict
+
+import pygame
+
+CACHE_SIZE = 256  # How many pictures of text to keep
+DIGITS = "0123456789-"
+
+_cache = OrderedDict()  # (font, text or parts, color, antialias) -> picture, oldest first
+_atlases = {}           # (font, color, antialias) -> {digit: picture}
+_fonts = {}             # (name, size, from the system's fonts?) -> font
+
+
+def font(size, name=None):
+    # A font file (None is pygame's own font), shared by everyone who asks for it
+    key = (name, size, False)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.Font(name, size)
+    return _fonts[key]
+
+
+def sysfont(name, size):
+    # One of the computer's installed fonts by name (pygame picks another if it's not there)
+    key = (name, size, True)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.SysFont(name, size)
+    return _fonts[key]
+
+
+def render(font, text, color, antialias=True):
+    # Like font.render(text, antialias, color), but only the first time
+    key = (font, text, color, antialias)
+    surface = _cache.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color)
+        _cache[key] = surface
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)  # Forget the one used longest ago
+    else:
+        _cache.move_to_end(key)  # Just used, so it's the newest now
+    return surface
+
+
+def digits(font, color, antialias=True):
+    # The little picture of every digit (and the minus sign) in this font and color
+    key = (font, color, antialias)
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = {char: font.render(char, antialias, color) for char in DIGITS}
+    return atlas
+
+
+def line(font, color, *parts, antialias=True):
+    # A picture of words (str) and numbers (int) one after the other. The words come from the
+    # cache and the numbers are put together from the digit pictures, so a new score is a
+    # few little copies instead of drawing all the letters again. The finished line is
+    # cached too, so while the score stays the same it's ready to go.
+    key = (font, parts, color, antialias)
+    picture = _cache.get(key)
+    if picture is not None:
+        _cache.move_to_end(key)
+        return picture
+    pieces = []
+    for part in parts:
+        if isinstance(part, str):
+            pieces.append(render(font, part, color, antialias))
+        else:
+            atlas = digits(font, color, antialias)
+            pieces.extend(atlas[char] for char in str(part))
+    picture = pygame.Surface((sum(piece.get_width() for piece in pieces), font.get_height()), pygame.SRCALPHA)
+    x = 0
+    for piece in pieces:
+        # BLEND_RGBA_MAX copies the letter exactly (a normal blit would blend it with the
+        # see-through background and darken its soft edges)
+        picture.blit(piece, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        x += piece.get_width()
+    _cache[key] = picture
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return picture
+
+
+def draw(surface, font, color, pos, *parts, antialias=True):
+    # Draw a line() at pos. Returns the rectangle it covered.
+    return surface.blit(line(font, color, *parts, antialias=antialias), pos)
+
+
+def clear():
+    # Forget everything (for example when the fonts are being replaced, or pygame was shut down)
+    _cache.clear()
+    _atlases.clear()
+    _fonts.clear()
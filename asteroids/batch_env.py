@@ -0,0 +1,300 @@
+# Lots of Asteroids games at once, all moved forward together by NumPy!
+# simulation.py runs ONE game per AsteroidsGame. For training bots we want hundreds of games
+# going side by side, and stepping them one at a time in Python gets slow. Here every piece
+# of game state is a table with one row per game:
+#     ship_x[g]         - where game g's ship is
+#     asteroid_x[g, i]  - where asteroid slot i of game g is
+#     asteroid_alive[g, i] - is there really an asteroid in that slot?
+# Each game has a fixed number of slots for asteroids, bullets and power-ups ("padded"
+# tables). Empty slots are just switched off in the alive table. If a game ever runs out of
+# slots, the extra asteroid/bullet/power-up simply doesn't appear.
+#
+# The rules are the same as simulation.py (splitting when size > 20, 20/50/100 points,
+# hyperspace cooldown, power-up drops...) with one small difference: when two bullets hit
+# the same asteroid on the same tick, the lower numbered bullet gets it and the other one
+# keeps flying.
+#
+# Try it:
+#     games = BatchAsteroids(256, seed=1)
+#     actions = np.zeros((256, len(ACTION_FIELDS)), dtype=bool)  # One row of buttons per game
+#     rewards = games.step(actions)                                 # Points each game scored
+import numpy as np
+
+from simulation import (Action, WIDTH, HEIGHT, DIRECTIONS, ship_max_speed,
+                        ship_acceleration, ship_rotation_speed, bullet_speed, base_shoot_cooldown,
+                        powerup_size, powerup_speed, powerup_duration, min_asteroids,
+                        spawn_interval, hyperspace_max_cooldown)
+
+# The buttons in each row of the actions table, in the same order as simulation.Action
+ACTION_FIELDS = Action._fields
+LEFT, RIGHT, THRUST, BRAKE, SHOOT, HYPERSPACE, RESTART = range(len(ACTION_FIELDS))
+
+# The direction table from simulation.py, split into two NumPy arrays we can index with arrays
+DIRECTION_X = np.array([dx for dx, dy in DIRECTIONS])
+DIRECTION_Y = np.array([dy for dx, dy in DIRECTIONS])
+
+
+def allocate(alive, games):
+    # Find empty slots for new things. `games` says which game each new thing belongs to
+    # (sorted, so all of game 0's things come first). Returns which of the new things fit,
+    # and the slot each of those goes into.
+    order = np.argsort(alive, axis=1, kind="stable")  # Empty slots (False) first, in order
+    free = alive.shape[1] - np.count_nonzero(alive, axis=1)  # How many empty slots each game has
+    # Number the new things inside each game: 0, 1, 2... so thing k takes the k-th empty slot
+    rank = np.arange(len(games)) - np.searchsorted(games, games)
+    fits = rank < free[games]
+    return fits, order[games[fits], rank[fits]]
+
+
+def wrap(values, size):
+    # Same as values % size for things that moved less than one screen this frame, but a lot
+    # quicker on big arrays: only the few that went off an edge get a screen added or taken away
+    values[values < 0] += size
+    values[values >= size] -= size
+    return values
+
+
+class BatchAsteroids:
+    def __init__(self, num_games, max_asteroids=32, max_bullets=32, max_powerups=16, seed=None):
+        self.num_games = num_games
+        self.rng = np.random.default_rng(seed)  # One random number maker shared by every game
+        shape_a = (num_games, max_asteroids)
+        shape_b = (num_games, max_bullets)
+        shape_p = (num_games, max_powerups)
+        # The ships - one of each per game
+        self.ship_x = np.zeros(num_games)
+        self.ship_y = np.zeros(num_games)
+        self.ship_angle = np.zeros(num_games, dtype=np.int64)
+        self.ship_speed = np.zeros(num_games)
+        # Timers, score and lives
+        self.shoot_cooldown = np.zeros(num_games, dtype=np.int64)
+        self.hyperspace_cooldown = np.zeros(num_games, dtype=np.int64)
+        self.powerup_timer = np.zeros(num_games, dtype=np.int64)
+        self.double_fire_active = np.zeros(num_games, dtype=bool)
+        self.spawn_timer = np.zeros(num_games, dtype=np.int64)
+        self.score = np.zeros(num_games, dtype=np.int64)
+        self.lives = np.zeros(num_games, dtype=np.int64)
+        self.ticks = np.zeros(num_games, dtype=np.int64)
+        # Asteroid slots
+        self.asteroid_x = np.zeros(shape_a)
+        self.asteroid_y = np.zeros(shape_a)
+        self.asteroid_vx = np.zeros(shape_a)
+        self.asteroid_vy = np.zeros(shape_a)
+        self.asteroid_size = np.zeros(shape_a)
+        self.asteroid_alive = np.zeros(shape_a, dtype=bool)
+        # Bullet slots
+        self.bullet_x = np.zeros(shape_b)
+        self.bullet_y = np.zeros(shape_b)
+        self.bullet_vx = np.zeros(shape_b)
+        self.bullet_vy = np.zeros(shape_b)
+        self.bullet_alive = np.zeros(shape_b, dtype=bool)
+        # Power-up slots (they all fall at powerup_speed, so they don't need a speed table)
+        self.powerup_x = np.zeros(shape_p)
+        self.powerup_y = np.zeros(shape_p)
+        self.powerup_kind = np.zeros(shape_p, dtype=np.int64)
+        self.powerup_alive = np.zeros(shape_p, dtype=bool)
+        self.reset(np.ones(num_games, dtype=bool))
+
+    def reset(self, games):
+        # Start brand new games in every row where `games` is True
+        self.ship_x[games] = WIDTH // 2
+        self.ship_y[games] = HEIGHT // 2
+        self.ship_angle[games] = 0
+        self.ship_speed[games] = 0
+        for timer in (self.shoot_cooldown, self.hyperspace_cooldown, self.powerup_timer,
+                      self.spawn_timer, self.score, self.ticks):
+            timer[games] = 0
+        self.double_fire_active[games] = False
+        self.lives[games] = 3
+        self.asteroid_alive[games] = False
+        self.bullet_alive[games] = False
+        self.powerup_alive[games] = False
+        # 4 big asteroids at random spots with random speeds
+        rows = np.repeat(np.flatnonzero(games), 4)
+        slots = np.tile(np.arange(4), len(rows) // 4)
+        self.add_asteroids(rows, slots,
+                           self.rng.integers(0, WIDTH, len(rows), endpoint=True),
+                           self.rng.integers(0, HEIGHT, len(rows), endpoint=True),
+                           self.rng.uniform(-1, 1, len(rows)), self.rng.uniform(-1, 1, len(rows)), 40)
+
+    def add_asteroids(self, rows, slots, x, y, vx, vy, size):
+        self.asteroid_x[rows, slots] = x
+        self.asteroid_y[rows, slots] = y
+        self.asteroid_vx[rows, slots] = vx
+        self.asteroid_vy[rows, slots] = vy
+        self.asteroid_size[rows, slots] = size
+        self.asteroid_alive[rows, slots] = True
+
+    def fire(self, games, angle):
+        # Put a bullet in the first empty slot of each game in `games`, flying along `angle`
+        rows = np.flatnonzero(games)
+        fits, slots = allocate(self.bullet_alive[rows], np.arange(len(rows)))
+        rows, step = rows[fits], (angle[rows[fits]] % 360) // ship_rotation_speed
+        self.bullet_x[rows, slots] = self.ship_x[rows]
+        self.bullet_y[rows, slots] = self.ship_y[rows]
+        self.bullet_vx[rows, slots] = bullet_speed * DIRECTION_X[step]  # Speed is worked out once,
+        self.bullet_vy[rows, slots] = bullet_speed * DIRECTION_Y[step]  # when the bullet is fired
+        self.bullet_alive[rows, slots] = True
+
+    def step(self, actions):
+        # Move every game forward one frame. `actions` is a True/False table with one row
+        # per game and one column per button (see ACTION_FIELDS). Hands back how many
+        # points each game scored this frame.
+        actions = np.asarray(actions, dtype=bool)
+        rng = self.rng
+        score_before = self.score.copy()
+        self.ticks += 1
+
+        # Key presses - shooting and teleporting
+        shooting = actions[:, SHOOT] & (self.shoot_cooldown <= 0)
+        if shooting.any():
+            self.fire(shooting, self.ship_angle)
+            self.fire(shooting & self.double_fire_active, self.ship_angle + 10)  # Double Fire!
+            self.shoot_cooldown[shooting] = base_shoot_cooldown
+        jumping = actions[:, HYPERSPACE] & (self.hyperspace_cooldown <= 0) & (self.lives > 0)
+        if jumping.any():
+            count = int(np.count_nonzero(jumping))
+            self.ship_x[jumping] = rng.integers(0, WIDTH, count, endpoint=True)  # Random spot
+            self.ship_y[jumping] = rng.integers(0, HEIGHT, count, endpoint=True)
+            self.ship_speed[jumping] = 0
+            self.hyperspace_cooldown[jumping] = hyperspace_max_cooldown
+
+        # Keys being held down
+        self.ship_angle += ship_rotation_speed * (actions[:, LEFT].astype(np.int64) - actions[:, RIGHT])
+        self.ship_speed = np.where(actions[:, THRUST],
+                                   np.minimum(self.ship_speed + ship_acceleration, ship_max_speed),
+                                   self.ship_speed)
+        self.ship_speed = np.where(actions[:, BRAKE], np.maximum(self.ship_speed - ship_acceleration, 0),
+                                   self.ship_speed)
+
+        # Move the ships (with the direction table - no cos or sin!) and wrap them around
+        step = (self.ship_angle % 360) // ship_rotation_speed
+        self.ship_x = wrap(self.ship_x + self.ship_speed * DIRECTION_X[step], WIDTH)
+        self.ship_y = wrap(self.ship_y + self.ship_speed * DIRECTION_Y[step], HEIGHT)
+
+        # Move every bullet in every game, and switch off the ones that left the screen
+        self.bullet_x += self.bullet_vx
+        self.bullet_y += self.bullet_vy
+        self.bullet_alive &= ((self.bullet_x >= 0) & (self.bullet_x <= WIDTH) &
+                              (self.bullet_y >= 0) & (self.bullet_y <= HEIGHT))
+
+        # Move every asteroid and wrap it around
+        self.asteroid_x = wrap(self.asteroid_x + self.asteroid_vx, WIDTH)
+        self.asteroid_y = wrap(self.asteroid_y + self.asteroid_vy, HEIGHT)
+
+        # Power-ups fall, drop off the bottom, or get grabbed by the ship
+        self.powerup_y += powerup_speed
+        self.powerup_alive &= self.powerup_y <= HEIGHT
+        ship_x, ship_y = self.ship_x[:, None], self.ship_y[:, None]  # One column, so it lines up with every slot
+        grabbed = (self.powerup_alive &
+                   (self.powerup_x < ship_x + 20) & (self.powerup_x + powerup_size > ship_x - 20) &
+                   (self.powerup_y < ship_y + 20) & (self.powerup_y + powerup_size > ship_y - 20))
+        if grabbed.any():
+            double_fire = (grabbed & (self.powerup_kind == 0)).any(axis=1)  # Double Fire
+            self.powerup_timer[double_fire] = powerup_duration
+            self.double_fire_active |= double_fire
+            self.score += 500 * np.count_nonzero(grabbed & (self.powerup_kind == 1), axis=1)  # Bonus Score
+            self.lives += np.count_nonzero(grabbed & (self.powerup_kind == 2), axis=1)        # Extra Life
+            self.powerup_alive &= ~grabbed
+
+        # Add new asteroids where we need them
+        self.spawn_timer += 1
+        spawning = (self.spawn_timer >= spawn_interval) & (np.count_nonzero(self.asteroid_alive, axis=1) < min_asteroids)
+        if spawning.any():
+            self.spawn_asteroids(spawning)
+
+        # Ships hitting asteroids (every asteroid in every game measured at once)
+        dx, dy, reach = ship_x - self.asteroid_x, ship_y - self.asteroid_y, self.asteroid_size + 15
+        crashed = ((dx * dx + dy * dy < reach * reach) & self.asteroid_alive).any(axis=1) & (self.lives > 0)
+        if crashed.any():
+            self.lives -= crashed
+            self.ship_x[crashed] = WIDTH // 2  # Back to center
+            self.ship_y[crashed] = HEIGHT // 2
+            self.ship_speed[crashed] = 0
+            self.ship_angle[crashed] = 0
+
+        # Bullets hitting asteroids
+        if self.bullet_alive.any():
+            self.shoot_asteroids()
+
+        # Update our timers
+        self.shoot_cooldown = np.maximum(self.shoot_cooldown - 1, 0)
+        self.hyperspace_cooldown = np.maximum(self.hyperspace_cooldown - 1, 0)
+        was_powered = self.powerup_timer > 0
+        self.powerup_timer = np.maximum(self.powerup_timer - 1, 0)
+        self.double_fire_active &= ~(was_powered & (self.powerup_timer == 0))  # Power-up over?
+
+        # Restart the games that are out of lives and holding R
+        scored = self.score - score_before  # Worked out first, so a restart doesn't count as losing points
+        restarting = (self.lives <= 0) & actions[:, RESTART]
+        if restarting.any():
+            self.reset(restarting)
+        return scored
+
+    def spawn_asteroids(self, games):
+        # One new big asteroid at a random edge of each game in `games`
+        rng = self.rng
+        rows = np.flatnonzero(games)
+        count = len(rows)
+        edge = rng.integers(0, 4, count)  # Pick a side (0=top, 1=right, 2=bottom, 3=left)
+        along_x = rng.integers(0, WIDTH, count, endpoint=True)   # Random spot along a top/bottom edge
+        along_y = rng.integers(0, HEIGHT, count, endpoint=True)  # Random spot along a left/right edge
+        x = np.select([edge == 0, edge == 1, edge == 2], [along_x, WIDTH, along_x], 0)
+        y = np.select([edge == 0, edge == 1, edge == 2], [0, along_y, HEIGHT], along_y)
+        drift = rng.uniform(-1, 1, count)        # Sideways drift along the edge
+        inward = rng.uniform(0.5, 1.5, count)    # Speed heading into the screen
+        vx = np.select([edge == 1, edge == 3], [-inward, inward], drift)
+        vy = np.select([edge == 0, edge == 2], [inward, -inward], drift)
+        fits, slots = allocate(self.asteroid_alive[rows], np.arange(count))
+        self.add_asteroids(rows[fits], slots, x[fits], y[fits], vx[fits], vy[fits], 40)
+        self.spawn_timer[rows] = 0
+
+    def shoot_asteroids(self):
+        rng = self.rng
+        # Only the bullets that are really flying get checked: for each one, a row of every
+        # asteroid slot in its own game - is it a hit?
+        bullet_games, bullet_slots = np.nonzero(self.bullet_alive)
+        dx = self.bullet_x[bullet_games, bullet_slots, None] - self.asteroid_x[bullet_games]
+        dy = self.bullet_y[bullet_games, bullet_slots, None] - self.asteroid_y[bullet_games]
+        size = self.asteroid_size[bullet_games]
+        hits = (dx * dx + dy * dy < size * size) & self.asteroid_alive[bullet_games]  # No square roots needed
+        hit = hits.any(axis=1)
+        if not hit.any():
+            return
+        hit_games, hit_bullets = bullet_games[hit], bullet_slots[hit]
+        targets = hits[hit].argmax(axis=1)  # Each bullet's lowest numbered asteroid
+        # If two bullets hit the same asteroid, the lower numbered bullet gets it
+        winner = np.full(self.asteroid_alive.shape, self.bullet_alive.shape[1])
+        np.minimum.at(winner, (hit_games, targets), hit_bullets)
+        won = winner[hit_games, targets] == hit_bullets
+        self.bullet_alive[hit_games[won], hit_bullets[won]] = False  # Those bullets are used up
+
+        destroyed = winner < self.bullet_alive.shape[1]
+        games, slots = np.nonzero(destroyed)  # Sorted by game, which allocate() needs
+        x, y = self.asteroid_x[games, slots], self.asteroid_y[games, slots]
+        size = self.asteroid_size[games, slots]
+        self.asteroid_alive[games, slots] = False  # Boom!
+        # Points depend on asteroid size
+        np.add.at(self.score, games, np.where(size > 30, 20, np.where(size > 15, 50, 100)))
+
+        # 20% chance for a power-up from each one
+        dropping = rng.random(len(games)) < 0.2
+        if dropping.any():
+            drop_games = games[dropping]
+            fits, drop_slots = allocate(self.powerup_alive, drop_games)  # (Still sorted by game)
+            rows = drop_games[fits]
+            self.powerup_x[rows, drop_slots] = x[dropping][fits]
+            self.powerup_y[rows, drop_slots] = y[dropping][fits]
+            self.powerup_kind[rows, drop_slots] = rng.integers(0, 3, len(rows))
+            self.powerup_alive[rows, drop_slots] = True
+
+        # Big ones split into two
+        splitting = size > 20
+        if splitting.any():
+            parent = np.repeat(np.flatnonzero(splitting), 2)  # Each splitting asteroid, twice
+            child_games = games[parent]
+            fits, child_slots = allocate(self.asteroid_alive, child_games)
+            parent = parent[fits]
+            self.add_asteroids(child_games[fits], child_slots, x[parent], y[parent],
+                               rng.uniform(-1, 1, len(parent)), rng.uniform(-1, 1, len(parent)),
+                               size[parent] // 2)
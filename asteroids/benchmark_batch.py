@@ -0,0 +1,67 @@
+# How many game steps per second can we get by running lots of games at once?
+# Run it with: python benchmark_batch.py
+# First we time the single game from simulation.py (one step at a time, like
+# benchmark_simulation.py), then BatchAsteroids with more and more games side by side.
+# "env-steps/sec" counts every game: 256 games moving one frame is 256 env-steps.
+import time
+
+import numpy as np
+
+from simulation import AsteroidsGame, Action
+from batch_env import BatchAsteroids, ACTION_FIELDS, LEFT, RIGHT, THRUST, BRAKE, SHOOT, HYPERSPACE, RESTART
+
+SEED = 2024
+SINGLE_TICKS = 20_000               # Steps for the one-game loop
+BATCH_SIZES = [1, 16, 64, 256, 1024]  # How many games to run at once
+BATCH_STEPS = 200_000               # Roughly this many env-steps for every batch size
+
+
+def bot_actions(ticks, num_games, rng):
+    # The same bot as benchmark_simulation.py, for every game at once: turn left for a while,
+    # then right, thrust every so often, and shoot whenever we can
+    actions = np.zeros((ticks, num_games, len(ACTION_FIELDS)), dtype=bool)
+    turning_left = (np.arange(ticks) // 90) % 2 == 0
+    actions[:, :, LEFT] = turning_left[:, None]
+    actions[:, :, RIGHT] = ~turning_left[:, None]
+    actions[:, :, THRUST] = rng.random((ticks, num_games)) < 0.3
+    actions[:, :, BRAKE] = rng.random((ticks, num_games)) < 0.1
+    actions[:, :, SHOOT] = True
+    actions[:, :, HYPERSPACE] = rng.random((ticks, num_games)) < 0.002
+    actions[:, :, RESTART] = True
+    return actions
+
+
+def time_single():
+    game = AsteroidsGame(seed=SEED)
+    # Made ahead so we only time the game
+    actions = [Action(*row) for row in bot_actions(SINGLE_TICKS, 1, np.random.default_rng(SEED))[:, 0].tolist()]
+    start = time.perf_counter()
+    for action in actions:
+        game.step(action)
+    return SINGLE_TICKS / (time.perf_counter() - start)
+
+
+def time_batch(num_games):
+    games = BatchAsteroids(num_games, seed=SEED)
+    ticks = max(100, BATCH_STEPS // num_games)
+    actions = bot_actions(ticks, num_games, np.random.default_rng(SEED))
+    score = 0
+    start = time.perf_counter()
+    for tick_actions in actions:
+        score += int(games.step(tick_actions).sum())
+    elapsed = time.perf_counter() - start
+    return num_games * ticks / elapsed, ticks, score
+
+
+def main():
+    single = time_single()
+    print(f"{'games':>7} {'env-steps/sec':>15} {'vs one game':>12}")
+    print(f"{'single':>7} {single:15,.0f} {'1.0x':>12}   (simulation.AsteroidsGame)")
+    for num_games in BATCH_SIZES:
+        rate, ticks, score = time_batch(num_games)
+        print(f"{num_games:>7} {rate:15,.0f} {rate / single:11.1f}x   "
+              f"({ticks} ticks, {score:,} points scored)")
+
+
+if __name__ == "__main__":
+    main()
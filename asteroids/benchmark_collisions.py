@@ -0,0 +1,109 @@
+# A stress test for our collision checks - run it with: python benchmark_collisions.py
+# It fills a wrap-around world with LOTS of asteroids and bullets and times three ways
+# of finding out which bullets hit which asteroids:
+#   1. "Check everything": every bullet against every asteroid (what the game used to do)
+#   2. "Spatial hash": only check asteroids in the squares around each bullet
+#   3. "NumPy pairs": the same squares, but sorted and measured with NumPy (what the game does now)
+# The world grows with the number of rocks so the crowding (density) stays the same,
+# just like a bigger swarm-mode arena. If the spatial hash is doing its job, doubling
+# the number of things should roughly double its time - not make it four times slower!
+import math
+import random
+import time
+
+import numpy as np
+
+from spatial_hash import SpatialHash
+
+ROCKS_PER_SCREEN = 200     # How crowded the world is: this many asteroids per 800x600 screen
+CELL_SIZE = 64             # Same grid square size the game uses
+COUNTS = [250, 500, 1000, 2000, 4000, 8000]  # How many asteroids (and bullets) to try
+BRUTE_FORCE_LIMIT = 2000   # "Check everything" gets really slow after this, so we stop there
+REPEATS = 3                # Time each test a few times and keep the best
+
+
+def make_world(count, rng):
+    # Pick a world size (4:3 like the screen) that keeps the same crowding
+    scale = math.sqrt(count / ROCKS_PER_SCREEN)
+    width, height = 800 * scale, 600 * scale
+    asteroids = [[rng.uniform(0, width), rng.uniform(0, height), rng.choice((40, 20, 10))]
+                 for _ in range(count)]
+    bullets = [[rng.uniform(0, width), rng.uniform(0, height)] for _ in range(count)]
+    return width, height, asteroids, bullets
+
+
+def check_everything(asteroids, bullets):
+    hits = 0
+    for bullet in bullets:
+        for asteroid in asteroids:
+            if math.hypot(bullet[0] - asteroid[0], bullet[1] - asteroid[1]) < asteroid[2]:
+                hits += 1
+                break
+    return hits
+
+
+def check_with_grid(grid, asteroids, bullets):
+    grid.clear()  # The game re-sorts everything every frame, so the timing includes that too
+    for asteroid in asteroids:
+        grid.insert(asteroid, asteroid[0], asteroid[1])
+    hits = 0
+    for bullet in bullets:
+        for asteroid in grid.nearby(bullet[0], bullet[1]):
+            if math.hypot(bullet[0] - asteroid[0], bullet[1] - asteroid[1]) < asteroid[2]:
+                hits += 1
+                break
+    return hits
+
+
+def check_with_pairs(grid, asteroids, bullets):
+    ax, ay, asize = (np.array(column) for column in zip(*asteroids))
+    bx, by = (np.array(column) for column in zip(*bullets))
+    start = time.perf_counter()  # Don't count turning the lists into arrays - the game keeps arrays
+    hit_bullets, hit_asteroids = grid.candidate_pairs(ax, ay, bx, by)
+    touching = np.hypot(bx[hit_bullets] - ax[hit_asteroids], by[hit_bullets] - ay[hit_asteroids]) < asize[hit_asteroids]
+    hits = len(np.unique(hit_bullets[touching]))  # Each bullet counts once, like the loops above
+    return time.perf_counter() - start, hits
+
+
+def best_time(function, *args):
+    best = None
+    result = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    rng = random.Random(1234)  # Same "random" world every run so results are comparable
+    print(f"{'count':>7} {'check everything':>18} {'spatial hash':>14} {'speed-up':>9} {'hash growth':>12}"
+          f" {'numpy pairs':>13} {'pairs growth':>13}")
+    previous = None
+    previous_pairs = None
+    for count in COUNTS:
+        width, height, asteroids, bullets = make_world(count, rng)
+        grid = SpatialHash(width, height, CELL_SIZE)
+        grid_time, grid_hits = best_time(check_with_grid, grid, asteroids, bullets)
+        pairs_time = min(check_with_pairs(grid, asteroids, bullets)[0] for _ in range(REPEATS))
+        assert check_with_pairs(grid, asteroids, bullets)[1] == grid_hits, "NumPy pairs missed a hit!"
+        if count <= BRUTE_FORCE_LIMIT:
+            brute_time, brute_hits = best_time(check_everything, asteroids, bullets)
+            assert brute_hits == grid_hits, "The spatial hash missed a hit!"
+            brute_text = f"{brute_time * 1000:15.2f} ms"
+            speed_up = f"{brute_time / grid_time:8.1f}x"
+        else:
+            brute_text = f"{'(skipped)':>18}"
+            speed_up = f"{'-':>9}"
+        # How much slower than the last row - about 2.0x means it scales in a straight line
+        growth = f"{grid_time / previous:11.2f}x" if previous else f"{'-':>12}"
+        pairs_growth = f"{pairs_time / previous_pairs:12.2f}x" if previous_pairs else f"{'-':>13}"
+        print(f"{count:>7} {brute_text} {grid_time * 1000:11.2f} ms {speed_up} {growth}"
+              f" {pairs_time * 1000:10.2f} ms {pairs_growth}")
+        previous = grid_time
+        previous_pairs = pairs_time
+
+
+if __name__ == "__main__":
+    main()
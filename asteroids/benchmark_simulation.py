@@ -0,0 +1,41 @@
+# How fast can Asteroids run with no window and no frame limit?
+# Run it with: python benchmark_simulation.py
+# A simple bot spins, thrusts and shoots (and restarts when it runs out of lives) while we
+# count how many game ticks happen per second. The real game only needs 60 per second!
+import random
+import time
+
+from simulation import AsteroidsGame, Action
+
+TICKS = 100_000  # How many frames to simulate
+SEED = 2024      # Same seed = same game, so runs are easy to compare
+
+
+def bot_action(tick, rng):
+    # Turn left for a while, then right, thrust every so often, and shoot whenever we can
+    return Action(left=(tick // 90) % 2 == 0,
+                  right=(tick // 90) % 2 == 1,
+                  thrust=rng.random() < 0.3,
+                  brake=rng.random() < 0.1,
+                  shoot=True,
+                  hyperspace=rng.random() < 0.002,
+                  restart=True)
+
+
+def main():
+    game = AsteroidsGame(seed=SEED)
+    rng = random.Random(SEED)  # The bot gets its own random numbers, separate from the game's
+    actions = [bot_action(tick, rng) for tick in range(TICKS)]  # Made ahead so we only time the game
+    games_played = 1
+    start = time.perf_counter()
+    for action in actions:
+        game.step(action)
+        if game.ticks == 0:
+            games_played += 1  # The bot ran out of lives, held R, and a new game started
+    elapsed = time.perf_counter() - start
+    print(f"{TICKS} ticks in {elapsed:.2f} s = {TICKS / elapsed:,.0f} ticks/sec "
+          f"({TICKS / elapsed / 60:,.0f}x real time), {games_played} games")
+
+
+if __name__ == "__main__":
+    main()
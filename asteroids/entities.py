@@ -0,0 +1,85 @@
+# An "entity store" keeps lots of game things (asteroids, bullets, power-ups) in NumPy arrays.
+# Instead of one little list per asteroid like [x, y, size, vx, vy, shape], we keep one
+# BIG array for every x, one for every y, one for every size, and so on (programmers call
+# this "structure of arrays"). The cool part: NumPy can move ALL the asteroids with a
+# single line like x += vx, which is way faster than a Python for loop.
+#
+# Only the first `count` spots of each array are in use. The rest is spare room so we
+# don't have to make new arrays every time something spawns.
+import numpy as np
+
+
+class EntityStore:
+    def __init__(self, capacity=64):
+        self.count = 0                                   # How many things are in the store
+        self.x = np.zeros(capacity)                      # Where each one is (left/right)
+        self.y = np.zeros(capacity)                      # Where each one is (up/down)
+        self.vx = np.zeros(capacity)                     # How fast it moves left/right
+        self.vy = np.zeros(capacity)                     # How fast it moves up/down
+        self.size = np.zeros(capacity)                   # How big it is
+        self.kind = np.zeros(capacity, dtype=int)        # What type it is (like which power-up)
+        self.shape = np.empty(capacity, dtype=object)    # Anything else, like an asteroid's outline
+        self.alive = np.zeros(capacity, dtype=bool)      # False once it's been destroyed
+
+    def __len__(self):
+        return self.count  # So len(asteroids) works just like it did with a list
+
+    def columns(self):
+        # Every array in the store - handy when we need to do the same thing to all of them
+        return (self.x, self.y, self.vx, self.vy, self.size, self.kind, self.shape, self.alive)
+
+    def add(self, x, y, vx=0.0, vy=0.0, size=0.0, kind=0, shape=None):
+        if self.count == len(self.x):  # Out of room? Make every array twice as big
+            self.x, self.y, self.vx, self.vy, self.size, self.kind, self.shape, self.alive = (
+                np.concatenate((column, np.zeros_like(column))) for column in self.columns())
+        i = self.count
+        self.x[i], self.y[i], self.vx[i], self.vy[i] = x, y, vx, vy
+        self.size[i], self.kind[i], self.shape[i] = size, kind, shape
+        self.alive[i] = True
+        self.count += 1
+        return i  # Where it ended up, in case you need it
+
+    def clear(self):
+        self.alive[:self.count] = False
+        self.shape[:self.count] = None  # Let go of old shapes so Python can tidy them up
+        self.count = 0
+
+    def move(self):
+        # Everybody moves by their own speed - one line for the whole store!
+        n = self.count
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+    def wrap(self, width, height):
+        # Fly off one side, come back on the other (% is the "wrap around" operator)
+        n = self.count
+        np.mod(self.x[:n], width, out=self.x[:n])
+        np.mod(self.y[:n], height, out=self.y[:n])
+
+    def kill_outside(self, left, top, right, bottom):
+        # Anything that left the box is gone (edges count as inside, like the old checks)
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        self.alive[:n] &= (x >= left) & (x <= right) & (y >= top) & (y <= bottom)
+
+    def distances(self, x, y):
+        # How far every thing in the store is from the spot (x, y) - all at once
+        n = self.count
+        return np.hypot(self.x[:n] - x, self.y[:n] - y)
+
+    def compact(self):
+        # Squeeze out the dead things. Rather than sliding everything down (slow, like
+        # list.remove), we fill each hole near the front with a living thing from the back:
+        # a "swap remove". The order changes a little, but nothing in the game cares.
+        n = self.count
+        alive = self.alive[:n]
+        keep = int(np.count_nonzero(alive))
+        if keep == n:
+            return  # Nobody died - nothing to do
+        holes = np.flatnonzero(~alive[:keep])           # Dead spots we want to fill
+        movers = np.flatnonzero(alive[keep:n]) + keep   # Living things sitting past the end
+        for column in self.columns():
+            column[holes] = column[movers]
+        self.alive[keep:n] = False
+        self.shape[keep:n] = None
+        self.count = keep
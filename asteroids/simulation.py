@@ -0,0 +1,305 @@
+# The Asteroids game rules, with no window, no sound and no clock!
+# Everything that happens in the game lives in one AsteroidsGame object, and each call to
+# game.step(action) moves the game forward by one frame (a "tick"). Because nothing here
+# waits for the screen, a computer player (a "bot") can run the game thousands of times
+# faster than real time. asteroids.py draws this game on the screen and plays the sounds.
+#
+# Try it:
+#     game = AsteroidsGame(seed=42)
+#     events = game.step(Action(thrust=True, shoot=True))
+import math
+import random
+from collections import namedtuple
+
+import numpy as np
+
+from entities import EntityStore  # Keeps lots of asteroids/bullets in fast NumPy arrays
+from spatial_hash import SpatialHash  # Our "graph paper" helper for finding things that are close together
+
+# The size of space - think of it as our TV screen
+WIDTH = 800    # How wide space is (800 pixels)
+HEIGHT = 600   # How tall space is (600 pixels)
+
+# Setting up our spaceship - our little hero!
+ship_max_speed = 5       # Top speed limit
+ship_acceleration = 0.1  # How quickly it speeds up
+ship_rotation_speed = 5  # How fast it turns
+
+# The ship only ever turns in steps of ship_rotation_speed (5 degrees), so there are just
+# 72 directions it can point. We work out cos and sin for each of them ONCE, right here,
+# and look them up later instead of doing the math every frame.
+ANGLE_STEPS = 360 // ship_rotation_speed  # How many different directions (72)
+DIRECTIONS = [(math.cos(math.radians(step * ship_rotation_speed)),    # How much of a step goes right
+               -math.sin(math.radians(step * ship_rotation_speed)))   # ...and how much goes down (up is negative)
+              for step in range(ANGLE_STEPS)]
+
+def direction(angle):
+    # Look up the (x, y) direction for an angle - % 360 turns -5 degrees into 355, and so on
+    return DIRECTIONS[(angle % 360) // ship_rotation_speed]
+
+# Bullets our ship will shoot
+bullet_speed = 7         # How fast bullets fly
+base_shoot_cooldown = 10 # How long we wait between shots
+
+# Power-ups - little bonuses to help us!
+powerup_size = 20         # How big they are
+powerup_speed = 2         # How fast they fall
+powerup_duration = 600    # How long Double Fire lasts (600 frames = 10 seconds)
+
+# Game rules
+min_asteroids = 4         # Always have at least 4 asteroids
+spawn_interval = 180      # New asteroid every 3 seconds (180 frames)
+hyperspace_max_cooldown = 300  # 5 seconds wait between teleports
+
+# A spatial hash sorts asteroids into squares so bullets only check the ones near them.
+# Each square is 64 pixels: bigger than the farthest a bullet can hit from (a big asteroid's
+# 40 pixel radius). The ship and power-ups are just one thing each, so NumPy checks those
+# against everything at once instead.
+GRID_CELL_SIZE = 64
+# With only a handful of bullets and rocks, sorting them into squares costs more than just
+# measuring every bullet to every asteroid in one NumPy table. Above this many pairs the
+# spatial hash wins, so that's when we switch over to it.
+GRID_MIN_PAIRS = 4096
+
+# What the player wants to do this tick. The arrows (left, right, thrust, brake) and R
+# (restart) count while they're held down; shoot and hyperspace are single key presses.
+# Anything you leave out is False, so Action(shoot=True) just shoots.
+Action = namedtuple("Action", ["left", "right", "thrust", "brake", "shoot", "hyperspace", "restart"])
+Action.__new__.__defaults__ = (False,) * 7  # (namedtuple's defaults= would need Python 3.7)
+NO_ACTION = Action()  # Don't touch anything
+
+
+class AsteroidsGame:
+    def __init__(self, seed=None):
+        # Our very own random number maker. Give it the same seed and you get the exact
+        # same game every time - great for bots and for checking nothing changed.
+        self.rng = random.Random(seed)
+        self.asteroid_grid = SpatialHash(WIDTH, HEIGHT, GRID_CELL_SIZE)  # Where the asteroids are
+        self.bullets = EntityStore()    # Each bullet has a position (x, y) and speed (vx, vy)
+        self.asteroids = EntityStore()  # Each asteroid has x, y, vx, vy, size and a shape
+        self.powerups = EntityStore()   # Each power-up has x, y, falling speed (vy) and kind (type)
+        self.frame_timer = None  # asteroids.py gives us its FrameTimer (arcade_common/frame_timer.py), to time the collisions
+        self.reset()
+
+    def reset(self):
+        # Put everything back to how a brand new game starts
+        self.ship_x = WIDTH // 2      # Starts in the middle horizontally (// means divide and round down)
+        self.ship_y = HEIGHT // 2     # Starts in the middle vertically
+        self.ship_angle = 0           # Which way it's pointing (0 degrees is right)
+        self.ship_speed = 0           # How fast it's going (starts still)
+        self.shoot_cooldown = 0       # A timer to stop us shooting too fast
+        self.powerup_timer = 0        # Counts down the power-up time
+        self.double_fire_active = False  # Is Double Fire on? Starts as no
+        self.score = 0                # Points we've earned
+        self.lives = 3                # How many chances we get
+        self.spawn_timer = 0          # Counts up to spawn new asteroids
+        self.hyperspace_cooldown = 0  # Timer for our teleport trick
+        self.ticks = 0                # How many frames this game has run for
+        self.bullets.clear()
+        self.asteroids.clear()
+        self.powerups.clear()
+        rng = self.rng
+        for _ in range(4):  # Let's make 4 asteroids to start with
+            self.asteroids.add(rng.randint(0, WIDTH), rng.randint(0, HEIGHT),  # Random spot
+                               rng.uniform(-1, 1), rng.uniform(-1, 1),         # Random speed
+                               40, shape=self.generate_asteroid_shape(40))     # Size 40 and a shape
+
+    # Making jagged asteroid shapes - like the old Atari game
+    # We only do this ONCE per asteroid (when it spawns or splits). The shape is stored as
+    # offsets from the asteroid's middle, so every frame we just slide it to the new spot.
+    def generate_asteroid_shape(self, size):
+        rng = self.rng
+        shape = []  # List of dots to connect, measured from the middle of the asteroid
+        num_points = 8 + rng.randint(0, 4)  # 8 to 12 corners
+        for i in range(num_points):
+            angle = i * 360 / num_points + rng.randint(-15, 15)  # Spread them around
+            radius = size * (0.7 + rng.uniform(0, 0.3))  # Vary the distance a bit
+            dx = radius * math.cos(math.radians(angle))  # How far right of the middle
+            dy = radius * math.sin(math.radians(angle))  # How far below the middle
+            shape.append((dx, dy))  # Add this dot to our shape
+        return shape
+
+    # Adding new asteroids when we need them
+    def spawn_asteroid(self):
+        rng = self.rng
+        edge = rng.randint(0, 3)  # Pick a side (0=top, 1=right, 2=bottom, 3=left)
+        if edge == 0:
+            x, y = rng.randint(0, WIDTH), 0  # Start at top
+            vx, vy = rng.uniform(-1, 1), rng.uniform(0.5, 1.5)  # Drift down
+        elif edge == 1:
+            x, y = WIDTH, rng.randint(0, HEIGHT)  # Start at right
+            vx, vy = rng.uniform(-1.5, -0.5), rng.uniform(-1, 1)  # Drift left
+        elif edge == 2:
+            x, y = rng.randint(0, WIDTH), HEIGHT  # Start at bottom
+            vx, vy = rng.uniform(-1, 1), rng.uniform(-1.5, -0.5)  # Drift up
+        else:
+            x, y = 0, rng.randint(0, HEIGHT)  # Start at left
+            vx, vy = rng.uniform(0.5, 1.5), rng.uniform(-1, 1)  # Drift right
+        size = 40  # Big asteroid
+        shape = self.generate_asteroid_shape(size)  # Make its shape (just once!)
+        self.asteroids.add(x, y, vx, vy, size, shape=shape)  # Add it to the store
+
+    # Blowing up asteroid number i: points, maybe a power-up, and maybe two smaller rocks
+    def destroy_asteroid(self, i):
+        rng, asteroids = self.rng, self.asteroids
+        x, y, size = asteroids.x[i], asteroids.y[i], asteroids.size[i]
+        asteroids.alive[i] = False  # Bye asteroid! (we tidy up the dead ones later)
+        # Points depend on asteroid size
+        points = 20 if size > 30 else 50 if size > 15 else 100
+        self.score += points
+        if rng.random() < 0.2:  # 20% chance for power-up
+            powerup_type = rng.randint(0, 2)
+            self.powerups.add(x, y, 0, powerup_speed, powerup_size, powerup_type)
+        if size > 20:  # Big ones split
+            new_size = size // 2
+            for _ in range(2):
+                asteroids.add(x, y, rng.uniform(-1, 1), rng.uniform(-1, 1), new_size,
+                              shape=self.generate_asteroid_shape(new_size))
+
+    def step(self, action=NO_ACTION):
+        # Move the whole game forward by one frame. Hands back a list of things that
+        # happened ("shoot", "hit", "powerup", "hyperspace", "death") so whoever is
+        # showing the game can play the right sounds.
+        events = []
+        bullets, asteroids, powerups = self.bullets, self.asteroids, self.powerups
+        self.ticks += 1
+
+        # Key presses - shooting and teleporting
+        if action.shoot and self.shoot_cooldown <= 0:  # Space to shoot!
+            # Work out the bullet's speed once, when it's fired - its direction never changes
+            dx, dy = direction(self.ship_angle)
+            bullets.add(self.ship_x, self.ship_y, bullet_speed * dx, bullet_speed * dy)  # Add a bullet
+            if self.double_fire_active:  # Extra bullet if we have the power-up
+                dx, dy = direction(self.ship_angle + 10)
+                bullets.add(self.ship_x, self.ship_y, bullet_speed * dx, bullet_speed * dy)
+            self.shoot_cooldown = base_shoot_cooldown  # Wait before next shot
+            events.append("shoot")  # Pew pew!
+        if action.hyperspace and self.hyperspace_cooldown <= 0 and self.lives > 0:  # H to teleport!
+            self.ship_x = self.rng.randint(0, WIDTH)  # Random spot
+            self.ship_y = self.rng.randint(0, HEIGHT)
+            self.ship_speed = 0  # Stop moving
+            self.hyperspace_cooldown = hyperspace_max_cooldown  # Wait before next teleport
+            events.append("hyperspace")  # Whoosh!
+
+        # Keys being held down
+        if action.left:    # Left arrow turns left
+            self.ship_angle += ship_rotation_speed
+        if action.right:   # Right arrow turns right
+            self.ship_angle -= ship_rotation_speed
+        if action.thrust:  # Up arrow speeds up
+            self.ship_speed = min(self.ship_speed + ship_acceleration, ship_max_speed)
+        if action.brake:   # Down arrow slows down
+            self.ship_speed = max(self.ship_speed - ship_acceleration, 0)
+
+        # Move the ship based on its speed and angle
+        dx, dy = direction(self.ship_angle)  # Which way we're pointing (looked up, no math needed)
+        self.ship_x = (self.ship_x + self.ship_speed * dx) % WIDTH   # Update position and
+        self.ship_y = (self.ship_y + self.ship_speed * dy) % HEIGHT  # wrap around screen edges
+
+        # Move all our bullets - NumPy moves every one of them in one go
+        if len(bullets):
+            bullets.move()
+            bullets.kill_outside(0, 0, WIDTH, HEIGHT)  # Off screen? Bye bye bullet!
+            bullets.compact()  # Tidy the gone ones out of the store
+
+        # Move all our asteroids (their shapes come along for the ride - no need to remake them)
+        asteroids.move()
+        asteroids.wrap(WIDTH, HEIGHT)  # Wrap around
+
+        # Move power-ups and check if we grab them
+        if len(powerups):
+            self.update_powerups(events)
+
+        # Add new asteroids if we need them
+        self.spawn_timer += 1
+        if self.spawn_timer >= spawn_interval and len(asteroids) < min_asteroids:
+            self.spawn_asteroid()  # New asteroid time!
+            self.spawn_timer = 0   # Reset timer
+
+        # Check if ship hits an asteroid
+        if self.frame_timer:
+            self.frame_timer.mark("update")  # (The frame timer: everything so far was moving things)
+        # Math.hypot is like measuring distance with a ruler - NumPy measures to every asteroid at once!
+        n = len(asteroids)
+        if self.lives > 0 and n and (asteroids.distances(self.ship_x, self.ship_y) < asteroids.size[:n] + 15).any():
+            self.lives -= 1  # Ouch!
+            self.ship_x = WIDTH // 2  # Back to center
+            self.ship_y = HEIGHT // 2
+            self.ship_speed = 0       # Stop
+            self.ship_angle = 0       # Reset direction
+            events.append("death")  # Oh no!
+
+        # Check if bullets hit asteroids
+        if len(bullets) and len(asteroids):
+            self.shoot_asteroids(events)
+        if self.frame_timer:
+            self.frame_timer.mark("collision")  # ...and this part was collisions
+
+        # Update our timers
+        if self.shoot_cooldown > 0:
+            self.shoot_cooldown -= 1  # Count down to shoot again
+        if self.hyperspace_cooldown > 0:
+            self.hyperspace_cooldown -= 1  # Count down to teleport again
+        if self.powerup_timer > 0:
+            self.powerup_timer -= 1
+            if self.powerup_timer <= 0:  # Power-up over?
+                self.double_fire_active = False
+                self.powerup_timer = 0
+
+        # Restart if we're dead and holding R
+        if self.lives <= 0 and action.restart:
+            self.reset()
+        return events
+
+    def update_powerups(self, events):
+        powerups = self.powerups
+        powerups.move()  # Fall down
+        powerups.kill_outside(-math.inf, -math.inf, math.inf, HEIGHT)  # Fell off the bottom? Gone
+        n = len(powerups)
+        px, py = powerups.x[:n], powerups.y[:n]
+        ship_x, ship_y = self.ship_x, self.ship_y
+        touching = (powerups.alive[:n] &
+                    (px < ship_x + 20) & (px + powerup_size > ship_x - 20) &
+                    (py < ship_y + 20) & (py + powerup_size > ship_y - 20))  # Touching ship?
+        for i in np.flatnonzero(touching).tolist():
+            if powerups.kind[i] == 0:  # Double Fire
+                self.powerup_timer = powerup_duration
+                self.double_fire_active = True
+            elif powerups.kind[i] == 1:  # Bonus Score
+                self.score += 500
+            elif powerups.kind[i] == 2:  # Extra Life
+                self.lives += 1
+            powerups.alive[i] = False  # Got it!
+            events.append("powerup")  # Yay!
+        powerups.compact()
+
+    def shoot_asteroids(self, events):
+        bullets, asteroids = self.bullets, self.asteroids
+        n_bullets, n_asteroids = len(bullets), len(asteroids)
+        ax, ay, asize = asteroids.x[:n_asteroids], asteroids.y[:n_asteroids], asteroids.size[:n_asteroids]
+        bx, by = bullets.x[:n_bullets], bullets.y[:n_bullets]
+        if n_bullets * n_asteroids < GRID_MIN_PAIRS:
+            # Not many pairs: measure every bullet to every asteroid in one table
+            # (one row per bullet, one column per asteroid)
+            touching = np.hypot(bx[:, None] - ax, by[:, None] - ay) < asize
+            if not touching.any():
+                return  # Nothing hit - most frames end right here
+            hit_bullets, hit_asteroids = np.nonzero(touching)  # Already bullet by bullet
+        else:
+            # The spatial hash only pairs each bullet with asteroids in the squares around it...
+            hit_bullets, hit_asteroids = self.asteroid_grid.candidate_pairs(ax, ay, bx, by)
+            # ...then NumPy measures all of those pairs at once
+            touching = np.hypot(bx[hit_bullets] - ax[hit_asteroids], by[hit_bullets] - ay[hit_asteroids]) < asize[hit_asteroids]
+            if not touching.any():
+                return  # Nothing hit - most frames end right here
+            hit_bullets, hit_asteroids = hit_bullets[touching], hit_asteroids[touching]
+            order = np.lexsort((hit_asteroids, hit_bullets))  # Put them bullet by bullet too
+            hit_bullets, hit_asteroids = hit_bullets[order], hit_asteroids[order]
+        # Go through the hits bullet by bullet (lowest numbered asteroid first)
+        for b, a in zip(hit_bullets.tolist(), hit_asteroids.tolist()):
+            if bullets.alive[b] and asteroids.alive[a]:  # Each bullet and asteroid only counts once
+                bullets.alive[b] = False  # Bullet's gone
+                self.destroy_asteroid(a)  # Boom - points, power-ups and splitting
+                events.append("hit")  # Boom!
+        bullets.compact()    # Take the used bullets...
+        asteroids.compact()  # ...and the blown-up asteroids out in one go
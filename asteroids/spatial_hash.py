@@ -0,0 +1,98 @@
+# A spatial hash is like a big sheet of graph paper laid over the screen.
+# Every thing in the game (asteroid, power-up...) gets dropped into the square
+# (we call it a "cell") it is sitting in. When we want to know what is close to a
+# bullet, we only look in the bullet's own cell and the 8 cells around it, instead
+# of checking every single asteroid on the screen. Way less work!
+#
+# Our screen wraps around (fly off the right, come back on the left), so the
+# graph paper wraps around too: the cell to the right of the last column is the
+# first column again. That's why you'll see % (the "wrap around" operator) below.
+#
+# There are two ways to use it:
+#   - insert() and nearby() work one thing at a time, with plain Python.
+#   - candidate_pairs() sorts a whole NumPy array of positions at once and hands back
+#     every (query, item) pair that is close enough to be worth checking.
+import numpy as np
+
+
+class SpatialHash:
+    def __init__(self, width, height, cell_size):
+        # cell_size must be at least as big as the longest distance two things can
+        # touch from, so anything touching is always in the same or a neighbouring cell.
+        self.width = width    # How wide the world is (the screen)
+        self.height = height  # How tall the world is
+        # We round DOWN so every cell is at least cell_size big - a skinny leftover
+        # column at the edge would let touching things end up two cells apart.
+        self.cols = max(1, int(width // cell_size))   # How many cells across
+        self.rows = max(1, int(height // cell_size))  # How many cells down
+        self.buckets = [[] for _ in range(self.cols * self.rows)]  # One list per cell
+        self.used = []  # Which buckets have stuff in them (so clearing is quick)
+        # Work out each cell's neighbours once, right now, so we never redo it
+        self.neighbours = []
+        for row in range(self.rows):
+            for col in range(self.cols):
+                cells = []
+                for d_row in (-1, 0, 1):
+                    for d_col in (-1, 0, 1):
+                        # % wraps the edges around, just like the screen does
+                        cell = ((row + d_row) % self.rows) * self.cols + (col + d_col) % self.cols
+                        if cell not in cells:  # Tiny grids can wrap onto the same cell twice
+                            cells.append(cell)
+                self.neighbours.append(tuple(cells))
+        # The same neighbour lists as one NumPy table (one row per cell). Rows shorter
+        # than 9 get padded with an extra "always empty" cell number at the end.
+        empty_cell = self.cols * self.rows
+        self.neighbour_table = np.full((empty_cell, 9), empty_cell, dtype=np.intp)
+        for cell, cells in enumerate(self.neighbours):
+            self.neighbour_table[cell, :len(cells)] = cells
+
+    def cell_for(self, x, y):
+        # Which cell is the spot (x, y) in? Works even for spots just off the edge.
+        col = int(x * self.cols // self.width) % self.cols
+        row = int(y * self.rows // self.height) % self.rows
+        return row * self.cols + col
+
+    def cells_for(self, xs, ys):
+        # cell_for() for a whole NumPy array of spots at once
+        cols = (xs * self.cols // self.width).astype(np.intp) % self.cols
+        rows = (ys * self.rows // self.height).astype(np.intp) % self.rows
+        return rows * self.cols + cols
+
+    def clear(self):
+        # Empty out the buckets we filled last time (the rest are already empty)
+        for cell in self.used:
+            self.buckets[cell].clear()
+        self.used = []
+
+    def insert(self, item, x, y):
+        # Drop an item into the bucket for the cell it is in
+        cell = self.cell_for(x, y)
+        bucket = self.buckets[cell]
+        if not bucket:  # First thing in this bucket? Remember to empty it later
+            self.used.append(cell)
+        bucket.append(item)
+
+    def nearby(self, x, y):
+        # Everything in the cell around (x, y) and its 8 neighbours.
+        # These are only CANDIDATES - you still do the real distance check on them.
+        buckets = self.buckets
+        for cell in self.neighbours[self.cell_for(x, y)]:
+            yield from buckets[cell]
+
+    def candidate_pairs(self, xs, ys, query_xs, query_ys):
+        # Sort the items at (xs, ys) into cells, then for every query spot list all the
+        # items in its 3x3 block of cells. Returns two arrays: query numbers and item numbers,
+        # so pair k is (queries[k], items[k]). No Python loops - all NumPy!
+        num_cells = self.cols * self.rows
+        cells = self.cells_for(xs, ys)
+        order = np.argsort(cells, kind="stable")          # Item numbers, sorted by cell
+        counts = np.bincount(cells, minlength=num_cells + 1)  # How many items in each cell (+ the empty one)
+        starts = np.cumsum(counts) - counts               # Where each cell's items begin in `order`
+        neighbour_cells = self.neighbour_table[self.cells_for(query_xs, query_ys)].ravel()
+        lengths = counts[neighbour_cells]                  # How many items each (query, cell) gives
+        queries = np.repeat(np.arange(len(query_xs)).repeat(9), lengths)
+        # For each pair: where its cell starts in `order`, plus how far along that cell it is
+        first = np.cumsum(lengths) - lengths
+        step = np.arange(int(lengths.sum())) - np.repeat(first, lengths)
+        items = order[np.repeat(starts[neighbour_cells], lengths) + step]
+        return queries, items
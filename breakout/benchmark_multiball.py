@@ -0,0 +1,98 @@
+# How many chaos balls can Breakout keep going at 60 frames a second?
+# Run it with: python benchmark_multiball.py
+# Like stress mode (ARCADE_STRESS_BALLS): the balls are topped back up when they fall out and
+# the bricks come back when they're all gone. For every number of balls we time TICKS ticks of:
+#   one by one  - each ball through physics.sweep_ball in a Python loop, the way the one real
+#                 ball moves (only up to SCALAR_LIMIT balls - after that it's just too slow)
+#   numpy       - Multiball.step from multiball.py: every ball in one go
+#   draw        - drawing them all with one screen.blits() call, like breakout.py does
+# A frame has 16.7 ms at 60 fps, and "fps" is how many frames of numpy + draw fit in a second.
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import numpy as np
+import pygame
+
+from multiball import Multiball
+from physics import sweep_ball
+
+SEED = 2024
+TICKS = 600
+BALL_COUNTS = [10, 100, 500, 1000, 2000, 5000]
+SCALAR_LIMIT = 1000
+WIDTH, HEIGHT = 800, 600
+BRICK_WIDTH, BRICK_HEIGHT = 80, 30
+PADDLE = (350, HEIGHT - 40, 100, 20)
+
+
+def new_bricks():
+    return np.ones((5, WIDTH // BRICK_WIDTH), dtype=bool)
+
+
+def top_up(balls, count, bricks):
+    if not bricks.any():
+        bricks[:] = True
+    missing = count - len(balls)
+    if missing > 0:
+        r = balls.radius
+        balls.spawn(missing, balls.rng.uniform(r, WIDTH - r, missing),
+                    balls.rng.uniform(len(bricks) * BRICK_HEIGHT + 20, PADDLE[1] - 20, missing))
+
+
+def time_scalar(count):
+    balls = Multiball(seed=SEED)  # Only used to make the same starting balls
+    bricks = new_bricks()
+    top_up(balls, count, bricks)
+    state = list(zip(balls.x.tolist(), balls.y.tolist(), balls.vx.tolist(), balls.vy.tolist()))
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        if not bricks.any():
+            bricks[:] = True
+        state = [sweep_ball(x, y, vx, vy, balls.radius, bricks, BRICK_WIDTH, BRICK_HEIGHT, PADDLE, WIDTH)[:4]
+                 for x, y, vx, vy in state]
+    return (time.perf_counter() - start) / TICKS
+
+
+def time_numpy(count, screen, image):
+    balls = Multiball(seed=SEED)
+    bricks = new_bricks()
+    update = draw = 0.0
+    broken = 0
+    for _ in range(TICKS):
+        top_up(balls, count, bricks)
+        start = time.perf_counter()
+        hits, _ = balls.step(bricks, BRICK_WIDTH, BRICK_HEIGHT, PADDLE, WIDTH, HEIGHT)
+        middle = time.perf_counter()
+        corners = zip((balls.x - balls.radius).astype(int).tolist(), (balls.y - balls.radius).astype(int).tolist())
+        screen.blits([(image, corner) for corner in corners], doreturn=False)
+        end = time.perf_counter()
+        update += middle - start
+        draw += end - middle
+        broken += len(hits)
+    return update / TICKS, draw / TICKS, broken
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    r = Multiball().radius
+    image = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+    pygame.draw.circle(image, (255, 255, 0), (r, r), r)
+    image = image.convert_alpha()
+    print(f"{'balls':>6} {'one by one':>11} {'numpy':>9} {'draw':>9} {'speedup':>8} {'fps':>7} {'bricks/s':>9}")
+    for count in BALL_COUNTS:
+        update, draw, broken = time_numpy(count, screen, image)
+        if count <= SCALAR_LIMIT:
+            scalar = time_scalar(count)
+            scalar_text, speedup_text = f"{scalar * 1e3:8.2f} ms", f"{scalar / update:7.1f}x"
+        else:
+            scalar_text, speedup_text = f"{'-':>11}", f"{'-':>8}"
+        fps = 1 / (update + draw)
+        print(f"{count:6} {scalar_text} {update * 1e3:6.2f} ms {draw * 1e3:6.2f} ms {speedup_text} {fps:7.0f} "
+              f"{broken * 60 / TICKS:9.0f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# How long does Breakout take to draw a frame?
+# Run it with: python benchmark_render.py
+# We draw FRAMES frames of a game with the whole wall of bricks still up: the ball bouncing
+# around, the paddle sliding, two power-ups falling and the lives counter, and a brick
+# breaking every BREAK_EVERY frames (the wall comes back when it's all gone).
+#   full redraw - the way breakout.py used to do it: clear the screen, draw every brick with
+#                 pygame.draw.rect, everything else on top, then flip the whole window
+#   layers      - layers.py: the bricks live on a background picture that only gets touched
+#                 up when one breaks, and only the changed rectangles go to the window
+# "pixels sent" is how much of the window goes to the screen each frame (on a real display,
+# that's the part that costs the most).
+# The first board is the real game's; the second has much smaller bricks, to see what
+# happens with lots more of them.
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import numpy as np
+import pygame
+
+from layers import Background, Frame
+
+FRAMES = 3000
+BREAK_EVERY = 30
+WIDTH, HEIGHT = 800, 600
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BRICK_COLORS = [(255, 0, 0), (255, 165, 0), (255, 255, 0), (0, 255, 0), (0, 0, 255)]
+BOARDS = [("5 x 10 (game)", 80, 30, 5), ("20 x 40", 20, 10, 20)]  # name, brick width, height, rows
+
+
+def positions(frame):
+    # Where everything is on this frame (the same for both ways of drawing)
+    ball_x = 10 + (frame * 5) % (2 * (WIDTH - 20))
+    ball_y = 200 + (frame * 3) % (2 * (HEIGHT - 250))
+    ball = (WIDTH - 10 - abs(ball_x - (WIDTH - 10)), HEIGHT - 50 - abs(ball_y - (HEIGHT - 50)))
+    paddle = (350 + int(200 * np.sin(frame / 40)), HEIGHT - 40, 100, 20)
+    powerups = [(200, (frame * 2) % HEIGHT), (600, (frame * 2 + 300) % HEIGHT)]
+    return ball, paddle, powerups
+
+
+def draw_things(screen, font, frame):
+    ball, paddle, powerups = positions(frame)
+    drawn = [pygame.draw.rect(screen, WHITE, paddle),
+             pygame.draw.circle(screen, WHITE, ball, 10)]
+    for x, y in powerups:
+        drawn.append(pygame.draw.rect(screen, (0, 0, 255), (x, y, 20, 20)))
+    drawn.append(screen.blit(font.render(f"Lives: {3 - frame // 1000}", True, WHITE), (10, 10)))
+    return drawn
+
+
+def break_brick(bricks, frame):
+    if frame % BREAK_EVERY == 0:
+        if not bricks.any():
+            bricks[:] = True  # A new level
+        rows, cols = np.nonzero(bricks)
+        pick = (frame // BREAK_EVERY * 7) % len(rows)
+        bricks[rows[pick], cols[pick]] = False
+
+
+def time_full(screen, font, brick_width, brick_height, rows):
+    bricks = np.ones((rows, WIDTH // brick_width), dtype=bool)
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        break_brick(bricks, frame)
+        screen.fill(BLACK)
+        for row in range(len(bricks)):
+            for col in range(len(bricks[0])):
+                if bricks[row][col]:
+                    pygame.draw.rect(screen, BRICK_COLORS[row % len(BRICK_COLORS)],
+                                     (col * brick_width, row * brick_height, brick_width - 2, brick_height - 2))
+        draw_things(screen, font, frame)
+        pygame.display.flip()
+    return (time.perf_counter() - start) / FRAMES, WIDTH * HEIGHT
+
+
+def time_layers(screen, font, brick_width, brick_height, rows):
+    bricks = np.ones((rows, WIDTH // brick_width), dtype=bool)
+    background = Background(WIDTH, HEIGHT, brick_width, brick_height, BRICK_COLORS)
+    frame_drawer = Frame(screen, background)
+    pixels = 0
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        break_brick(bricks, frame)
+        background.sync(bricks)
+        frame_drawer.begin()
+        frame_drawer.add(draw_things(screen, font, frame))
+        pixels += sum(rect.width * rect.height for rect in frame_drawer.end())
+    return (time.perf_counter() - start) / FRAMES, pixels / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    font = pygame.font.Font(None, 36)
+    print(f"{'board':>14} {'full redraw':>12} {'layers':>10} {'speedup':>8} {'pixels sent':>21}")
+    for name, brick_width, brick_height, rows in BOARDS:
+        full, full_pixels = time_full(screen, font, brick_width, brick_height, rows)
+        layered, layered_pixels = time_layers(screen, font, brick_width, brick_height, rows)
+        print(f"{name:>14} {full * 1e3:9.3f} ms {layered * 1e3:7.3f} ms {full / layered:7.1f}x "
+              f"{full_pixels:>9,} -> {layered_pixels:>9,.0f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,318 +1,345 @@
 import pygame
 import random
+import numpy as np
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # So we can find arcade_common
+from arcade_common import synth  # The sound maker all the games share
+from arcade_common.game_loop import GameLoop, SEED  # The game loop all the games share (steady 60 ticks a second)
+from arcade_common import text  # Text pictures made once and reused (see arcade_common/text.py)
+from arcade_common.frame_timer import FrameTimer  # Where each frame's time goes (F3, see arcade_common/frame_timer.py)
+from physics import sweep_ball  # How the ball moves and bounces (see physics.py)
+from multiball import Multiball, CHAOS_BALLS  # Lots of extra balls at once (see multiball.py)
+from layers import Background, Frame  # Bricks drawn once, and only the changed parts sent to the screen (see layers.py)
 
-# Initialize Pygame
-# This line starts up Pygame, a library that helps us make games. Think of it as turning on the game engine!
-pygame.init()
-# This sets up the sound system so we can play beeps and boops later.
-pygame.mixer.init()
+def main():
+    # Everything from here on happens when the game starts: "python breakout.py", or picking
+    # it in the arcade launcher (arcade_common/launcher.py). Importing this file doesn't open a
+    # window or make a sound, so the launcher can load it quietly in the background.
+    # Initialize Pygame
+    # This line starts up Pygame, a library that helps us make games. Think of it as turning on the game engine!
+    pygame.init()
+    # This sets up the sound system so we can play beeps and boops later.
+    pygame.mixer.init()
 
-# Set up the display
-# We’re defining the size of our game window: 800 pixels wide and 600 pixels tall.
-WIDTH, HEIGHT = 800, 600
-# This creates the actual window where the game will happen.
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-# Sets the title at the top of the window to "Breakout" – cool, right?
-pygame.display.set_caption("Breakout")
+    # Set up the display
+    # We’re defining the size of our game window: 800 pixels wide and 600 pixels tall.
+    WIDTH, HEIGHT = 800, 600
+    # This creates the actual window where the game will happen.
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    # Sets the title at the top of the window to "Breakout" – cool, right?
+    pygame.display.set_caption("Breakout")
 
-# Colors
-# Colors in Pygame use RGB values (red, green, blue), where each ranges from 0 to 255.
-# WHITE is full brightness of all colors, BLACK is none, and so on.
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-ORANGE = (255, 165, 0)
-YELLOW = (255, 255, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-PURPLE = (128, 0, 128)
-# A list of colors for our bricks – each row will cycle through these.
-BRICK_COLORS = [RED, ORANGE, YELLOW, GREEN, BLUE]
+    # Colors
+    # Colors in Pygame use RGB values (red, green, blue), where each ranges from 0 to 255.
+    # WHITE is full brightness of all colors, BLACK is none, and so on.
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+    RED = (255, 0, 0)
+    ORANGE = (255, 165, 0)
+    YELLOW = (255, 255, 0)
+    GREEN = (0, 255, 0)
+    BLUE = (0, 0, 255)
+    PURPLE = (128, 0, 128)
+    # A list of colors for our bricks – each row will cycle through these.
+    BRICK_COLORS = [RED, ORANGE, YELLOW, GREEN, BLUE]
 
-# Game objects
-# Paddle (the thing you move to bounce the ball)
-# Starting position: centered horizontally (WIDTH // 2 - 50) and 40 pixels from the bottom.
-paddle_x, paddle_y = WIDTH // 2 - 50, HEIGHT - 40
-# Size of the paddle: 100 pixels wide and 20 pixels tall.
-paddle_width, paddle_height = 100, 20
-# How fast the paddle moves normally – 5 pixels per frame.
-base_paddle_speed = 5
-# Current speed, starts the same as the base but can change with power-ups.
-paddle_speed = base_paddle_speed
-# Normal width of the paddle, which might grow with a power-up.
-base_paddle_width = 100
+    # Game objects
+    # Paddle (the thing you move to bounce the ball)
+    # Starting position: centered horizontally (WIDTH // 2 - 50) and 40 pixels from the bottom.
+    paddle_x, paddle_y = WIDTH // 2 - 50, HEIGHT - 40
+    # Size of the paddle: 100 pixels wide and 20 pixels tall.
+    paddle_width, paddle_height = 100, 20
+    # How fast the paddle moves normally – 5 pixels per frame.
+    base_paddle_speed = 5
+    # Current speed, starts the same as the base but can change with power-ups.
+    paddle_speed = base_paddle_speed
+    # Normal width of the paddle, which might grow with a power-up.
+    base_paddle_width = 100
 
-# Ball
-# Starting position: smack in the middle of the screen.
-ball_x, ball_y = WIDTH // 2, HEIGHT // 2
-# The ball is a circle, and this is its radius (how big it is).
-ball_radius = 10
-# Speed in x and y directions – starts at 0, we’ll set it later when the game begins.
-ball_vx, ball_vy = 0, 0
-# Normal speed of the ball when it moves.
-base_ball_speed = 4
+    # Ball
+    # Starting position: smack in the middle of the screen.
+    ball_x, ball_y = WIDTH // 2, HEIGHT // 2
+    # The ball is a circle, and this is its radius (how big it is).
+    ball_radius = 10
+    # Speed in x and y directions – starts at 0, we’ll set it later when the game begins.
+    ball_vx, ball_vy = 0, 0
+    # Normal speed of the ball when it moves.
+    base_ball_speed = 5  # (It can't skip through bricks any more, so it can go faster)
 
-# Bricks
-# Each brick is 80 pixels wide and 30 pixels tall.
-brick_width, brick_height = 80, 30
-# Creates a grid of bricks: 5 rows, and each row has as many bricks as fit across the screen.
-# '1' means the brick is there, '0' would mean it’s gone (we’ll change that later).
-bricks = [[1 for _ in range(WIDTH // brick_width)] for _ in range(5)]
+    # Bricks
+    # Each brick is 80 pixels wide and 30 pixels tall.
+    brick_width, brick_height = 80, 30
+    # Creates a grid of bricks: 5 rows, and each row has as many bricks as fit across the screen.
+    # It's a NumPy array: True means the brick is there, False means it’s gone (we’ll change that later).
+    bricks = np.ones((5, WIDTH // brick_width), dtype=bool)
 
-# Power-ups
-# Power-ups are little bonuses that fall from bricks – they’re 20 pixels big.
-powerup_size = 20
-# How fast they fall down the screen – 2 pixels per frame.
-powerup_speed = 2
-# A list to keep track of all power-ups: each one has [x position, y position, type, timer].
-powerups = []  # Starts empty!
-# How long power-up effects last: 600 frames is about 10 seconds at 60 frames per second.
-powerup_duration = 600
+    # Power-ups
+    # Power-ups are little bonuses that fall from bricks – they’re 20 pixels big.
+    powerup_size = 20
+    # How fast they fall down the screen – 2 pixels per frame.
+    powerup_speed = 2
+    # A list to keep track of all power-ups: each one has [x position, y position, type, timer].
+    powerups = []  # Starts empty!
+    # How long power-up effects last: 600 frames is about 10 seconds at 60 frames per second.
+    powerup_duration = 600
 
-# Game state
-# You start with 3 lives – lose them all, and it’s game over!
-lives = 3
-# Sets up a font for showing text like "Lives: 3" on the screen.
-font = pygame.font.Font(None, 36)
-# Tracks if the game is over (False means we’re still playing).
-game_over = False
-# Checks if the ball is moving yet – it won’t until you press Space.
-ball_moving = False
-# Timers for power-ups: these count down how long the effects last.
-faster_paddle_timer = 0  # For faster paddle movement.
-wider_paddle_timer = 0   # For a wider paddle.
-# Whether we show the help menu (HUD) – starts as visible.
-hud_visible = True
+    # Multiball chaos
+    # The extra balls from the Multiball Chaos power-up. They break bricks but they're not the
+    # real ball: losing them doesn't cost a life.
+    chaos_balls = Multiball(seed=SEED)  # (SEED is None - different every game - unless ARCADE_SEED is set)
+    # The same goes for which bricks drop power-ups. They get their own random numbers (not the
+    # random module's shared ones), so they don't change anything else running in the launcher.
+    rng = random.Random(SEED)
+    chaos_radius = chaos_balls.radius
+    # A ready-made picture of a chaos ball - copying a picture is quicker than drawing a circle,
+    # and there might be thousands of them.
+    chaos_image = pygame.Surface((chaos_radius * 2, chaos_radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(chaos_image, YELLOW, (chaos_radius, chaos_radius), chaos_radius)
+    # Stress mode: ARCADE_STRESS_BALLS=2000 keeps that many chaos balls going all the time (the
+    # bricks come back whenever they're all gone). Handy for seeing how fast the game really is.
+    stress_balls = int(os.environ.get("ARCADE_STRESS_BALLS", "0"))
 
-# Sound effects
-# A little function to make beepy sounds for the game – like retro arcade vibes!
-def create_beep_sound(frequency, duration=100):
-    sample_rate = 44100  # How fast we sample the sound (standard for audio).
-    samples = int(sample_rate * duration / 1000)  # How many sound samples to make.
-    buffer = bytearray()  # A place to store the sound data.
-    for i in range(samples):
-        # This math makes a simple square wave sound – high or low based on frequency.
-        value = int(127 * (1 + (i * frequency % sample_rate > sample_rate // 2) - 0.5))
-        buffer.append(value)
-    return pygame.mixer.Sound(buffer)  # Turns it into a sound Pygame can play.
+    # Game state
+    # You start with 3 lives – lose them all, and it’s game over!
+    lives = 3
+    # Sets up a font for showing text like "Lives: 3" on the screen.
+    font = text.font(36)  # (The fonts are shared, see arcade_common/text.py)
+    # Tracks if the game is over (False means we’re still playing).
+    game_over = False
+    # Checks if the ball is moving yet – it won’t until you press Space.
+    ball_moving = False
+    # Timers for power-ups: these count down how long the effects last.
+    faster_paddle_timer = 0  # For faster paddle movement.
+    wider_paddle_timer = 0   # For a wider paddle.
+    # Whether we show the help menu (HUD) – starts as visible.
+    hud_visible = True
 
-# Making sounds for different actions in the game.
-paddle_sound = create_beep_sound(800, 100)  # High beep for paddle hits.
-brick_sound = create_beep_sound(200, 150)   # Lower beep for breaking bricks.
-life_sound = create_beep_sound(300, 200)    # Sad beep for losing a life.
-powerup_sound = create_beep_sound(1000, 150)  # Exciting beep for power-ups!
-# Turn the volume down a bit so it’s not too loud – 30% of max.
-for sound in [paddle_sound, brick_sound, life_sound, powerup_sound]:
-    sound.set_volume(0.3)
+    # Sound effects
+    # Making sounds for different actions in the game – retro square wave beeps from the shared
+    # synth (pitch, then how many seconds it lasts).
+    paddle_sound = synth.tone(800, 0.1, volume=0.5)  # High beep for paddle hits.
+    brick_sound = synth.tone(200, 0.15, volume=0.5)  # Lower beep for breaking bricks.
+    life_sound = synth.tone(300, 0.2, volume=0.5)    # Sad beep for losing a life.
+    powerup_sound = synth.tone(1000, 0.15, volume=0.5)  # Exciting beep for power-ups!
+    # Turn the volume down a bit so it’s not too loud – 30% of max.
+    for sound in [paddle_sound, brick_sound, life_sound, powerup_sound]:
+        sound.set_volume(0.3)
 
-# Draw power-ups with different shapes so you know what they do!
-def draw_powerup(x, y, powerup_type):
-    if powerup_type == 0:  # Extra Life – a green circle.
-        pygame.draw.circle(screen, GREEN, (int(x + powerup_size // 2), int(y + powerup_size // 2)), powerup_size // 2)
-    elif powerup_type == 1:  # Faster Paddle – a blue square.
-        pygame.draw.rect(screen, BLUE, (x, y, powerup_size, powerup_size))
-    elif powerup_type == 2:  # Wider Paddle – a purple triangle.
-        points = [(x + powerup_size // 2, y), (x, y + powerup_size), (x + powerup_size, y + powerup_size)]
-        pygame.draw.polygon(screen, PURPLE, points)
+    # Draw power-ups with different shapes so you know what they do!
+    def draw_powerup(x, y, powerup_type, surface=screen):
+        if powerup_type == 0:  # Extra Life – a green circle.
+            pygame.draw.circle(surface, GREEN, (int(x + powerup_size // 2), int(y + powerup_size // 2)), powerup_size // 2)
+        elif powerup_type == 1:  # Faster Paddle – a blue square.
+            pygame.draw.rect(surface, BLUE, (x, y, powerup_size, powerup_size))
+        elif powerup_type == 2:  # Wider Paddle – a purple triangle.
+            points = [(x + powerup_size // 2, y), (x, y + powerup_size), (x + powerup_size, y + powerup_size)]
+            pygame.draw.polygon(surface, PURPLE, points)
+        elif powerup_type == 3:  # Multiball Chaos – a bunch of little yellow balls.
+            for dx, dy in [(5, 5), (15, 5), (10, 14)]:
+                pygame.draw.circle(surface, YELLOW, (int(x + dx), int(y + dy)), 5)
+        return pygame.Rect(x, y, powerup_size + 1, powerup_size + 1)  # The spot it covers (the triangle pokes out 1 pixel)
 
-# Game loop
-# This keeps the game running at 60 frames per second – like a heartbeat for the game!
-clock = pygame.time.Clock()
-# A flag to keep the game going – when it’s False, the game stops.
-running = True
+    # Heads-Up Display (HUD) – a little help menu! It never moves, so it's drawn onto the
+    # background with the bricks (see below), not onto the screen every frame.
+    def draw_help(surface):
+        hud_x = WIDTH - 280  # Bottom-right corner: 520 pixels from left.
+        hud_y = HEIGHT - 200  # 400 pixels from top.
+        # A hint to start the game.
+        surface.blit(text.render(font, "Press Space to start", WHITE), (hud_x - 50, hud_y - 100))
+        # Tell them how to hide this.
+        surface.blit(text.render(font, "Press Enter to remove this list", WHITE), (hud_x - 100, hud_y - 60))
+        # Title of the HUD.
+        surface.blit(text.render(font, "Powerups:", WHITE), (hud_x, hud_y))
+        # List all power-ups with their shapes.
+        powerup_descriptions = ["Extra Life", "Faster Paddle", "Wider Paddle", "Multiball Chaos"]
+        for i in range(4):
+            draw_powerup(hud_x, hud_y + (i + 1) * 40, i, surface)  # Draw the shape.
+            text_surface = text.render(font, powerup_descriptions[i], WHITE)
+            surface.blit(text_surface, (hud_x + 30, hud_y + (i + 1) * 40))  # Name next to it.
+        # Reminder to hide it.
+        surface.blit(text.render(font, "Press Enter to remove this HUD", WHITE), (hud_x, hud_y + 5 * 40))
+
+    # The background: black, the bricks and the help list, drawn once and only touched up when
+    # a brick breaks (or the bricks all come back). frame keeps track of what's drawn on top.
+    background = Background(WIDTH, HEIGHT, brick_width, brick_height, BRICK_COLORS)
+    frame = Frame(screen, background)
+
+    # Game loop
+    # This keeps the game running at 60 ticks per second – like a heartbeat for the game!
+    loop = GameLoop()
+    timer = FrameTimer()  # Press F3 to see where each frame's time goes
+    # A flag to keep the game going – when it’s False, the game stops.
+    running = True
+
+    while running and not loop.finished:
+        # Event handling – checking what the player does!
+        for event in pygame.event.get():
+            timer.handle(event)
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):  # Clicking the window’s X button (or Esc)?
+                running = False  # Stop the game.
+            if event.type == pygame.KEYDOWN:  # A key was pressed!
+                if event.key == pygame.K_SPACE and not game_over and not ball_moving:
+                    # Press Space to start the ball moving if the game’s not over and it’s still.
+                    ball_vx, ball_vy = base_ball_speed, -base_ball_speed  # Moves right and up!
+                    ball_moving = True
+                if event.key == pygame.K_r and game_over:
+                    # Press R to reset everything after a game over.
+                    paddle_x = WIDTH // 2 - 50  # Paddle back to center.
+                    paddle_width = base_paddle_width  # Normal size again.
+                    paddle_speed = base_paddle_speed  # Normal speed.
+                    ball_x, ball_y = WIDTH // 2, HEIGHT // 2  # Ball to center.
+                    ball_vx, ball_vy = 0, 0  # Ball stops moving.
+                    ball_moving = False
+                    bricks = np.ones((5, WIDTH // brick_width), dtype=bool)  # All bricks back!
+                    chaos_balls.clear()  # No extra balls.
+                    powerups = []  # No power-ups.
+                    faster_paddle_timer = 0  # Reset timers.
+                    wider_paddle_timer = 0
+                    lives = 3  # Back to 3 lives.
+                    game_over = False  # Game on again!
+                if event.key == pygame.K_RETURN:
+                    # Press Enter to hide the help menu (HUD).
+                    hud_visible = False
 
-while running:
-    # Event handling – checking what the player does!
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:  # Clicking the window’s X button?
-            running = False  # Stop the game.
-        if event.type == pygame.KEYDOWN:  # A key was pressed!
-            if event.key == pygame.K_SPACE and not game_over and not ball_moving:
-                # Press Space to start the ball moving if the game’s not over and it’s still.
-                ball_vx, ball_vy = base_ball_speed, -base_ball_speed  # Moves right and up!
-                ball_moving = True
-            if event.key == pygame.K_r and game_over:
-                # Press R to reset everything after a game over.
-                paddle_x = WIDTH // 2 - 50  # Paddle back to center.
-                paddle_width = base_paddle_width  # Normal size again.
-                paddle_speed = base_paddle_speed  # Normal speed.
-                ball_x, ball_y = WIDTH // 2, HEIGHT // 2  # Ball to center.
-                ball_vx, ball_vy = 0, 0  # Ball stops moving.
-                ball_moving = False
-                bricks = [[1 for _ in range(WIDTH // brick_width)] for _ in range(5)]  # All bricks back!
-                powerups = []  # No power-ups.
-                faster_paddle_timer = 0  # Reset timers.
-                wider_paddle_timer = 0
-                lives = 3  # Back to 3 lives.
-                game_over = False  # Game on again!
-            if event.key == pygame.K_RETURN:
-                # Press Enter to hide the help menu (HUD).
-                hud_visible = False
+        timer.mark("input")
 
-    # Paddle movement
-    if not game_over:  # Only move if the game’s still going!
-        keys = pygame.key.get_pressed()  # Check which keys are being held down.
-        if keys[pygame.K_LEFT] and paddle_x > 0:  # Left arrow pressed and not at edge?
-            paddle_x -= paddle_speed  # Move left!
-        if keys[pygame.K_RIGHT] and paddle_x < WIDTH - paddle_width:  # Right arrow and not at edge?
-            paddle_x += paddle_speed  # Move right!
+        for _ in timer.wait(loop.ticks_due()):  # Move the game forward by however many ticks are due (usually 1)
+            # Paddle movement
+            if not game_over:  # Only move if the game’s still going!
+                keys = pygame.key.get_pressed()  # Check which keys are being held down.
+                if keys[pygame.K_LEFT] and paddle_x > 0:  # Left arrow pressed and not at edge?
+                    paddle_x -= paddle_speed  # Move left!
+                if keys[pygame.K_RIGHT] and paddle_x < WIDTH - paddle_width:  # Right arrow and not at edge?
+                    paddle_x += paddle_speed  # Move right!
 
-    # Ball movement and collision
-    if ball_moving and not game_over:  # Ball only moves if it’s started and game’s on.
-        next_ball_x = ball_x + ball_vx  # Where the ball will be next in x.
-        next_ball_y = ball_y + ball_vy  # And in y.
+            timer.mark("update")
 
-        # Brick collision – let’s smash some bricks!
-        brick_hit = False
-        for row in range(len(bricks)):  # Check each row.
-            for col in range(len(bricks[0])):  # Check each brick in the row.
-                if bricks[row][col]:  # If the brick is still there (1, not 0)...
-                    # Figure out the brick’s edges.
-                    brick_left = col * brick_width
-                    brick_right = brick_left + brick_width
-                    brick_top = row * brick_height
-                    brick_bottom = brick_top + brick_height
-                    # Does the ball hit the brick?
-                    if (next_ball_x - ball_radius < brick_right and
-                        next_ball_x + ball_radius > brick_left and
-                        next_ball_y - ball_radius < brick_bottom and
-                        next_ball_y + ball_radius > brick_top):
-                        bricks[row][col] = 0  # Brick goes bye-bye!
-                        # Figure out which side we hit to bounce properly.
-                        prev_x, prev_y = ball_x, ball_y  # Where the ball was before.
-                        if prev_y + ball_radius <= brick_top and next_ball_y + ball_radius > brick_top:
-                            ball_vy *= -1  # Hit the top – bounce down.
-                            next_ball_y = brick_top - ball_radius
-                        elif prev_y - ball_radius >= brick_bottom and next_ball_y - ball_radius < brick_bottom:
-                            ball_vy *= -1  # Hit the bottom – bounce up.
-                            next_ball_y = brick_bottom + ball_radius
-                        elif prev_x + ball_radius <= brick_left:
-                            ball_vx *= -1  # Hit the left – bounce right.
-                            next_ball_x = brick_left - ball_radius
-                        elif prev_x - ball_radius >= brick_right:
-                            ball_vx *= -1  # Hit the right – bounce left.
-                            next_ball_x = brick_right + ball_radius
+            # Ball movement and collision
+            if ball_moving and not game_over:  # Ball only moves if it’s started and game’s on.
+                # Follow the ball's whole path this tick and bounce off whatever it touches first -
+                # bricks, walls, the paddle - even several times (see physics.py). A fast ball
+                # can't slip through a brick or the paddle any more.
+                ball_x, ball_y, ball_vx, ball_vy, hits = sweep_ball(
+                    ball_x, ball_y, ball_vx, ball_vy, ball_radius, bricks, brick_width, brick_height,
+                    (paddle_x, paddle_y, paddle_width, paddle_height), WIDTH)
+                for hit in hits:
+                    if hit[0] == "brick":  # A brick goes bye-bye! (sweep_ball already took it away)
+                        row, col = hit[1], hit[2]
                         pygame.mixer.Sound.play(brick_sound)  # Play that satisfying brick-breaking sound!
-                        if random.random() < 0.3:  # 30% chance for a power-up to drop.
-                            powerup_type = random.randint(0, 2)  # Pick one: 0, 1, or 2.
-                            powerups.append([brick_left + brick_width // 2 - powerup_size // 2,
-                                            brick_top, powerup_type, 0])  # Add it where the brick was.
-                        brick_hit = True
-                        break  # Stop checking this row.
-            if brick_hit:
-                break  # Stop checking all bricks.
+                        if rng.random() < 0.3:  # 30% chance for a power-up to drop.
+                            powerup_type = rng.randint(0, 3)  # Pick one: 0, 1, 2 or 3.
+                            powerups.append([col * brick_width + brick_width // 2 - powerup_size // 2,
+                                             row * brick_height, powerup_type, 0])  # Add it where the brick was.
+                    elif hit[0] == "paddle":
+                        pygame.mixer.Sound.play(paddle_sound)  # Boop!
 
-        # Wall and paddle collision – keep that ball in play!
-        if not brick_hit:  # Only check this if we didn’t hit a brick.
-            if next_ball_x - ball_radius < 0:  # Hit left wall?
-                ball_vx *= -1  # Bounce right.
-                next_ball_x = ball_radius
-            elif next_ball_x + ball_radius > WIDTH:  # Hit right wall?
-                ball_vx *= -1  # Bounce left.
-                next_ball_x = WIDTH - ball_radius
-            if next_ball_y - ball_radius < 0:  # Hit top?
-                ball_vy *= -1  # Bounce down.
-                next_ball_y = ball_radius
-            elif (next_ball_y + ball_radius > paddle_y and
-                  paddle_x < next_ball_x < paddle_x + paddle_width):  # Hit the paddle?
-                ball_vy *= -1  # Bounce up!
-                # Add a little spin based on where it hits the paddle.
-                ball_vx += (next_ball_x - (paddle_x + paddle_width / 2)) * 0.1
-                next_ball_y = paddle_y - ball_radius - 1  # Keep it above the paddle.
-                pygame.mixer.Sound.play(paddle_sound)  # Boop!
+            # Multiball chaos – every extra ball moves and bounces in one go (see multiball.py)
+            if not game_over:
+                if stress_balls:
+                    if not bricks.any():
+                        bricks[:] = True  # Stress mode: the bricks come right back
+                    if len(chaos_balls) < stress_balls:  # Top the balls back up, anywhere below the bricks
+                        missing = stress_balls - len(chaos_balls)
+                        chaos_balls.spawn(missing, chaos_balls.rng.uniform(chaos_radius, WIDTH - chaos_radius, missing),
+                                          chaos_balls.rng.uniform(len(bricks) * brick_height + 20, paddle_y - 20, missing))
+                if len(chaos_balls):
+                    broken, paddle_hits = chaos_balls.step(bricks, brick_width, brick_height,
+                                                           (paddle_x, paddle_y, paddle_width, paddle_height), WIDTH, HEIGHT)
+                    if broken:  # (Only the real ball's bricks drop power-ups - or chaos would make more chaos!)
+                        pygame.mixer.Sound.play(brick_sound)  # One crash for the lot, not one per brick
+                    if paddle_hits:
+                        pygame.mixer.Sound.play(paddle_sound)
 
-        # Bottom boundary – oops, missed it!
-        if next_ball_y + ball_radius > HEIGHT:
-            lives -= 1  # Lose a life.
-            pygame.mixer.Sound.play(life_sound)  # Sad beep.
-            ball_x, ball_y = WIDTH // 2, HEIGHT // 2  # Ball back to center.
-            ball_vx, ball_vy = 0, 0  # Stop moving.
-            ball_moving = False
-            if lives <= 0:  # No lives left?
-                game_over = True  # Game over, man!
-        else:
-            ball_x, ball_y = next_ball_x, next_ball_y  # Update ball position.
+                # Bottom boundary – oops, missed it!
+                if ball_y + ball_radius > HEIGHT:
+                    lives -= 1  # Lose a life.
+                    pygame.mixer.Sound.play(life_sound)  # Sad beep.
+                    ball_x, ball_y = WIDTH // 2, HEIGHT // 2  # Ball back to center.
+                    ball_vx, ball_vy = 0, 0  # Stop moving.
+                    ball_moving = False
+                    if lives <= 0:  # No lives left?
+                        game_over = True  # Game over, man!
 
-    # Power-up updates – catch those goodies!
-    if not game_over:
-        for powerup in powerups[:]:  # Copy the list so we can remove items safely.
-            powerup[1] += powerup_speed  # Move it down.
-            if powerup[1] > HEIGHT:  # Off the screen?
-                powerups.remove(powerup)  # Bye-bye!
-            elif (paddle_x < powerup[0] + powerup_size and
-                  paddle_x + paddle_width > powerup[0] and
-                  paddle_y < powerup[1] + powerup_size and
-                  paddle_y + paddle_height > powerup[1]):  # Paddle catches it?
-                if powerup[2] == 0:  # Extra Life.
-                    lives += 1  # Woohoo, another chance!
-                elif powerup[2] == 1:  # Faster Paddle.
-                    paddle_speed = base_paddle_speed * 2  # Zoom zoom!
-                    faster_paddle_timer = powerup_duration  # Lasts for a while.
-                elif powerup[2] == 2:  # Wider Paddle.
-                    paddle_width = 150  # Big paddle power!
-                    wider_paddle_timer = powerup_duration  # Also lasts a bit.
-                powerups.remove(powerup)  # Remove it after catching.
-                pygame.mixer.Sound.play(powerup_sound)  # Happy beep!
+            timer.mark("collision")  # (The ball and the chaos balls are nearly all bouncing)
 
-    # Power-up timers – counting down the fun!
-    if faster_paddle_timer > 0:
-        faster_paddle_timer -= 1  # Tick down.
-        if faster_paddle_timer <= 0:  # Time’s up?
-            paddle_speed = base_paddle_speed  # Back to normal speed.
-    if wider_paddle_timer > 0:
-        wider_paddle_timer -= 1
-        if wider_paddle_timer <= 0:  # Done?
-            paddle_width = base_paddle_width  # Back to normal size.
+            # Power-up updates – catch those goodies!
+            if not game_over:
+                for powerup in powerups[:]:  # Copy the list so we can remove items safely.
+                    powerup[1] += powerup_speed  # Move it down.
+                    if powerup[1] > HEIGHT:  # Off the screen?
+                        powerups.remove(powerup)  # Bye-bye!
+                    elif (paddle_x < powerup[0] + powerup_size and
+                          paddle_x + paddle_width > powerup[0] and
+                          paddle_y < powerup[1] + powerup_size and
+                          paddle_y + paddle_height > powerup[1]):  # Paddle catches it?
+                        if powerup[2] == 0:  # Extra Life.
+                            lives += 1  # Woohoo, another chance!
+                        elif powerup[2] == 1:  # Faster Paddle.
+                            paddle_speed = base_paddle_speed * 2  # Zoom zoom!
+                            faster_paddle_timer = powerup_duration  # Lasts for a while.
+                        elif powerup[2] == 2:  # Wider Paddle.
+                            paddle_width = 150  # Big paddle power!
+                            wider_paddle_timer = powerup_duration  # Also lasts a bit.
+                        elif powerup[2] == 3:  # Multiball Chaos.
+                            chaos_balls.spawn(CHAOS_BALLS, paddle_x + paddle_width / 2, paddle_y - chaos_radius)  # Balls everywhere!
+                        powerups.remove(powerup)  # Remove it after catching.
+                        pygame.mixer.Sound.play(powerup_sound)  # Happy beep!
 
-    # Drawing – let’s make it look awesome!
-    screen.fill(BLACK)  # Clear the screen with black.
-    pygame.draw.rect(screen, WHITE, (paddle_x, paddle_y, paddle_width, paddle_height))  # Draw the paddle.
-    pygame.draw.circle(screen, WHITE, (int(ball_x), int(ball_y)), ball_radius)  # Draw the ball.
-    for row in range(len(bricks)):  # Draw all the bricks.
-        for col in range(len(bricks[0])):
-            if bricks[row][col]:  # If the brick’s still there...
-                # Use the color from our list, cycling with %.
-                pygame.draw.rect(screen, BRICK_COLORS[row % len(BRICK_COLORS)],
-                                 (col * brick_width, row * brick_height, brick_width - 2, brick_height - 2))
-    for powerup in powerups:  # Draw any falling power-ups.
-        draw_powerup(powerup[0], powerup[1], powerup[2])
+            # Power-up timers – counting down the fun!
+            if faster_paddle_timer > 0:
+                faster_paddle_timer -= 1  # Tick down.
+                if faster_paddle_timer <= 0:  # Time’s up?
+                    paddle_speed = base_paddle_speed  # Back to normal speed.
+            if wider_paddle_timer > 0:
+                wider_paddle_timer -= 1
+                if wider_paddle_timer <= 0:  # Done?
+                    paddle_width = base_paddle_width  # Back to normal size.
+            timer.mark("update")
 
-    # UI – show some info on the screen!
-    lives_text = font.render(f"Lives: {max(0, lives)}", True, WHITE)  # Show lives (never negative).
-    screen.blit(lives_text, (10, 10))  # Put it in the top-left corner.
-    if faster_paddle_timer > 0:  # Got the faster paddle power-up?
-        timer_text = font.render(f"Faster Paddle: {faster_paddle_timer // 60}s", True, WHITE)
-        screen.blit(timer_text, (10, 40))  # Show how many seconds left.
-    if wider_paddle_timer > 0:  # Wider paddle active?
-        offset = 70 if faster_paddle_timer > 0 else 40  # Move it down if both are active.
-        timer_text = font.render(f"Wider Paddle: {wider_paddle_timer // 60}s", True, WHITE)
-        screen.blit(timer_text, (10, offset))
+        if loop.render:  # Skip drawing when there's no screen (see arcade_common/game_loop.py)
+            # Drawing – let’s make it look awesome!
+            # The bricks and help list are already on the background; catch it up with any bricks
+            # that broke, then rub out last frame's moving things (see layers.py).
+            background.sync(bricks, draw_help if hud_visible else None)
+            frame.begin()
+            frame.add(pygame.draw.rect(screen, WHITE, (paddle_x, paddle_y, paddle_width, paddle_height)))  # Draw the paddle.
+            frame.add(pygame.draw.circle(screen, WHITE, (int(ball_x), int(ball_y)), ball_radius))  # Draw the ball.
+            if len(chaos_balls):  # All the chaos balls, with one blits() call instead of one call each.
+                corners = zip((chaos_balls.x - chaos_radius).astype(int).tolist(),
+                              (chaos_balls.y - chaos_radius).astype(int).tolist())
+                frame.add(screen.blits([(chaos_image, corner) for corner in corners]))
+            for powerup in powerups:  # Draw any falling power-ups.
+                frame.add(draw_powerup(powerup[0], powerup[1], powerup[2]))
 
-    # Heads-Up Display (HUD) – a little help menu!
-    if hud_visible:  # Only show if we haven’t hidden it.
-        hud_x = WIDTH - 280  # Bottom-right corner: 520 pixels from left.
-        hud_y = HEIGHT - 160  # 440 pixels from top.
-        # A hint to start the game.
-        screen.blit(font.render("Press Space to start", True, WHITE), (hud_x - 50, hud_y - 100))
-        # Tell them how to hide this.
-        screen.blit(font.render("Press Enter to remove this list", True, WHITE), (hud_x - 100, hud_y - 60))
-        # Title of the HUD.
-        screen.blit(font.render("Powerups:", True, WHITE), (hud_x, hud_y))
-        # List all power-ups with their shapes.
-        powerup_descriptions = ["Extra Life", "Faster Paddle", "Wider Paddle"]
-        for i in range(3):
-            draw_powerup(hud_x, hud_y + (i + 1) * 40, i)  # Draw the shape.
-            text_surface = font.render(powerup_descriptions[i], True, WHITE)
-            screen.blit(text_surface, (hud_x + 30, hud_y + (i + 1) * 40))  # Name next to it.
-        # Reminder to hide it.
-        screen.blit(font.render("Press Enter to remove this HUD", True, WHITE), (hud_x, hud_y + 4 * 40))
+            # UI – show some info on the screen!
+            # The words are drawn once and kept; the numbers are put together from ready-made digits.
+            frame.add(text.draw(screen, font, WHITE, (10, 10), "Lives: ", max(0, lives)))  # Show lives (never negative), top-left.
+            if faster_paddle_timer > 0:  # Got the faster paddle power-up?
+                frame.add(text.draw(screen, font, WHITE, (10, 40), "Faster Paddle: ", faster_paddle_timer // 60, "s"))  # Seconds left.
+            if wider_paddle_timer > 0:  # Wider paddle active?
+                offset = 70 if faster_paddle_timer > 0 else 40  # Move it down if both are active.
+                frame.add(text.draw(screen, font, WHITE, (10, offset), "Wider Paddle: ", wider_paddle_timer // 60, "s"))
+
+            if game_over:  # Game over screen.
+                game_over_text = text.render(font, "Game Over! Press R to Restart", WHITE)
+                frame.add(screen.blit(game_over_text, (WIDTH // 2 - 150, HEIGHT // 2)))  # Center it.
+
+            overlay = timer.draw(screen)  # The frame timer's numbers (only when it's on)
+            if overlay:
+                frame.add(overlay)  # (So it gets sent to the screen, and rubbed out next frame)
+            timer.mark("render")
+            frame.end()  # Send just the parts that changed to the screen!
+            timer.mark("flip")
 
-    if game_over:  # Game over screen.
-        game_over_text = font.render("Game Over! Press R to Restart", True, WHITE)
-        screen.blit(game_over_text, (WIDTH // 2 - 150, HEIGHT // 2))  # Center it.
+        timer.count("chaos balls", len(chaos_balls))
+        timer.count("power-ups", len(powerups))
+        timer.count("bricks", int(bricks.sum()))
+        timer.end()
+    timer.close()
 
-    pygame.display.flip()  # Update the screen with everything we drew!
-    clock.tick(60)  # Keep the game running at 60 frames per second.
 
-# When the loop ends (game closed), shut down Pygame nicely.
-pygame.quit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
+    # When the loop ends (game closed), shut down Pygame nicely.
+    pygame.quit()
\ No newline at end of file
@@ -0,0 +1,100 @@
+# Drawing Breakout without redrawing everything every frame.
+# The bricks hardly ever change - only when one breaks - so they're drawn once onto a
+# picture of their own (the background), and a broken brick just gets painted over with
+# black. Every frame we only:
+#   1. rub out last frame's ball, paddle, power-ups and numbers, by copying the background
+#      back over just those spots
+#   2. draw them again where they are now
+#   3. tell pygame to send only the rectangles that changed to the screen (the "dirty
+#      rectangles"), instead of the whole 800x600 window
+# (tetris.py does the same with its landed pieces.)
+#
+#     background = Background(WIDTH, HEIGHT, brick_width, brick_height, BRICK_COLORS)
+#     background.sync(bricks)            # Catch up with the brick grid: paint over broken
+#                                        # bricks, or redraw it all for a new level
+#     frame = Frame(screen, background)
+#     frame.begin()                      # Step 1
+#     frame.add(pygame.draw.rect(screen, WHITE, paddle))  # Step 2 - add() everything you draw
+#     frame.end()                        # Step 3
+import numpy as np
+import pygame
+
+MAX_DIRTY_RECTS = 200  # More little rectangles than this? Sending the whole screen is quicker
+BLACK = (0, 0, 0)
+
+
+class Background:
+    # Black, the bricks, and anything else that sits still (like the help list)
+    def __init__(self, width, height, brick_width, brick_height, colors):
+        self.surface = pygame.Surface((width, height)).convert()
+        self.brick_width, self.brick_height = brick_width, brick_height
+        self.colors = colors
+        self.dirty = []      # Parts that changed and still need copying to the screen
+        self.shown = None    # The bricks as they are in the picture right now
+        self.extras = None
+
+    def sync(self, bricks, extras=None):
+        # Make the picture match the brick grid (a NumPy array of True/False). Bricks that
+        # broke since last time are painted over; if bricks came BACK (a new level), or the
+        # extras changed, it's all drawn again. extras(surface) draws more still things.
+        if self.shown is None or (bricks & ~self.shown).any() or extras is not self.extras:
+            self.rebuild(bricks, extras)
+        else:
+            for row, col in np.argwhere(self.shown & ~bricks).tolist():
+                self.remove_brick(row, col)
+        self.shown = bricks.copy()
+
+    def brick_rect(self, row, col):
+        # The spot a brick covers (its whole cell, including the little gap around it)
+        return pygame.Rect(col * self.brick_width, row * self.brick_height, self.brick_width, self.brick_height)
+
+    def rebuild(self, bricks, extras=None):
+        # Draw it all from scratch
+        self.surface.fill(BLACK)
+        for row, col in zip(*bricks.nonzero()):
+            # Use the color from the list, cycling with %, leaving a 2 pixel gap
+            pygame.draw.rect(self.surface, self.colors[row % len(self.colors)],
+                             (col * self.brick_width, row * self.brick_height,
+                              self.brick_width - 2, self.brick_height - 2))
+        if extras:
+            extras(self.surface)
+        self.extras = extras
+        self.dirty.append(self.surface.get_rect())
+
+    def remove_brick(self, row, col):
+        rect = self.brick_rect(row, col)
+        self.surface.fill(BLACK, rect)
+        self.dirty.append(rect)
+
+
+class Frame:
+    # Keeps track of what was drawn on the screen, so the next frame can rub it out
+    def __init__(self, screen, background):
+        self.screen = screen
+        self.background = background
+        self.drawn = []  # What we drew on top of the background last frame
+        self.dirty = []  # What changed this frame
+
+    def begin(self):
+        # Copy the background back over last frame's things, and over any bricks that broke
+        rects = self.drawn + self.background.dirty
+        self.screen.blits([(self.background.surface, rect, rect) for rect in rects], doreturn=False)
+        self.dirty = rects
+        self.drawn = []
+        self.background.dirty = []
+
+    def add(self, rects):
+        # Something was drawn here (a Rect, or a list of them like screen.blits() gives back)
+        if isinstance(rects, pygame.Rect):
+            self.drawn.append(rects)
+        else:
+            self.drawn.extend(rects)
+
+    def end(self):
+        self.dirty += self.drawn
+        # (Rects never reach MAX_DIRTY_RECTS unless there are lots of chaos balls)
+        if len(self.dirty) > MAX_DIRTY_RECTS:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty)
+        return self.dirty
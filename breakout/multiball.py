@@ -0,0 +1,156 @@
+# Multiball chaos: hundreds (or thousands) of extra balls bouncing around at once.
+# One ball can take its time - physics.py follows its whole path and finds the exact moment
+# it touches something. That's far too slow for 2,000 balls one after another, so these
+# balls live in NumPy arrays instead: one array for every x, one for every y, and so on
+# (like asteroids/entities.py). Then one line like x += vx moves every ball at once, and the
+# walls, the paddle and the bricks are checked for all of them together too.
+#
+#     balls = Multiball()
+#     balls.spawn(50, paddle_x + paddle_width / 2, paddle_y - 10)
+#     broken, paddle_hits = balls.step(bricks, brick_width, brick_height,
+#                                      (paddle_x, paddle_y, paddle_width, paddle_height), WIDTH, HEIGHT)
+# bricks is the game's brick grid: a NumPy array of True (still there) / False (broken).
+# broken is a list of the (row, col) of every brick broken this tick.
+#
+# These balls are small and never faster than MAX_SPEED, which is less than a brick is
+# tall - so moving a whole tick at once can't skip over a brick, and the simple "move, then
+# look for overlaps" check is enough.
+#
+# Two balls hitting the same brick in the same tick: the brick was there at the start of the
+# tick for both of them, so they BOTH bounce off it, and it breaks just once. It doesn't
+# matter which ball comes first in the arrays - the result is always the same.
+import math
+
+import numpy as np
+
+from physics import SPIN
+
+RADIUS = 5        # Chaos balls are smaller than the real ball
+SPEED = 5         # How fast a new chaos ball goes
+MAX_SPEED = 8     # Spin from the paddle can't make a ball go faster than this (left/right)
+CHAOS_BALLS = 50  # How many balls the Multiball Chaos power-up lets loose
+
+
+class Multiball:
+    def __init__(self, radius=RADIUS, seed=None):
+        self.radius = radius
+        self.x = np.zeros(0)   # Where each ball is
+        self.y = np.zeros(0)
+        self.vx = np.zeros(0)  # And how fast it's going
+        self.vy = np.zeros(0)
+        self.rng = np.random.default_rng(seed)
+
+    def __len__(self):
+        return len(self.x)
+
+    def spawn(self, count, x, y, speed=SPEED):
+        # Add `count` balls at (x, y) - x and y can be one spot, or an array with a spot for
+        # every ball - flying upward in random directions
+        angle = self.rng.uniform(math.radians(30), math.radians(150), count)
+        self.x = np.concatenate((self.x, np.broadcast_to(np.asarray(x, dtype=float), (count,))))
+        self.y = np.concatenate((self.y, np.broadcast_to(np.asarray(y, dtype=float), (count,))))
+        self.vx = np.concatenate((self.vx, speed * np.cos(angle)))
+        self.vy = np.concatenate((self.vy, -speed * np.sin(angle)))
+
+    def clear(self):
+        self.x, self.y, self.vx, self.vy = np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0)
+
+    def step(self, bricks, brick_width, brick_height, paddle, width, height):
+        # Move every ball one tick and bounce it off the walls, the paddle and the bricks.
+        # Broken bricks are set to False in `bricks`. Returns (broken, paddle_hits).
+        r = self.radius
+        old_x, old_y = self.x, self.y
+        x, y = old_x + self.vx, old_y + self.vy
+        vx, vy = self.vx, self.vy  # (x and y are new arrays, so these can change in place)
+
+        # Walls: left, right and top
+        hit = x < r
+        x[hit], vx[hit] = r, np.abs(vx[hit])
+        hit = x > width - r
+        x[hit], vx[hit] = width - r, -np.abs(vx[hit])
+        hit = y < r
+        y[hit], vy[hit] = r, np.abs(vy[hit])
+
+        # The paddle: only balls coming down onto its top (a ball that misses it falls past)
+        paddle_x, paddle_y, paddle_width, paddle_height = paddle
+        hit = ((vy > 0) & (old_y + r <= paddle_y) & (y + r > paddle_y) &
+               (x + r > paddle_x) & (x - r < paddle_x + paddle_width))
+        paddle_hits = int(np.count_nonzero(hit))
+        if paddle_hits:
+            y[hit] = paddle_y - r
+            vy[hit] = -vy[hit]
+            # A little spin based on where it hits, just like the real ball
+            vx[hit] = np.clip(vx[hit] + (x[hit] - (paddle_x + paddle_width / 2)) * SPIN, -MAX_SPEED, MAX_SPEED)
+
+        # Bricks. They're checked against the grid as it was at the start of the tick, and
+        # broken all together at the end (see the top of this file).
+        rows, cols = bricks.shape
+        # A grid with a border of "no brick" all the way around, so cells off the edge of the
+        # grid can be looked up like any other (and just say "no brick")
+        grid = np.zeros((rows + 2, cols + 2), dtype=bool)
+        grid[1:-1, 1:-1] = bricks
+        # Only balls up where the bricks are need checking (usually most of them aren't)
+        balls = np.flatnonzero(y - r < rows * brick_height)
+        hit_cells = []
+        for _ in range(2):  # A second look, for a ball that bounced into the corner between two bricks
+            if len(balls) == 0:
+                break
+            balls, cells = self.hit_bricks(balls, x, y, vx, vy, old_x, old_y, grid, brick_width, brick_height)
+            hit_cells.append(cells)
+        broken = []
+        if hit_cells:
+            # Every brick that got hit breaks once, however many balls hit it (np.unique also
+            # sorts them, so they always come out in the same order)
+            cells = np.unique(np.concatenate(hit_cells))
+            broken_rows, broken_cols = cells // cols, cells % cols
+            bricks[broken_rows, broken_cols] = False
+            broken = list(zip(broken_rows.tolist(), broken_cols.tolist()))
+
+        # Balls that fell off the bottom are gone - all of them in one go
+        keep = y - r <= height
+        if not keep.all():
+            x, y, vx, vy = x[keep], y[keep], vx[keep], vy[keep]
+        self.x, self.y, self.vx, self.vy = x, y, vx, vy
+        return broken, paddle_hits
+
+    def hit_bricks(self, balls, x, y, vx, vy, old_x, old_y, grid, brick_width, brick_height):
+        # Bounce the balls (their numbers in the arrays) off the bricks they touch.
+        # Returns which of them hit a brick, and the brick each one hit (as row * cols + col).
+        r = self.radius
+        rows, cols = grid.shape[0] - 2, grid.shape[1] - 2
+        bx, by = x[balls], y[balls]
+        # The cell the ball's center is in, and the cell next to it that its edge pokes into
+        # (a ball is smaller than a brick, so it can only touch these four cells)
+        row = (by // brick_height).astype(np.intp)
+        col = (bx // brick_width).astype(np.intp)
+        other_row = np.where(by - r < row * brick_height, row - 1,
+                             np.where(by + r > (row + 1) * brick_height, row + 1, row))
+        other_col = np.where(bx - r < col * brick_width, col - 1,
+                             np.where(bx + r > (col + 1) * brick_width, col + 1, col))
+        hit_row = np.full(len(balls), -1)
+        hit_col = np.full(len(balls), -1)
+        # Which brick does it hit? The one its center is in first, then the one beside it,
+        # then above/below, then the corner. (Checked backwards, so the first one wins.)
+        for check_row, check_col in ((other_row, other_col), (other_row, col), (row, other_col), (row, col)):
+            there = grid[np.clip(check_row + 1, 0, rows + 1), np.clip(check_col + 1, 0, cols + 1)]
+            hit_row = np.where(there, check_row, hit_row)
+            hit_col = np.where(there, check_col, hit_col)
+        hitting = hit_row >= 0
+        balls, hit_row, hit_col = balls[hitting], hit_row[hitting], hit_col[hitting]
+
+        # Bounce. Where was the ball last tick? Beside the brick means it hit a side,
+        # otherwise it hit the top or bottom.
+        left, right = hit_col * brick_width, (hit_col + 1) * brick_width
+        top, bottom = hit_row * brick_height, (hit_row + 1) * brick_height
+        was_left, was_right = old_x[balls] + r <= left, old_x[balls] - r >= right
+        was_above, was_below = old_y[balls] + r <= top, old_y[balls] - r >= bottom
+        side = (was_left | was_right) & ~(was_above | was_below)
+        flat = balls[side]
+        vx[flat] = -vx[flat]
+        x[flat] = np.where(was_left[side], left[side] - r, right[side] + r)
+        flat = balls[~side]
+        vy[flat] = -vy[flat]
+        # (Already inside it - maybe it was put there? Out the way it's heading now.)
+        above = was_above[~side] | (~was_below[~side] & (vy[flat] < 0))
+        y[flat] = np.where(above, top[~side] - r, bottom[~side] + r)
+        return balls, hit_row * cols + hit_col
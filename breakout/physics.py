@@ -0,0 +1,146 @@
+# How the Breakout ball moves and bounces, with "swept" collisions.
+# The old way moved the ball, then checked if it was overlapping something. A fast ball can
+# jump right over a brick (or the paddle) between two checks - that's called "tunneling".
+# Here we follow the ball's whole path during the tick instead, find the FIRST thing it
+# touches and exactly when (the "time of impact"), bounce it there, and carry on with the
+# rest of the tick from that spot. So a fast ball can bounce several times in one tick, and
+# it never goes through anything.
+#
+# Two tricks keep it simple and quick:
+#   - Instead of a round ball hitting a box, grow every box by the ball's radius and follow
+#     just the ball's center (a point). The point touches the grown box exactly when the
+#     ball's square outline touches the real box - the same test the game always used.
+#   - Bricks sit in a grid, so we don't look at every brick: we walk the grid cells the path
+#     goes through, one after another (a "DDA" grid walk), and only test the bricks in and
+#     around those cells. We stop as soon as we're past the first hit.
+#
+#     x, y, vx, vy, events = sweep_ball(x, y, vx, vy, radius, bricks, brick_width, brick_height,
+#                                       (paddle_x, paddle_y, paddle_width, paddle_height), WIDTH)
+# events lists what the ball hit this tick, in order: ("brick", row, col), ("paddle",) or
+# ("wall",). Bricks it hits are removed from `bricks` (set to 0) straight away.
+import math
+
+MAX_BOUNCES = 8  # Most bounces in one tick (a ball stuck in a corner can't loop forever)
+SPIN = 0.1       # How much the spot where the ball hits the paddle turns it
+
+
+def box_hit(x, y, dx, dy, left, top, right, bottom, limit):
+    # When does a point going from (x, y) by (dx, dy) per tick first touch this box?
+    # Returns (time, axis) with 0 <= time <= limit, axis "x" for a side and "y" for the top or
+    # bottom - or None if it misses (or is already inside, or moving away).
+    # It's the "slab" method: find when the point is between the left and right edges, and
+    # when it's between the top and bottom edges. It's inside the box when both are true.
+    if dx > 0:
+        enter_x, exit_x = (left - x) / dx, (right - x) / dx
+    elif dx < 0:
+        enter_x, exit_x = (right - x) / dx, (left - x) / dx
+    elif left < x < right:
+        enter_x, exit_x = -math.inf, math.inf
+    else:
+        return None
+    if dy > 0:
+        enter_y, exit_y = (top - y) / dy, (bottom - y) / dy
+    elif dy < 0:
+        enter_y, exit_y = (bottom - y) / dy, (top - y) / dy
+    elif top < y < bottom:
+        enter_y, exit_y = -math.inf, math.inf
+    else:
+        return None
+    enter = max(enter_x, enter_y)
+    if enter < 0 or enter > limit or enter >= min(exit_x, exit_y):
+        return None
+    return enter, "x" if enter_x > enter_y else "y"
+
+
+def first_brick(x, y, dx, dy, radius, bricks, brick_width, brick_height, limit):
+    # The first brick the ball touches before time `limit`: (time, axis, row, col), or None.
+    # (Needs radius <= brick size, so a grown brick only reaches into the cells next to it.)
+    rows, cols = len(bricks), len(bricks[0])
+    # Skip it all if the path doesn't even get near the bricks (true most of the time)
+    if min(y, y + dy * limit) - radius >= rows * brick_height:
+        return None
+    col, row = math.floor(x / brick_width), math.floor(y / brick_height)
+    # The DDA grid walk: when does the path cross into the next column, and the next row?
+    step_col = 1 if dx > 0 else -1
+    step_row = 1 if dy > 0 else -1
+    next_col = ((col + (dx > 0)) * brick_width - x) / dx if dx else math.inf
+    next_row = ((row + (dy > 0)) * brick_height - y) / dy if dy else math.inf
+    col_time = brick_width / abs(dx) if dx else math.inf   # Time to cross a whole cell
+    row_time = brick_height / abs(dy) if dy else math.inf
+    best = None
+    tested = set()
+    while True:
+        # A grown brick reaches into the cells around it, so test this cell and its neighbors
+        for r in range(max(0, row - 1), min(rows, row + 2)):
+            for c in range(max(0, col - 1), min(cols, col + 2)):
+                if bricks[r][c] and (r, c) not in tested:
+                    tested.add((r, c))
+                    hit = box_hit(x, y, dx, dy, c * brick_width - radius, r * brick_height - radius,
+                                  (c + 1) * brick_width + radius, (r + 1) * brick_height + radius,
+                                  best[0] if best else limit)
+                    if hit and (best is None or hit[0] < best[0]):
+                        best = (hit[0], hit[1], r, c)
+        # On to the next cell - unless it's past the end of the path, or past the hit we found
+        enter_next = min(next_col, next_row)
+        if enter_next > limit or (best and enter_next > best[0]) or row >= rows + 1 and dy >= 0:
+            return best
+        if next_col < next_row:
+            col += step_col
+            next_col += col_time
+        else:
+            row += step_row
+            next_row += row_time
+
+
+def sweep_ball(x, y, vx, vy, radius, bricks, brick_width, brick_height, paddle, width):
+    # Move the ball for one tick, bouncing off everything it hits on the way
+    paddle_x, paddle_y, paddle_width, paddle_height = paddle
+    events = []
+    # The paddle grown by the ball's radius (the ball's center can't go inside this)
+    pad_left, pad_top = paddle_x - radius, paddle_y - radius
+    pad_right, pad_bottom = paddle_x + paddle_width + radius, paddle_y + paddle_height + radius
+    if pad_left < x < pad_right and pad_top < y < pad_bottom and vy > 0:
+        # The paddle moved into the ball - pop the ball up on top of it, like it landed there
+        y = pad_top
+    time_left = 1.0
+    for _ in range(MAX_BOUNCES):
+        # What does it hit first: a wall, the paddle or a brick?
+        hit, axis, what = None, None, None
+        if vx < 0 and x + vx * time_left < radius:
+            hit, axis, what = (radius - x) / vx, "x", ("wall",)
+        elif vx > 0 and x + vx * time_left > width - radius:
+            hit, axis, what = (width - radius - x) / vx, "x", ("wall",)
+        if vy < 0 and y + vy * time_left < radius:
+            wall = (radius - y) / vy
+            if hit is None or wall < hit:
+                hit, axis, what = wall, "y", ("wall",)
+        paddle_hit = box_hit(x, y, vx, vy, pad_left, pad_top, pad_right, pad_bottom,
+                             time_left if hit is None else hit)
+        if paddle_hit:
+            (hit, axis), what = paddle_hit, ("paddle",)
+        brick = first_brick(x, y, vx, vy, radius, bricks, brick_width, brick_height,
+                            time_left if hit is None else hit)
+        if brick:
+            hit, axis, what = brick[0], brick[1], ("brick", brick[2], brick[3])
+        if hit is None:
+            break  # A clear path for the rest of the tick
+        # Move to the spot where it touches, and bounce
+        hit = max(0.0, hit)
+        x += vx * hit
+        y += vy * hit
+        time_left -= hit
+        if what[0] == "paddle" and axis == "y" and vy > 0:
+            vy = -vy
+            vx += (x - (paddle_x + paddle_width / 2)) * SPIN  # Add a little spin based on where it hits
+        elif axis == "x":
+            vx = -vx
+        else:
+            vy = -vy
+        if what[0] == "brick":
+            bricks[what[1]][what[2]] = 0
+        events.append(what)
+    else:
+        time_left = 0.0  # Bounced MAX_BOUNCES times already - it waits there until next tick
+    x += vx * time_left
+    y += vy * time_left
+    return x, y, vx, vy, events
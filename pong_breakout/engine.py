@@ -0,0 +1,238 @@
+# The rules of Pong + Breakout, with no window, no sound and no keyboard.
+# pong.py shows a PongMatch on the screen and plays the sounds; tournament.py plays
+# thousands of them as fast as it can. Both use exactly the same rules.
+#
+# Who moves each paddle is up to a "policy": anything you can call as policy(match, paddle)
+# that gives back how far that paddle should move this tick (up is negative). StockAI is
+# the computer player pong.py has always had; pong.py's Keyboard policy reads the W and S
+# keys, so you're a policy too!
+#
+#     match = PongMatch(StockAI(), StockAI(speed=5), seed=1, points_to_win=5)
+#     while not match.finished:
+#         events = match.step()       # "paddle", "brick" and "point" - for the sounds
+import math
+import random
+
+# These are like the "rules" of our game world, stored in all caps so we know they won’t change
+SCREEN_WIDTH = 800  # How wide our game window is (in pixels)
+SCREEN_HEIGHT = 600  # How tall our game window is
+PADDLE_WIDTH = 20  # Width of the paddles
+PADDLE_HEIGHT = 100  # Height of the paddles
+BALL_SIZE = 20  # How big our ball is (it’s a square, so this is both width and height)
+BRICK_WIDTH = 40  # Width of the bricks in the middle
+BRICK_HEIGHT = 40  # Height of the bricks
+NUM_COLS = 5  # How many columns of bricks we’ll have
+NUM_ROWS = 14  # How many rows of bricks
+BRICK_AREA_LEFT = (SCREEN_WIDTH - NUM_COLS * BRICK_WIDTH) // 2  # Where the bricks start on the left
+BRICK_AREA_TOP = 20  # How far from the top they start
+BRICK_CHANCE = 0.2  # Each spot's chance of having a brick at the start
+BRICKS_PER_POINT = 5  # How many bricks come back every time someone scores
+
+# The colors a brick's fade can start and end with. There are only 8 x 8 different fades,
+# so pong.py makes each one once and every brick that uses it shares it (see gradient_surface)
+BRICK_COLORS = [(255, 60, 60), (255, 160, 0), (255, 230, 0), (60, 220, 60),
+                (0, 200, 220), (60, 90, 255), (170, 70, 255), (255, 90, 200)]
+
+
+# **Paddle Class** - This is like a blueprint for our paddles
+class Paddle:
+    def __init__(self, x, y):  # Sets up a new paddle
+        self.x = x  # Where it starts horizontally
+        self.y = y  # Where it starts vertically
+        self.width = PADDLE_WIDTH  # How wide it is
+        self.height = PADDLE_HEIGHT  # How tall it is
+
+    def move(self, dy):  # Moves the paddle up or down
+        self.y += dy  # Changes its y position (dy is how much to move)
+        self.y = max(0, min(self.y, SCREEN_HEIGHT - self.height))  # Keeps it on the screen
+
+
+# **Ball Class** - Our bouncy little friend
+class Ball:
+    def __init__(self, x, y):  # Sets up a new ball
+        self.x = x  # Starting x position
+        self.y = y  # Starting y position
+        self.vx = 5  # How fast it moves left/right
+        self.vy = 3  # How fast it moves up/down
+        self.size = BALL_SIZE  # Its size
+
+    def update(self):  # Moves the ball each tick
+        self.x += self.vx  # Updates x position
+        self.y += self.vy  # Updates y position
+
+    def reset(self, rng):  # Puts the ball back in the middle
+        self.x = SCREEN_WIDTH // 2  # Center horizontally
+        self.y = SCREEN_HEIGHT // 2  # Center vertically
+        self.vx = rng.choice([-5, 5])  # Picks a random left or right speed
+        self.vy = rng.uniform(-3, 3)  # Picks a random up/down speed
+
+
+# **Brick Class** - Where a brick is and the two colors it fades between
+class Brick:
+    def __init__(self, x, y, rng):  # Sets up a new brick
+        self.x = x  # Where it sits horizontally
+        self.y = y  # Where it sits vertically
+        self.width = BRICK_WIDTH  # How wide
+        self.height = BRICK_HEIGHT  # How tall
+        self.color1 = rng.choice(BRICK_COLORS)  # Top color
+        self.color2 = rng.choice(BRICK_COLORS)  # Bottom color
+
+
+# **Bricks Under the Ball** - Which grid spots could the ball be touching?
+# The bricks sit in a neat grid, so instead of checking all 5 x 14 of them we can work out
+# straight from the ball's edges which columns and rows it covers (usually just 1 or 2 of each)
+def cells_under(x, y, size):
+    first_col = max(0, math.floor((x - BRICK_AREA_LEFT) / BRICK_WIDTH))
+    last_col = min(NUM_COLS - 1, math.ceil((x + size - BRICK_AREA_LEFT) / BRICK_WIDTH) - 1)
+    first_row = max(0, math.floor((y - BRICK_AREA_TOP) / BRICK_HEIGHT))
+    last_row = min(NUM_ROWS - 1, math.ceil((y + size - BRICK_AREA_TOP) / BRICK_HEIGHT) - 1)
+    return range(first_col, last_col + 1), range(first_row, last_row + 1)
+
+
+# **The Stock AI** - Makes a paddle smart (the right paddle in pong.py)
+class StockAI:
+    def __init__(self, speed=4, jitter=10):
+        self.speed = speed  # AI’s max speed
+        self.jitter = jitter  # How much it wobbles when aiming, so it’s not perfect
+
+    def __call__(self, match, paddle):
+        ball = match.ball
+        paddle_center = paddle.y + paddle.height / 2  # Finds the middle of the paddle
+        coming = ball.vx < 0 if paddle is match.left_paddle else ball.vx > 0
+        if coming:  # If ball is moving toward this paddle
+            target_y = ball.y + ball.size / 2 + match.rng.uniform(-self.jitter, self.jitter)  # Aims for the ball with a little wobble
+        else:  # If ball is moving away
+            target_y = SCREEN_HEIGHT / 2  # Goes back to the middle
+        dy = target_y - paddle_center  # How far to move
+        return max(min(dy, self.speed), -self.speed)  # Keeps movement smooth
+
+
+class PongMatch:
+    def __init__(self, left_policy, right_policy, seed=None, brick_chance=BRICK_CHANCE,
+                 bricks_per_point=BRICKS_PER_POINT, points_to_win=None):
+        # points_to_win: the match is over when someone gets this many (None = play forever,
+        # like pong.py). Same seed = same bricks, same serves and the same AI wobbles.
+        self.rng = random.Random(seed)  # The match's own random numbers
+        self.left_policy = left_policy  # Who moves the left paddle (you, in pong.py)
+        self.right_policy = right_policy  # ...and the right one (the AI)
+        self.bricks_per_point = bricks_per_point
+        self.points_to_win = points_to_win
+        self.left_paddle = Paddle(20, SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2)  # Player’s paddle on the left
+        self.right_paddle = Paddle(SCREEN_WIDTH - PADDLE_WIDTH - 20, SCREEN_HEIGHT // 2 - PADDLE_HEIGHT // 2)  # AI’s paddle on the right
+        self.ball = Ball(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)  # Ball starts in the middle
+        # Brick grid - Making a wall of bricks (brick_grid[column][row], None = no brick)
+        self.brick_grid = [[None for _ in range(NUM_ROWS)] for _ in range(NUM_COLS)]
+        for c in range(NUM_COLS):  # Loop through columns
+            for r in range(NUM_ROWS):  # Loop through rows
+                if self.rng.random() < brick_chance:  # A chance to add a brick
+                    self.brick_grid[c][r] = self.new_brick(c, r)
+        # Scores - Keeping track of who’s winning
+        self.score1 = 0  # Left score (the player)
+        self.score2 = 0  # Right score (the AI)
+        self.ticks = 0
+        self.rally = 0  # Paddle hits since the last serve
+        self.rallies = []  # How long every rally was, one number per point
+        self.bricks_broken = 0
+        self.finished = False
+        self.frame_timer = None  # pong.py gives us its FrameTimer (arcade_common/frame_timer.py), to time the collisions
+
+    def new_brick(self, c, r):
+        x = BRICK_AREA_LEFT + c * BRICK_WIDTH  # Calculate x position
+        y = BRICK_AREA_TOP + r * BRICK_HEIGHT  # Calculate y position
+        return Brick(x, y, self.rng)
+
+    def add_more_bricks(self):
+        # Adds bricks when someone scores
+        empty_positions = [(c, r) for c in range(NUM_COLS) for r in range(NUM_ROWS) if not self.brick_grid[c][r]]  # Finds empty spots
+        if empty_positions:  # If there are empty spots
+            num_to_add = min(self.bricks_per_point, len(empty_positions))
+            for c, r in self.rng.sample(empty_positions, num_to_add):  # Picks random spots
+                self.brick_grid[c][r] = self.new_brick(c, r)
+
+    def step(self):
+        # Move the match forward one tick. Returns a list of what happened: "paddle" and
+        # "brick" for every bounce off one, "point" when someone scores.
+        events = []
+        if self.finished:
+            return events
+        self.ticks += 1
+        ball = self.ball
+        # Both paddles ask their policy how far to move
+        self.left_paddle.move(self.left_policy(self, self.left_paddle))
+        self.right_paddle.move(self.right_policy(self, self.right_paddle))
+
+        # Update ball position
+        ball.update()  # Moves the ball
+
+        # Ball hits top or bottom walls
+        if ball.y <= 0 or ball.y + ball.size >= SCREEN_HEIGHT:  # If it hits the top or bottom
+            ball.vy = -ball.vy  # Bounces it back
+
+        # Ball hits paddles
+        if self.frame_timer:
+            self.frame_timer.mark("update")  # (The frame timer: everything so far was moving things)
+        for paddle in (self.left_paddle, self.right_paddle):
+            if paddle is self.left_paddle:
+                reached = ball.x < paddle.x + paddle.width  # If ball hits left paddle
+            else:
+                reached = ball.x + ball.size > paddle.x  # If ball hits right paddle
+            if reached and paddle.y < ball.y + ball.size and ball.y < paddle.y + paddle.height:
+                ball.vx = -ball.vx  # Bounces horizontally
+                hit_pos = (ball.y + ball.size / 2 - paddle.y) / paddle.height  # Where it hit
+                ball.vy = (hit_pos - 0.5) * 10  # Changes vertical speed based on hit spot
+                self.rally += 1
+                events.append("paddle")  # Beep!
+                break
+
+        # Ball hits bricks
+        cols, rows = cells_under(ball.x, ball.y, ball.size)  # Only the spots under the ball
+        for c in cols:
+            for r in rows:
+                brick = self.brick_grid[c][r]  # Gets the brick (if there is one)
+                if brick and (brick.x < ball.x + ball.size and  # If ball hits a brick
+                              brick.x + brick.width > ball.x and
+                              brick.y < ball.y + ball.size and
+                              brick.y + brick.height > ball.y):
+                    overlap_x = min(ball.x + ball.size - brick.x, brick.x + brick.width - ball.x)  # How much overlap horizontally
+                    overlap_y = min(ball.y + ball.size - brick.y, brick.y + brick.height - ball.y)  # How much overlap vertically
+                    if overlap_x < overlap_y:  # If it hit the side
+                        ball.vx = -ball.vx  # Bounce horizontally
+                    else:  # If it hit top or bottom
+                        ball.vy = -ball.vy  # Bounce vertically
+                    self.brick_grid[c][r] = None  # Brick goes poof!
+                    self.bricks_broken += 1
+                    events.append("brick")  # Crunch sound!
+        if self.frame_timer:
+            self.frame_timer.mark("collision")  # ...and this part was collisions
+
+        # Scoring
+        if ball.x < 0 or ball.x > SCREEN_WIDTH:  # Ball goes past a side
+            if ball.x < 0:
+                self.score2 += 1  # Right scores
+            else:
+                self.score1 += 1  # Left scores
+            self.rallies.append(self.rally)
+            self.rally = 0
+            ball.reset(self.rng)  # Reset the ball
+            self.add_more_bricks()  # Add more bricks
+            events.append("point")  # Victory beep!
+            if self.points_to_win and max(self.score1, self.score2) >= self.points_to_win:
+                self.finished = True
+        return events
+
+
+def play_match(left_policy, right_policy, seed, brick_chance=BRICK_CHANCE, bricks_per_point=BRICKS_PER_POINT,
+               points_to_win=5, max_ticks=18_000):
+    # Play one whole match and report how it went. Two good AIs can rally for ages, so a
+    # match also ends after max_ticks ticks (18,000 = 5 minutes at 60 a second), and then
+    # whoever's ahead wins (a tie is a draw: winner None). The rally still going then isn't
+    # in "rallies" (nobody scored), so it's "unfinished_rally" (None if the match was won).
+    match = PongMatch(left_policy, right_policy, seed, brick_chance, bricks_per_point, points_to_win)
+    while not match.finished and match.ticks < max_ticks:
+        match.step()
+    winner = None
+    if match.score1 != match.score2:
+        winner = "left" if match.score1 > match.score2 else "right"
+    return {"seed": seed, "winner": winner, "score1": match.score1, "score2": match.score2,
+            "ticks": match.ticks, "rallies": match.rallies, "bricks": match.bricks_broken,
+            "unfinished_rally": None if match.finished else match.rally}
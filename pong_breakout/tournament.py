@@ -0,0 +1,78 @@
+# Let computer players play thousands of Pong + Breakout matches with no window, to see how
+# changing the AI or the bricks changes the game - much quicker than watching!
+# Run it with: python tournament.py          (MATCHES matches for every matchup)
+#          or: python tournament.py 200      (200 each - a quick look)
+# Every matchup below is a left policy, a right policy and how many bricks there are (see
+# engine.py). Match n always uses seed n, so every run plays exactly the same matches. They're
+# shared out over all the computer's cores with a process pool (a few extra Pythons working
+# side by side). A match is first to POINTS_TO_WIN, or whoever's ahead after MAX_TICKS ticks
+# (level scores then are a draw).
+# "rally" is how many times the ball hit a paddle between a serve and a point (or the end of
+# the match: a rally MAX_TICKS cut off counts too, or long rallies would hardly ever show up);
+# "cut off" is how many matches MAX_TICKS ended; "points" and "bricks" are per match.
+import multiprocessing
+import os
+import sys
+import time
+
+from engine import StockAI, play_match
+
+MATCHES = 400       # How many matches to play for each matchup
+POINTS_TO_WIN = 5
+MAX_TICKS = 18_000  # 5 minutes at 60 ticks a second
+WORKERS = os.cpu_count() or 1
+
+# name, left policy, right policy, brick chance, bricks added per point
+MATCHUPS = [
+    ("stock vs stock", StockAI(), StockAI(), 0.2, 5),
+    ("speed 5 vs stock", StockAI(speed=5), StockAI(), 0.2, 5),
+    ("speed 3 vs stock", StockAI(speed=3), StockAI(), 0.2, 5),
+    ("jitter 0 vs stock", StockAI(jitter=0), StockAI(), 0.2, 5),
+    ("stock, no bricks", StockAI(), StockAI(), 0.0, 0),
+    ("stock, half bricks", StockAI(), StockAI(), 0.5, 10),
+]
+
+
+def play(job):
+    matchup, seed = job
+    name, left, right, brick_chance, bricks_per_point = MATCHUPS[matchup]
+    result = play_match(left, right, seed, brick_chance, bricks_per_point, POINTS_TO_WIN, MAX_TICKS)
+    result["matchup"] = matchup
+    return result
+
+
+def percentile(values, p):
+    # values must be sorted
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def main():
+    matches = int(sys.argv[1]) if len(sys.argv) > 1 else MATCHES
+    jobs = [(matchup, seed) for matchup in range(len(MATCHUPS)) for seed in range(matches)]
+    start = time.perf_counter()
+    with multiprocessing.Pool(WORKERS) as pool:
+        results = pool.map(play, jobs, chunksize=max(1, len(jobs) // (WORKERS * 8)))
+    elapsed = time.perf_counter() - start
+
+    print(f"{len(jobs)} matches ({matches} per matchup), first to {POINTS_TO_WIN}, {WORKERS} worker(s): "
+          f"{elapsed:.1f} s")
+    print(f"{'matches/sec':>12} {len(jobs) / elapsed:12,.1f}")
+    print(f"{'ticks/sec':>12} {sum(result['ticks'] for result in results) / elapsed:12,.0f}")
+    print()
+    print(f"{'matchup':>20} {'left wins':>10} {'right wins':>11} {'draws':>6} {'cut off':>8} "
+          f"{'rally p50':>10} {'p90':>5} {'max':>5} {'points':>7} {'bricks':>7}")
+    for matchup, (name, *_) in enumerate(MATCHUPS):
+        mine = [result for result in results if result["matchup"] == matchup]
+        left = sum(result["winner"] == "left" for result in mine)
+        right = sum(result["winner"] == "right" for result in mine)
+        cut_off = [result["unfinished_rally"] for result in mine if result["unfinished_rally"] is not None]
+        rallies = sorted([rally for result in mine for rally in result["rallies"]] + cut_off) or [0]
+        bricks = sum(result["bricks"] for result in mine) / len(mine)
+        draws = len(mine) - left - right
+        print(f"{name:>20} {left / len(mine):10.1%} {right / len(mine):11.1%} {draws / len(mine):6.0%} "
+              f"{len(cut_off) / len(mine):8.0%} {percentile(rallies, 50):10} {percentile(rallies, 90):5} {rallies[-1]:5} "
+              f"{sum(len(result['rallies']) for result in mine) / len(mine):7.1f} {bricks:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
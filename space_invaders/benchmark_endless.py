@@ -0,0 +1,65 @@
+# How much does a Space Invaders tick cost as the levels go up?
+# Run it with: python benchmark_endless.py        (or: python benchmark_endless.py 100)
+# A bot plays an endless game (simulation.InvadersGame with endless=True: it can't lose)
+# all the way to level LEVELS. Every tick it fires and slides under the lowest invader.
+# Level L has 5 + L invaders, and more of them shoot back as the levels go up, so by
+# level 500 there are hundreds of invaders and thousands of enemy bullets on the screen.
+# For a few levels along the way it prints how long one update (game.step) took on
+# average while playing that level, next to how much there was to move and check.
+import sys
+import time
+
+from simulation import InvadersGame, player_width
+
+SEED = 2024
+LEVELS = 500
+REPORT = [1, 2, 5, 10, 25, 50, 100, 200, 300, 400, 500]  # Print these levels
+FRAME = 1 / 60  # One frame at 60 fps
+
+
+def bot_move(game):
+    # Slide under the lowest invader (the one closest to getting us)
+    if len(game.formation) == 0:
+        return False, False
+    x, y, _ = game.formation.positions()
+    target = x[y.argmax()] + 20  # Its middle
+    middle = game.player_x + player_width / 2
+    return middle > target + 2, middle < target - 2
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else LEVELS
+    game = InvadersGame(seed=SEED, endless=True)
+    print(f"{'level':>6} {'invaders':>9} {'bullets':>8} {'enemy bullets':>14} {'ticks':>7} "
+          f"{'update':>11} {'of a frame':>11}")
+    total_ticks = 0
+    total_time = 0.0
+    start_all = time.perf_counter()
+    while game.level <= levels:
+        level = game.level
+        invaders = len(game.formation)
+        ticks = 0
+        elapsed = 0.0
+        most_bullets = most_enemy_bullets = 0
+        while game.level == level:
+            left, right = bot_move(game)
+            start = time.perf_counter()
+            game.shoot()
+            game.step(left, right)
+            elapsed += time.perf_counter() - start
+            ticks += 1
+            most_bullets = max(most_bullets, len(game.bullet_x))
+            most_enemy_bullets = max(most_enemy_bullets, len(game.enemy_bullet_x))
+        total_ticks += ticks
+        total_time += elapsed
+        if level in REPORT or level == levels:
+            per_tick = elapsed / ticks
+            print(f"{level:6} {invaders:9} {most_bullets:8} {most_enemy_bullets:14} {ticks:7} "
+                  f"{per_tick * 1e6:8.1f} us {per_tick / FRAME:10.2%}")
+    print(f"{levels} levels, {total_ticks:,} ticks in {time.perf_counter() - start_all:.1f} s "
+          f"({total_time / total_ticks * 1e6:.1f} us per update on average)")
+    print("(bullets and enemy bullets are the most there were at once during the level)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# How much does moving the invaders cost as the wave gets bigger?
+# Run it with: python benchmark_formation.py
+# For bigger and bigger waves we time TICKS ticks of the invaders' own work (moving, turning
+# at the walls, checking if they reached the player, picking who shoots), two ways:
+#   one by one - the way simulation.py used to: every invader had its own x, y and
+#                direction, and every type 2 invader rolled a random number every tick
+#   formation  - simulation.Formation: the wave moves as one offset, its edges and its
+#                shooters (the front type 2 invader in each column) are only worked out
+#                again, for that invader's column, when an invader dies
+# Either way, one invader dies every KILL_EVERY ticks.
+import time
+
+import numpy as np
+
+from simulation import (Formation, WIDTH, enemy_width, enemy_height, enemy_horizontal_speed,
+                        base_enemy_speed)
+
+SEED = 2024
+TICKS = 2000
+KILL_EVERY = 60
+INVADER_COUNTS = [50, 100, 1000, 10000, 100000]
+PLAYER_Y = 540
+CHANCE = 0.01
+
+
+def time_one_by_one(wave, rng):
+    x, y, kinds = (a.copy() for a in wave.positions())
+    direction = np.ones(len(x))
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        if tick % KILL_EVERY == 0:  # Someone got shot: take them out of every array
+            keep = np.arange(len(x)) != 0
+            x, y, kinds, direction = x[keep], y[keep], kinds[keep], direction[keep]
+        y += base_enemy_speed
+        x += enemy_horizontal_speed * direction
+        direction[(x <= 0) | (x >= WIDTH - enemy_width)] *= -1
+        if (y + enemy_height > PLAYER_Y).any():
+            y -= 500
+        shooters = np.flatnonzero(kinds == 2)
+        shooters = shooters[rng.random(len(shooters)) < CHANCE]
+        x[shooters], y[shooters]  # (Where their bullets start)
+    return (time.perf_counter() - start) / TICKS
+
+
+def time_formation(wave, rng):
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        if tick % KILL_EVERY == 0:
+            wave.kill(np.array([tick // KILL_EVERY]))  # The next one along the top row
+        wave.move(base_enemy_speed)
+        if wave.offset_y + wave.bottom > PLAYER_Y:
+            wave.offset_y = -wave.top
+        wave.fire(rng, CHANCE)
+    return (time.perf_counter() - start) / TICKS
+
+
+def main():
+    print(f"{'invaders':>9} {'one by one':>11} {'formation':>10} {'speedup':>8}")
+    for count in INVADER_COUNTS:
+        level = count - 5  # Level L has 5 + L invaders
+        one_by_one = time_one_by_one(Formation(level, np.random.default_rng(SEED)), np.random.default_rng(SEED))
+        formation = time_formation(Formation(level, np.random.default_rng(SEED)), np.random.default_rng(SEED))
+        print(f"{count:9} {one_by_one * 1e6:8.1f} us {formation * 1e6:7.1f} us {one_by_one / formation:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# How long does it take to draw the aliens?
+# Run it with: python benchmark_render.py
+# For more and more aliens (random types, poses and spots), we draw FRAMES frames two ways:
+#   draw.rect - the way space_invaders.py used to: draw_alien() for every alien, which is
+#               4 or 5 pygame.draw.rect calls each
+#   atlas     - sprites.py: every pose drawn once into the atlas, then all the aliens copied
+#               onto the screen with one screen.blits() call (making that list is timed too)
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import numpy as np
+import pygame
+
+from sprites import build_atlas, draw_alien, alien_key, ALIEN_TOP
+
+SEED = 2024
+FRAMES = 200
+ALIEN_COUNTS = [10, 50, 100, 500, 1000, 5000]
+WIDTH, HEIGHT = 800, 600
+
+
+def make_aliens(count, rng):
+    x = rng.uniform(0, WIDTH - 40, count)
+    y = rng.uniform(10, HEIGHT - 40, count)
+    return x, y, rng.integers(0, 3, count), rng.integers(0, 2, count)
+
+
+def time_rects(screen, aliens):
+    x, y, types, frames = aliens
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        screen.fill((0, 0, 0))
+        for alien_x, alien_y, alien_type, pose in zip(x.tolist(), y.tolist(), types.tolist(), (frames ^ (frame & 1)).tolist()):
+            draw_alien(screen, alien_x, alien_y, alien_type, pose)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def time_atlas(screen, aliens, atlas, areas):
+    x, y, types, frames = aliens
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        screen.fill((0, 0, 0))
+        poses = alien_key(types, frames ^ (frame & 1)).tolist()
+        tops = (y.astype(int) - ALIEN_TOP).tolist()
+        screen.blits([(atlas, (alien_x, top), areas[pose]) for alien_x, top, pose in zip(x.tolist(), tops, poses)],
+                     doreturn=False)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    atlas, areas = build_atlas()
+    rng = np.random.default_rng(SEED)
+    print(f"{'aliens':>7} {'draw.rect':>11} {'atlas':>10} {'speedup':>8}")
+    for count in ALIEN_COUNTS:
+        aliens = make_aliens(count, rng)
+        rects = time_rects(screen, aliens)
+        blits = time_atlas(screen, aliens, atlas, areas)
+        print(f"{count:7} {rects * 1e3:8.2f} ms {blits * 1e3:7.2f} ms {rects / blits:7.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
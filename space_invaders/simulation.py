@@ -0,0 +1,296 @@
+# The Space Invaders game rules, with no window, no sound and no clock!
+# space_invaders.py draws an InvadersGame on the screen and plays the sounds; the endless
+# benchmark (benchmark_endless.py) lets a bot play one as fast as it can.
+#
+#     game = InvadersGame(seed=1)
+#     game.shoot()                          # Space bar (a key press, so it's not in step())
+#     events = game.step(left=True)         # One tick, holding the left arrow
+#
+# Every bullet lives in NumPy arrays (one array for all the x's, one for all the y's...), so
+# moving them is one line for the whole lot, and checking which bullets hit which invaders
+# is one go too (see box_pairs). The invaders move together as one Formation, so moving
+# them is just one offset.
+import numpy as np
+
+# The size of space (our window)
+WIDTH = 800
+HEIGHT = 600
+
+# Player stuff—our spaceship!
+player_width = 50  # How wide our ship is
+player_height = 40  # How tall it is
+player_speed = 5  # How fast it zooms left or right
+
+# Bullet stuff—pew pew!
+bullet_width = 5  # How wide our bullets are
+bullet_height = 15  # How tall they are
+bullet_speed = 7  # How fast they zip up the screen
+
+# Enemy stuff—the invaders we’re blasting!
+enemy_width = 40  # How wide each enemy is
+enemy_height = 30  # How tall they are
+base_enemy_speed = 0.5  # How fast they creep down
+enemy_horizontal_speed = 1  # How fast they wiggle side-to-side
+
+# Checking every bullet against every invader makes one big table (bullets x invaders).
+# That's quickest for a normal game, but past this many pairs it's quicker to sort the
+# invaders left to right and only check the ones lined up with each bullet (see box_pairs).
+SWEEP_MIN_PAIRS = 4096
+
+
+def box_pairs(ax, ay, aw, ah, bx, by, bw, bh, b_order=None):
+    # Which boxes in group A overlap which boxes in group B? Every box in a group is the same
+    # size (aw x ah, bw x bh); ax, ay, bx, by are arrays of their top-left corners.
+    # Returns two arrays (a, b) of the overlapping pairs, sorted by a and then by b.
+    # b_order: the B boxes already sorted left to right (np.argsort(bx)), if you kept it.
+    if len(ax) * len(bx) < SWEEP_MIN_PAIRS:
+        # A table with a row for every A and a column for every B, all checked at once
+        touching = ((ax[:, None] < bx + bw) & (ax[:, None] + aw > bx) &
+                    (ay[:, None] < by + bh) & (ay[:, None] + ah > by))
+        return np.nonzero(touching)  # (np.nonzero goes row by row, so it's already sorted)
+    # "Sort and sweep": line the B boxes up by x. The ones that can overlap an A box are the
+    # ones whose left edge is between (A's left - bw) and A's right - a single slice of the
+    # sorted list, found with a binary search (np.searchsorted).
+    order = np.argsort(bx, kind="stable") if b_order is None else b_order
+    sorted_x = bx[order]
+    first = np.searchsorted(sorted_x, ax - bw, side="right")
+    last = np.searchsorted(sorted_x, ax + aw, side="left")
+    counts = last - first
+    # Every (A, candidate B) pair, all in one go: repeat each A once per candidate, and
+    # count along its slice of the sorted B's
+    a = np.repeat(np.arange(len(ax)), counts)
+    b = order[np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())]
+    touching = (ay[a] < by[b] + bh) & (ay[a] + ah > by[b])
+    a, b = a[touching], b[touching]
+    sort = np.lexsort((b, a))
+    return a[sort], b[sort]
+
+
+class Formation:
+    # The whole wave of invaders, moving together like the real arcade game: one shared
+    # offset (how far the wave has moved) and one direction. Every invader has a fixed spot
+    # in a grid (rows x columns) inside the wave, so moving the wave is one update, however
+    # many invaders there are:
+    #
+    #     wave = Formation(level, rng)
+    #     wave.move(speed)                  # A tick: just offset_x and offset_y change
+    #     x, y, kinds = wave.positions()    # Where the invaders still alive are on the screen
+    #
+    # The things we'd otherwise have to work out from every invader every tick (the wave's
+    # edges, its top and bottom rows, who's at the front of each column to shoot) are kept
+    # in little per-column and per-row lists, and only the bits an invader was in get
+    # worked out again when it dies (see kill).
+    def __init__(self, level, rng):
+        # Spawn enemies in a neat grid at the top: up to 3 rows, spread across columns
+        count = 5 + level
+        self.rows = min(3, (count + 4) // 5)
+        self.cols = (count + self.rows - 1) // self.rows
+        self.alive = (np.arange(self.rows * self.cols) < count).reshape(self.rows, self.cols)
+        # A random spot in its column (once the columns get thinner than an enemy, they overlap)
+        room = max(1, WIDTH // self.cols - enemy_width + 1)
+        self.grid_x = np.minimum(np.arange(self.cols) * (WIDTH // self.cols) + rng.integers(0, room, (self.rows, self.cols)),
+                                 WIDTH - enemy_width).astype(float)
+        self.grid_y = np.repeat(50 + np.arange(self.rows)[:, None] * 50, self.cols, axis=1).astype(float)
+        self.kind = rng.integers(0, 2 + (level > 1), (self.rows, self.cols))  # More variety after level 1!
+        # The same grid as flat lists (slot = row * cols + col), sorted left to right once, for
+        # box_pairs. Dead invaders stay in them and just get skipped.
+        self.slot_x, self.slot_y = self.grid_x.ravel(), self.grid_y.ravel()
+        self.order = np.argsort(self.slot_x, kind="stable")
+        self.offset_x = 0.0  # How far the whole wave has moved from where it started
+        self.offset_y = 0.0
+        self.direction = 1   # 1 = moving right, -1 = moving left
+        self.frame = 0       # Which animation pose (0 or 1) - they all wiggle together
+        self.count = count   # How many are still alive
+        self.row_count = self.alive.sum(axis=1)     # ...in each row
+        self.column_count = self.alive.sum(axis=0)  # ...and in each column
+        self.column_left = np.zeros(self.cols)   # The left and right edge of each column
+        self.column_right = np.zeros(self.cols)
+        self.shooter_row = np.zeros(self.cols, dtype=int)  # Each column's shooter (-1 = none)
+        self.first_col, self.last_col = 0, self.cols - 1   # The end columns with anyone left
+        self.update_columns(np.arange(self.cols))
+
+    def update_columns(self, cols):
+        # Work out these columns' edges and shooters again (only 3 invaders tall, at most)
+        alive = self.alive[:, cols]
+        x = self.grid_x[:, cols]
+        self.column_left[cols] = np.where(alive, x, np.inf).min(axis=0)
+        self.column_right[cols] = np.where(alive, x, -np.inf).max(axis=0) + enemy_width
+        # The shooter: the lowest type 2 invader still alive (only the front one can fire,
+        # so it doesn't shoot its friends)
+        can_shoot = alive & (self.kind[:, cols] == 2)
+        self.shooter_row[cols] = np.where(can_shoot.any(axis=0), self.rows - 1 - can_shoot[::-1].argmax(axis=0), -1)
+        # The columns go left to right, so the wave's edges are its end columns' edges
+        while self.first_col < self.last_col and self.column_count[self.first_col] == 0:
+            self.first_col += 1
+        while self.last_col > self.first_col and self.column_count[self.last_col] == 0:
+            self.last_col -= 1
+        self.left = self.column_left[self.first_col]
+        self.right = self.column_right[self.last_col]
+        rows = [row for row, count in enumerate(self.row_count.tolist()) if count]
+        if rows:
+            self.top = self.grid_y[rows[0], 0]  # For going back to the top (endless)
+            self.bottom = self.grid_y[rows[-1], 0] + enemy_height  # For reaching the player
+
+    def __len__(self):
+        return self.count
+
+    def move(self, speed):
+        self.offset_y += speed  # Move down
+        self.offset_x += enemy_horizontal_speed * self.direction  # Move side-to-side
+        # The end invader hit a wall? The whole wave turns around!
+        if self.direction > 0 and self.offset_x + self.right >= WIDTH:
+            self.direction = -1
+        elif self.direction < 0 and self.offset_x + self.left <= 0:
+            self.direction = 1
+
+    def positions(self):
+        # Where every invader still alive is on the screen, and what type it is
+        return (self.grid_x[self.alive] + self.offset_x, self.grid_y[self.alive] + self.offset_y,
+                self.kind[self.alive])
+
+    def fire(self, rng, chance):
+        # Each column's shooter fires with this chance. Rather than a random number for every
+        # column, we pick how many columns fire (a "binomial" draw) and then which ones, so it
+        # costs as much as the shots, not the columns. Returns where the new enemy bullets start.
+        shots = rng.binomial(self.cols, min(chance, 1.0))
+        if shots == 0:
+            return np.zeros(0), np.zeros(0)  # Nobody fires (most ticks on the early levels)
+        if shots == self.cols:
+            cols = np.arange(shots)  # Everyone fires (the fast levels)
+        else:
+            cols = rng.choice(self.cols, shots, replace=False, shuffle=False)
+        row = self.shooter_row[cols]
+        cols, row = cols[row >= 0], row[row >= 0]  # (A column with no shooter left can't fire)
+        return (self.grid_x[row, cols] + self.offset_x + enemy_width // 2 - bullet_width // 2,
+                self.grid_y[row, cols] + self.offset_y + enemy_height)
+
+    def kill(self, slots):
+        # slots: the invaders (row * cols + col) that were shot down
+        row, col = np.divmod(slots, self.cols)
+        self.alive[row, col] = False
+        self.count -= len(slots)
+        for r, c in zip(row.tolist(), col.tolist()):  # (Only a few at a time)
+            self.row_count[r] -= 1
+            self.column_count[c] -= 1
+        self.update_columns(np.unique(col))
+
+
+class InvadersGame:
+    def __init__(self, seed=None, endless=False):
+        # endless: you can't lose - enemy bullets don't hurt, and invaders that get down to
+        # you go back to the top. It just keeps going, level after level (for the benchmark).
+        self.rng = np.random.default_rng(seed)
+        self.endless = endless
+        self.frame_timer = None  # space_invaders.py gives us its FrameTimer (arcade_common/frame_timer.py), to time the collisions
+        self.restart()
+
+    def restart(self):
+        self.score = 0  # Our points—let’s rack ‘em up!
+        self.game_over = False  # Game’s not over yet—we’re just starting!
+        self.ticks = 0  # Helps us animate things
+        self.reset_level(1)
+
+    def reset_level(self, level):
+        # A fresh start for a new level—more enemies as levels go up!
+        self.level = level
+        self.player_x = WIDTH // 2 - player_width // 2  # Ship back to the middle
+        self.player_y = HEIGHT - 60  # Near the bottom
+        # Our bullets and the enemy bullets: just where each one is
+        self.bullet_x, self.bullet_y = np.zeros(0), np.zeros(0)
+        self.enemy_bullet_x, self.enemy_bullet_y = np.zeros(0), np.zeros(0)
+        self.formation = Formation(level, self.rng)  # A new wave of invaders
+
+    def shoot(self):
+        # Fire a bullet from the middle of the ship
+        if self.game_over:
+            return False
+        self.bullet_x = np.append(self.bullet_x, self.player_x + player_width // 2 - bullet_width // 2)
+        self.bullet_y = np.append(self.bullet_y, self.player_y)
+        return True
+
+    def step(self, left=False, right=False):
+        # Move the game forward one tick. Returns a list of what happened: "hit" for every
+        # invader shot down and "enemy_shoot" for every enemy bullet fired (so the screen
+        # can play sounds), and "game_over".
+        events = []
+        if self.game_over:
+            return events
+        self.ticks += 1
+        # Move the player’s ship with the arrow keys (but don’t go off-screen!)
+        if left and self.player_x > 0:
+            self.player_x -= player_speed
+        if right and self.player_x < WIDTH - player_width:
+            self.player_x += player_speed
+
+        # Bullets fly up, enemy bullets come down - every one of them in one line
+        self.bullet_y -= bullet_speed
+        keep = self.bullet_y >= 0  # Off the top? Bye-bye!
+        self.bullet_x, self.bullet_y = self.bullet_x[keep], self.bullet_y[keep]
+        self.enemy_bullet_y += bullet_speed
+        keep = self.enemy_bullet_y <= HEIGHT  # Off the bottom? Gone!
+        self.enemy_bullet_x, self.enemy_bullet_y = self.enemy_bullet_x[keep], self.enemy_bullet_y[keep]
+        # Did an enemy bullet hit the player—oh no!
+        if not self.endless and ((self.enemy_bullet_x < self.player_x + player_width) &
+                                 (self.enemy_bullet_x + bullet_width > self.player_x) &
+                                 (self.enemy_bullet_y < self.player_y + player_height) &
+                                 (self.enemy_bullet_y + bullet_height > self.player_y)).any():
+            self.game_over = True
+
+        # Move enemies—they’re sneaky! Faster each level.
+        enemy_speed = base_enemy_speed + self.level * 0.1
+        if len(self.formation) == 0:  # No enemies left? Next level!
+            self.reset_level(self.level + 1)
+        wave = self.formation
+        wave.move(enemy_speed)  # The whole wave at once
+        if wave.offset_y + wave.bottom > self.player_y:  # The bottom row reached the player?
+            if self.endless:
+                wave.offset_y = -wave.top  # Back to the top for another go
+            else:
+                self.game_over = True  # Game over!
+        # Some enemies shoot back—type 2 is tricky!
+        x, y = wave.fire(self.rng, 0.01 * self.level)
+        if len(x):
+            self.enemy_bullet_x = np.concatenate((self.enemy_bullet_x, x))
+            self.enemy_bullet_y = np.concatenate((self.enemy_bullet_y, y))
+            events += ["enemy_shoot"] * len(x)
+
+        # Check for hits—did we blast an alien?
+        if self.frame_timer:
+            self.frame_timer.mark("update")  # (The frame timer: everything so far was moving things)
+        if len(self.bullet_x):
+            self.shoot_enemies(enemy_speed, events)
+        if self.frame_timer:
+            self.frame_timer.mark("collision")  # ...and this part was collisions
+
+        # Animate enemies—make them wiggle! Every 20 ticks, switch poses.
+        if self.ticks % 20 == 0:
+            wave.frame ^= 1
+        if self.game_over:
+            events.append("game_over")
+        return events
+
+    def shoot_enemies(self, enemy_speed, events):
+        # The invaders sit still inside the wave, so we check in the wave's own coordinates:
+        # move the bullets into them instead of moving every invader out. Each bullet's box
+        # is stretched to cover everywhere it went this tick (up, while the wave came down),
+        # so on the fast levels a bullet can't jump right over an enemy.
+        wave = self.formation
+        bullets, enemies = box_pairs(self.bullet_x - wave.offset_x, self.bullet_y - wave.offset_y,
+                                     bullet_width, bullet_height + bullet_speed + enemy_speed,
+                                     wave.slot_x, wave.slot_y, enemy_width, enemy_height, b_order=wave.order)
+        standing = wave.alive.ravel()[enemies]  # (Skip the spots where an invader already died)
+        bullets, enemies = bullets[standing], enemies[standing]
+        if len(bullets) == 0:
+            return  # Nothing hit - most ticks end right here
+        # Bullet by bullet: each one takes out the first enemy it touches that's still there
+        used_bullets = np.zeros(len(self.bullet_x), dtype=bool)
+        dead = set()
+        for b, e in zip(bullets.tolist(), enemies.tolist()):
+            if not used_bullets[b] and e not in dead:
+                used_bullets[b] = True
+                dead.add(e)
+                self.score += 10 + self.level * 5  # Points yay!
+                events.append("hit")  # Boom!
+        # Take out all the used bullets and the enemies they hit, in one go
+        self.bullet_x, self.bullet_y = self.bullet_x[~used_bullets], self.bullet_y[~used_bullets]
+        wave.kill(np.array(sorted(dead)))
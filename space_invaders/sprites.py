@@ -0,0 +1,89 @@
+# Every picture in Space Invaders, drawn once into a "sprite atlas".
+# Drawing an alien used to take 4 or 5 pygame.draw.rect calls, every alien, every frame.
+# Now all 3 types x 2 animation poses (and the ship and both kinds of bullet) are drawn
+# just once, side by side on one big picture - the atlas. To draw a thing we copy its
+# little rectangle (its "area") out of the atlas, and we hand pygame the whole frame's
+# worth of copies in one screen.blits() call:
+#
+#     atlas, areas = build_atlas()      # Once, after the window is open
+#     screen.blits([(atlas, (x, int(y) - ALIEN_TOP), areas[alien_key(t, f)]) ...])
+#
+# Black is see-through (a "color key"), so aliens that overlap look just like before.
+import pygame
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+PURPLE = (128, 0, 128)
+
+ALIEN_WIDTH, ALIEN_HEIGHT = 40, 40  # The box every alien pose fits in...
+ALIEN_TOP = 10                      # ...starting this far above the alien's y (type 0 pokes up)
+
+
+# Drawing our aliens—time to get creative! (x, y) is the alien's spot, like in the game.
+def draw_alien(surface, x, y, alien_type, frame):
+    if alien_type == 0:  # Classic invader—old-school vibes!
+        if frame == 0:  # First animation pose
+            pygame.draw.rect(surface, GREEN, (x + 10, y, 20, 10))  # Body parts as green rectangles
+            pygame.draw.rect(surface, GREEN, (x + 5, y + 10, 30, 10))
+            pygame.draw.rect(surface, GREEN, (x + 15, y - 10, 10, 10))
+            pygame.draw.rect(surface, WHITE, (x + 10, y + 5, 5, 5))  # White eyes
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 5, 5, 5))
+        else:  # Second pose—makes it look like it’s moving!
+            pygame.draw.rect(surface, GREEN, (x + 5, y, 30, 10))
+            pygame.draw.rect(surface, GREEN, (x + 10, y + 10, 20, 10))
+            pygame.draw.rect(surface, GREEN, (x + 15, y - 5, 10, 5))
+            pygame.draw.rect(surface, WHITE, (x + 15, y + 5, 5, 5))
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 5, 5, 5))
+    elif alien_type == 1:  # Crab-like alien—so sneaky!
+        if frame == 0:
+            pygame.draw.rect(surface, YELLOW, (x + 5, y + 5, 30, 10))
+            pygame.draw.rect(surface, YELLOW, (x, y + 15, 40, 10))
+            pygame.draw.rect(surface, WHITE, (x + 10, y + 10, 5, 5))
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 10, 5, 5))
+        else:
+            pygame.draw.rect(surface, YELLOW, (x + 10, y, 20, 10))
+            pygame.draw.rect(surface, YELLOW, (x + 5, y + 10, 30, 10))
+            pygame.draw.rect(surface, WHITE, (x + 15, y + 5, 5, 5))
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 5, 5, 5))
+    elif alien_type == 2:  # Shooter alien—watch out, it fights back!
+        if frame == 0:
+            pygame.draw.rect(surface, PURPLE, (x + 10, y, 20, 15))
+            pygame.draw.rect(surface, PURPLE, (x + 5, y + 15, 30, 10))
+            pygame.draw.rect(surface, WHITE, (x + 15, y + 5, 5, 5))
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 5, 5, 5))
+        else:
+            pygame.draw.rect(surface, PURPLE, (x + 15, y, 10, 15))
+            pygame.draw.rect(surface, PURPLE, (x + 10, y + 15, 20, 10))
+            pygame.draw.rect(surface, WHITE, (x + 15, y + 10, 5, 5))
+            pygame.draw.rect(surface, WHITE, (x + 25, y + 10, 5, 5))
+
+
+def alien_key(alien_type, frame):
+    # Where a pose is in the areas list: type 0 pose 0, type 0 pose 1, type 1 pose 0...
+    return alien_type * 2 + frame
+
+
+def build_atlas(player_size=(50, 40), bullet_size=(5, 15)):
+    # Draw everything once. Returns the atlas and a list of areas: the 6 alien poses (see
+    # alien_key), then the ship, our bullet and the enemy bullet.
+    # (Needs the window to be open already, for convert().)
+    width = 6 * ALIEN_WIDTH + player_size[0] + 2 * bullet_size[0]
+    atlas = pygame.Surface((width, max(ALIEN_HEIGHT, player_size[1], bullet_size[1])))
+    atlas.fill(BLACK)
+    areas = []
+    for alien_type in range(3):
+        for frame in range(2):
+            x = alien_key(alien_type, frame) * ALIEN_WIDTH
+            draw_alien(atlas, x, ALIEN_TOP, alien_type, frame)
+            areas.append(pygame.Rect(x, 0, ALIEN_WIDTH, ALIEN_HEIGHT))
+    x = 6 * ALIEN_WIDTH
+    for color, size in [(WHITE, player_size), (WHITE, bullet_size), (PURPLE, bullet_size)]:
+        area = pygame.Rect((x, 0), size)
+        atlas.fill(color, area)
+        areas.append(area)
+        x += size[0]
+    atlas = atlas.convert()  # The same pixel format as the screen, so copying is quickest
+    atlas.set_colorkey(BLACK, pygame.RLEACCEL)  # Black is see-through
+    return atlas, areas
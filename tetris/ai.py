@@ -0,0 +1,109 @@
+# A Tetris bot! For every piece it tries every way the piece could land (each rotation in
+# each column), and for each of those every way the NEXT piece could land too. Then it
+# scores the board each pair leaves behind and picks the best one.
+#     game = TetrisGame(seed=1)
+#     rotation, x = best_placement(game)   # Where should the falling piece go?
+#     game.place(rotation, x)
+#     result = play_game(seed=1)           # Or let it play a whole game with no window
+#
+# "Scoring the board" is done by a heuristic - a function that looks at a board and says how
+# good it is. You can hand in your own (see weighted_heuristic for the idea).
+from bitboard import BOARD_HEIGHT, tetriminos
+from engine import TetrisGame
+
+# Rotations that give a different shape (the O piece looks the same all 4 ways, I, S and Z just 2)
+UNIQUE_ROTATIONS = [sorted({tuple(sorted(shape)): rotation for rotation, shape in reversed(list(enumerate(piece['shapes'])))}.values())
+                    for piece in tetriminos]
+
+
+def features(board):
+    # The numbers the heuristic cares about: (aggregate height, holes, bumpiness)
+    tops = board.tops
+    aggregate_height = BOARD_HEIGHT * len(tops) - sum(tops)
+    bumpiness = sum(map(abs, map(int.__sub__, tops, tops[1:])))  # How jagged the top is
+    # A hole is an empty cell with a block somewhere above it. Going down the rows (from the
+    # highest block - everything above it is empty), `covered` has a bit for every column that
+    # has had a block so far, so the holes in a row are the covered columns empty in this row.
+    holes = 0
+    covered = 0
+    for row in board.rows[min(tops):]:
+        holes += bin(covered & ~row).count("1")  # (Counting 1 bits - int.bit_count() needs Python 3.10)
+        covered |= row
+    return aggregate_height, holes, bumpiness
+
+
+def weighted_heuristic(board, lines_cleared, weights=(-0.510066, 0.760666, -0.35663, -0.184483)):
+    # A well known set of weights: low and flat is good, holes are bad, clearing lines is good
+    height_weight, lines_weight, holes_weight, bumpiness_weight = weights
+    aggregate_height, holes, bumpiness = features(board)
+    return (height_weight * aggregate_height + lines_weight * lines_cleared +
+            holes_weight * holes + bumpiness_weight * bumpiness)
+
+
+def placements(board, piece_type, x, y):
+    # Every (rotation, column) the piece can reach from (x, y): turn it first, then slide it
+    # sideways - as long as nothing is in the way, it can then drop straight down.
+    for rotation in UNIQUE_ROTATIONS[piece_type]:
+        if board.collides(piece_type, rotation, x, y):
+            continue  # No room to turn here
+        yield rotation, x
+        for step in (-1, 1):
+            column = x + step
+            while not board.collides(piece_type, rotation, column, y):
+                yield rotation, column
+                column += step
+
+
+def spawn_y(piece_type):
+    # Where a new piece starts (same as TetrisGame.spawn)
+    return -max(dy for dx, dy in tetriminos[piece_type]['shapes'][0])
+
+
+def drop(board, piece_type, rotation, x, y):
+    # A copy of the board with the piece dropped at column x, and how many lines that cleared
+    after = board.copy()
+    after.place(piece_type, rotation, x, after.drop_y(piece_type, rotation, x, y))
+    return after, after.clear_lines()
+
+
+def best_placement(game, heuristic=weighted_heuristic, lookahead=True):
+    # The (rotation, x) for the falling piece that leads to the best board. With lookahead the
+    # next piece's best follow-up counts too, so we don't block a spot it needs.
+    board, piece = game.board, game.current_type
+    best, best_score = None, None
+    for rotation, x in placements(board, piece, game.current_x, game.current_y):
+        after, lines = drop(board, piece, rotation, x, game.current_y)
+        if lookahead:
+            score = None
+            next_piece, next_y = game.next_type, spawn_y(game.next_type)
+            for next_rotation, next_x in placements(after, next_piece, 3, next_y):
+                final, next_lines = drop(after, next_piece, next_rotation, next_x, next_y)
+                value = heuristic(final, lines + next_lines)
+                if score is None or value > score:
+                    score = value
+            if score is None:
+                score = float("-inf")  # The next piece would have nowhere to go - game over
+        else:
+            score = heuristic(after, lines)
+        if best_score is None or score > best_score:
+            best, best_score = (rotation, x), score
+    return best
+
+
+def play_game(seed, heuristic=weighted_heuristic, max_pieces=500, lookahead=True):
+    # Let the bot play one whole game (or max_pieces pieces) and report how it went
+    game = TetrisGame(seed)
+    scored = 0  # How many boards the heuristic looked at
+
+    def counted(board, lines_cleared):
+        nonlocal scored
+        scored += 1
+        return heuristic(board, lines_cleared)
+
+    while not game.game_over and game.pieces < max_pieces:
+        move = best_placement(game, counted, lookahead)
+        if move is None:
+            break  # Nowhere at all to put the piece
+        game.place(*move)
+    return {"seed": seed, "score": game.score, "lines": game.total_lines, "level": game.level,
+            "pieces": game.pieces, "game_over": game.game_over, "scored": scored}
@@ -0,0 +1,74 @@
+# Let the AI (ai.py) play thousands of Tetris games with no window, and see how it does.
+# Run it with: python benchmark_ai.py            (GAMES games of up to MAX_PIECES pieces)
+#          or: python benchmark_ai.py 200 100    (200 games of up to 100 pieces - a quick look)
+# Game number n always uses seed n, so every run plays exactly the same games. They're shared
+# out over all the computer's cores with a process pool (a few extra Pythons working side by
+# side). The scores come from engine.TetrisGame - the same rules and scoring as tetris.py.
+# "placements/sec" counts every landing spot the AI scored while thinking (including the
+# next piece's), "pieces/sec" the pieces it actually played.
+import functools
+import multiprocessing
+import os
+import sys
+import time
+
+from ai import play_game
+
+GAMES = 2000       # How many games to play
+MAX_PIECES = 200   # Stop a game after this many pieces, even if it's still going
+LOOKAHEAD = True   # Think about the next piece too (much better, but about 30x more work)
+WORKERS = os.cpu_count() or 1
+HISTOGRAM_BINS = 10
+BAR_WIDTH = 40
+
+
+def play(seed, max_pieces=MAX_PIECES):
+    return play_game(seed, max_pieces=max_pieces, lookahead=LOOKAHEAD)
+
+
+def percentile(values, p):
+    # values must be sorted
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else GAMES
+    max_pieces = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_PIECES
+    start = time.perf_counter()
+    with multiprocessing.Pool(WORKERS) as pool:
+        # (Handed to every game, not set as MAX_PIECES: on Windows and macOS the workers
+        # import this file afresh, so they'd never see a change made here)
+        results = pool.map(functools.partial(play, max_pieces=max_pieces), range(games), chunksize=max(1, games // (WORKERS * 8)))
+    elapsed = time.perf_counter() - start
+
+    scored = sum(result["scored"] for result in results)
+    pieces = sum(result["pieces"] for result in results)
+    print(f"{games} games, up to {max_pieces} pieces each, {WORKERS} worker(s), "
+          f"lookahead {'on' if LOOKAHEAD else 'off'}: {elapsed:.1f} s")
+    print(f"{'placements/sec':>15} {scored / elapsed:12,.0f}")
+    print(f"{'pieces/sec':>15} {pieces / elapsed:12,.0f}")
+    print(f"{'games/sec':>15} {games / elapsed:12,.1f}")
+    print(f"{'games over':>15} {sum(result['game_over'] for result in results):12,}")
+    print(f"{'mean lines':>15} {sum(result['lines'] for result in results) / games:12,.1f}")
+
+    scores = sorted(result["score"] for result in results)
+    print()
+    print("score " + " ".join(f"{name:>8}" for name in ("min", "p10", "p50", "p90", "max", "mean")))
+    print("      " + " ".join(f"{value:8,}" for value in (scores[0], percentile(scores, 10), percentile(scores, 50),
+                                                         percentile(scores, 90), scores[-1],
+                                                         round(sum(scores) / games))))
+
+    # A text histogram of the scores
+    print()
+    width = max(1, -(-(scores[-1] - scores[0] + 1) // HISTOGRAM_BINS))  # Round up, so the top score fits
+    counts = [0] * HISTOGRAM_BINS
+    for score in scores:
+        counts[(score - scores[0]) // width] += 1
+    for i, count in enumerate(counts):
+        low = scores[0] + i * width
+        bar = "#" * round(count / max(counts) * BAR_WIDTH)
+        print(f"{low:8,} - {low + width - 1:8,} {count:6} {bar}")
+
+
+if __name__ == "__main__":
+    main()
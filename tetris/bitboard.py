@@ -0,0 +1,162 @@
+# The Tetris board as "bitboards" - one whole number per row instead of a list of cells.
+# A number in binary is just a row of 0s and 1s, which is exactly what a Tetris row is:
+#     column:   9876543210
+#     row:    0b0000110111   <- columns 0, 1, 2, 4 and 5 are filled
+# Column c is the bit worth (1 << c). That turns the board questions into quick number tricks:
+#   - Does a piece bump into anything?  row & piece_row  (& keeps the bits that are in BOTH)
+#   - Is a row full?                    row == FULL_ROW  (one compare, not 10 checks)
+#   - Clearing lines?                   keep the rows that aren't full, add empty ones on top
+# The bits only say WHERE blocks are. A second grid (colors) remembers what color each block
+# is, and it's only used for drawing.
+#
+# The board also remembers the top block of every column (tops). A piece dropping straight
+# down lands where its bottom first meets one of those tops, so a hard drop (or the ghost
+# piece showing where it would land) takes one look per column instead of moving down a row
+# at a time.
+
+# The board: 10 cells wide, 20 cells tall
+BOARD_WIDTH, BOARD_HEIGHT = 10, 20
+FULL_ROW = (1 << BOARD_WIDTH) - 1  # 0b1111111111 - every column filled
+
+# Tetriminos are the falling pieces in Tetris. Each has a color and 4 possible shapes (for rotations).
+tetriminos = [
+    # 'I' piece: a long straight line
+    {'color': (0, 255, 255), 'shapes': [[(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)], [(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)]]},  # Cyan
+    # 'O' piece: a square (no rotation needed, so it’s the same 4 times)
+    {'color': (255, 255, 0), 'shapes': [[(0,0), (1,0), (0,1), (1,1)] for _ in range(4)]},  # Yellow
+    # 'T' piece: a T-shape
+    {'color': (128, 0, 128), 'shapes': [[(1,0), (0,1), (1,1), (2,1)], [(0,1), (1,0), (1,1), (1,2)], [(0,1), (1,1), (2,1), (1,2)], [(1,0), (1,1), (1,2), (2,1)]]},  # Purple
+    # 'S' piece: a zigzag
+    {'color': (0, 255, 0), 'shapes': [[(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)], [(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)]]},  # Green
+    # 'Z' piece: an opposite zigzag
+    {'color': (255, 0, 0), 'shapes': [[(0,0), (1,0), (1,1), (2,1)], [(1,0), (0,1), (1,1), (0,2)], [(0,0), (1,0), (1,1), (2,1)], [(1,0), (0,1), (1,1), (0,2)]]},  # Red
+    # 'J' piece: an L-shape flipped
+    {'color': (0, 0, 255), 'shapes': [[(0,0), (0,1), (1,1), (2,1)], [(1,0), (0,0), (0,1), (0,2)], [(0,1), (1,1), (2,1), (2,2)], [(1,2), (0,0), (0,1), (0,2)]]},  # Blue
+    # 'L' piece: an L-shape
+    {'color': (255, 165, 0), 'shapes': [[(2,0), (0,1), (1,1), (2,1)], [(0,0), (0,1), (0,2), (1,2)], [(0,1), (1,1), (2,1), (0,2)], [(1,0), (0,0), (0,1), (0,2)]]}  # Orange
+]
+# Each shape is a list of (x, y) coordinates showing where the blocks are relative to a starting point.
+
+
+def shape_rows(shape):
+    # Turn a shape into bitboard rows: a list of (dy, bits) with the piece sitting in column 0
+    rows = {}
+    for dx, dy in shape:
+        rows[dy] = rows.get(dy, 0) | (1 << dx)
+    return sorted(rows.items())
+
+
+def column_masks(shape):
+    # The shape's bitboard rows already slid over to every column x it fits in: {x: rows}.
+    # Columns where it would stick out of the board just aren't in the dictionary.
+    rows = shape_rows(shape)
+    left = min(dx for dx, dy in shape)
+    right = max(dx for dx, dy in shape)
+    return {x: tuple((dy, bits << x if x >= 0 else bits >> -x) for dy, bits in rows)
+            for x in range(-left, BOARD_WIDTH - right)}
+
+
+def bottom_profile(shape):
+    # For each column the shape uses: (dx, the lowest dy in that column)
+    columns = {}
+    for dx, dy in shape:
+        columns[dx] = max(columns.get(dx, dy), dy)
+    return tuple(sorted(columns.items()))
+
+
+# Everything about every shape worked out once, so moving a piece never has to look at the
+# (x, y) lists again. All of them are used as TABLE[type][rotation]:
+PIECE_MASKS = [[column_masks(shape) for shape in piece['shapes']] for piece in tetriminos]    # Rows in every column
+PIECE_BOTTOMS = [[bottom_profile(shape) for shape in piece['shapes']] for piece in tetriminos]  # Lowest block per column
+
+
+class Board:
+    def __init__(self):
+        self.rows = [0] * BOARD_HEIGHT  # One number per row, row 0 is the top
+        self.colors = [[None] * BOARD_WIDTH for _ in range(BOARD_HEIGHT)]  # Just for drawing
+        self.tops = [BOARD_HEIGHT] * BOARD_WIDTH  # The top block's row in each column (BOARD_HEIGHT if empty)
+
+    def copy(self):
+        # A copy to try moves on (the AI does this a lot). It leaves out the colors, which are
+        # only for drawing, so making one is just copying two short lists of numbers.
+        board = Board.__new__(Board)
+        board.rows = self.rows[:]
+        board.colors = None
+        board.tops = self.tops[:]
+        return board
+
+    def collides(self, piece_type, rotation, x, y):
+        # Would this piece at (x, y) stick out of the board or overlap a block?
+        masks = PIECE_MASKS[piece_type][rotation].get(x)
+        if masks is None:
+            return True  # Off the left or right side
+        rows = self.rows
+        for dy, bits in masks:
+            row = y + dy
+            if row >= BOARD_HEIGHT:
+                return True  # Below the bottom
+            if row >= 0 and rows[row] & bits:
+                return True  # Overlaps a block that's already there
+        return False  # Rows above the board (row < 0) are always empty
+
+    def drop_y(self, piece_type, rotation, x, y):
+        # Where would this piece land if it dropped straight down from (x, y)?
+        tops = self.tops
+        landing = BOARD_HEIGHT
+        for dx, bottom in PIECE_BOTTOMS[piece_type][rotation]:
+            top = tops[x + dx]
+            if y + bottom >= top:
+                # Part of the piece is already below this column's top block (it slid in under
+                # an overhang), so the tops can't tell us - move it down one row at a time instead
+                while not self.collides(piece_type, rotation, x, y + 1):
+                    y += 1
+                return y
+            landing = min(landing, top - 1 - bottom)  # Its lowest block stops on top of the column
+        return landing
+
+    def place(self, piece_type, rotation, x, y):
+        # Stamp the piece into the board (any part above the top is lost)
+        color = tetriminos[piece_type]['color']
+        for dy, bits in PIECE_MASKS[piece_type][rotation][x]:
+            row = y + dy
+            if row >= 0:
+                self.rows[row] |= bits
+        for dx, dy in tetriminos[piece_type]['shapes'][rotation]:
+            if y + dy >= 0:
+                if self.colors is not None:
+                    self.colors[y + dy][x + dx] = color
+                self.tops[x + dx] = min(self.tops[x + dx], y + dy)  # Maybe the new top of its column
+
+    def clear_lines(self):
+        # Remove every full row, slide the rest down, and say how many went
+        if FULL_ROW not in self.rows:
+            return 0  # Nearly every piece clears nothing, so check that first
+        keep = [row for row in range(BOARD_HEIGHT) if self.rows[row] != FULL_ROW]
+        cleared = BOARD_HEIGHT - len(keep)
+        if cleared:
+            old_rows = self.rows
+            self.rows = [0] * cleared + [old_rows[row] for row in keep]
+            if self.colors is not None:
+                self.colors = [[None] * BOARD_WIDTH for _ in range(cleared)] + [self.colors[row] for row in keep]
+            # A full row has a block in every column, so every cleared row is at or below each
+            # column's top. If the top block stayed, it just slid down by `cleared` rows. If it
+            # was in a cleared row, look down from there for the column's next block.
+            for col in range(BOARD_WIDTH):
+                top = self.tops[col]
+                if old_rows[top] != FULL_ROW:
+                    self.tops[col] = top + cleared
+                else:
+                    while top < BOARD_HEIGHT and not self.rows[top] >> col & 1:
+                        top += 1
+                    self.tops[col] = top
+        return cleared
+
+    def fill_junk(self, count, rng, color):
+        # Fill the bottom count rows with junk: every cell but one random gap in each row
+        for row in range(BOARD_HEIGHT - count, BOARD_HEIGHT):
+            gap = rng.randrange(BOARD_WIDTH)
+            self.rows[row] = FULL_ROW & ~(1 << gap)
+            if self.colors is not None:
+                self.colors[row] = [None if col == gap else color for col in range(BOARD_WIDTH)]
+        for col in range(BOARD_WIDTH):  # The junk can change every column's top block
+            self.tops[col] = next((row for row in range(BOARD_HEIGHT) if self.rows[row] >> col & 1), BOARD_HEIGHT)
@@ -0,0 +1,133 @@
+# The rules of Tetris, with no window, no sound and no keyboard.
+# tetris.py shows a TetrisGame on screen and plays sounds, the AI (ai.py) plays thousands
+# of them as fast as it can, and they all use exactly the same rules and scoring.
+#     game = TetrisGame(seed=1)   # Same seed = same pieces in the same order
+#     game.move(-1)               # Left (returns True if it moved)
+#     game.rotate()
+#     lines = game.hard_drop()    # Drop it, land it, and bring in the next piece
+import random
+
+from bitboard import Board, tetriminos
+
+SCORES = [0, 40, 100, 300, 1200]  # Points for clearing 0, 1, 2, 3 or 4 lines at once (times level + 1)
+TICKS_PER_SECOND = 60  # Gravity counts game ticks (arcade_common/game_loop.py runs 60 a second)
+JUNK_COLOR = (128, 128, 128)  # Gray, for the junk rows of fill_junk()
+
+
+class TetrisGame:
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.randrange(1 << 32)  # Pick one, but remember it (a replay needs it)
+        self.seed = seed
+        self.rng = random.Random(seed)  # The game's own random numbers, so a seed replays the same pieces
+        self.board = Board()
+        self.score = 0  # Keeps track of your points.
+        self.level = 0  # Starts at level 0; increases with more lines cleared.
+        self.total_lines = 0  # Counts how many lines you’ve cleared.
+        self.fall_speed = 0.5  # How fast pieces fall (in seconds per drop) – starts slow.
+        self.game_over = False
+        self.pieces = 0  # How many pieces have landed
+        self.fall_ticks = 0  # Ticks since the piece last fell a row
+        self.next_type = self.rng.randint(0, 6)  # Picks a random number (0-6) for the next Tetrimino type.
+        self.spawn()
+
+    def spawn(self):
+        # The next piece becomes the falling piece, at the top in the middle
+        self.current_type = self.next_type
+        self.next_type = self.rng.randint(0, 6)  # Pick a new random piece for next time.
+        self.current_rotation = 0
+        self.current_x = 3  # Start near the middle of the board (column 3 out of 10).
+        shape = tetriminos[self.current_type]['shapes'][0]
+        self.current_y = -max(dy for dx, dy in shape)  # Start above the board so it drops in smoothly.
+        if self.board.collides(self.current_type, 0, self.current_x, self.current_y):
+            self.game_over = True  # No room for the new piece - the board is too full!
+        else:
+            self.ghost_y = self.board.drop_y(self.current_type, 0, self.current_x, self.current_y)  # Where it would land.
+
+    def can_move(self, x, y, rotation):
+        return not self.board.collides(self.current_type, rotation, x, y)
+
+    def move(self, dx):
+        # Slide the piece left (-1) or right (+1) if there's room
+        if not self.can_move(self.current_x + dx, self.current_y, self.current_rotation):
+            return False
+        self.current_x += dx
+        self.ghost_y = self.board.drop_y(self.current_type, self.current_rotation, self.current_x, self.current_y)
+        return True
+
+    def rotate(self):
+        # Turn the piece to its next rotation if there's room
+        rotation = (self.current_rotation + 1) % 4
+        if not self.can_move(self.current_x, self.current_y, rotation):
+            return False
+        self.current_rotation = rotation
+        self.ghost_y = self.board.drop_y(self.current_type, rotation, self.current_x, self.current_y)
+        return True
+
+    def soft_drop(self):
+        # Move the piece down one row if it can (the down arrow)
+        if not self.can_move(self.current_x, self.current_y + 1, self.current_rotation):
+            return False
+        self.current_y += 1
+        return True
+
+    def gravity(self):
+        # Call once every tick: is it time for the piece to fall a row? (every fall_speed seconds)
+        self.fall_ticks += 1
+        if self.fall_ticks < round(self.fall_speed * TICKS_PER_SECOND):
+            return False
+        self.fall_ticks = 0
+        return True
+
+    def advance(self, ticks):
+        # Run this many ticks of gravity at once (a replay does this between key presses). It
+        # jumps straight from one fall to the next instead of counting every tick, but ends up
+        # exactly where calling gravity() each tick would.
+        while ticks > 0 and not self.game_over:
+            wait = max(1, round(self.fall_speed * TICKS_PER_SECOND) - self.fall_ticks)  # Ticks until it falls
+            if wait > ticks:
+                self.fall_ticks += ticks
+                return
+            ticks -= wait
+            self.fall_ticks = 0
+            self.fall()
+
+    def fall(self):
+        # Gravity: move down a row, or land if it can't. Returns lines cleared (None if it just fell).
+        if self.soft_drop():
+            return None
+        return self.land()
+
+    def hard_drop(self):
+        # Straight down to where the ghost piece is, and land there
+        self.current_y = self.ghost_y
+        return self.land()
+
+    def land(self):
+        # Lock the piece into the board, clear lines, score them, and spawn the next piece.
+        # Returns how many lines were cleared.
+        self.board.place(self.current_type, self.current_rotation, self.current_x, self.current_y)
+        self.pieces += 1
+        lines_cleared = self.board.clear_lines()
+        if lines_cleared > 0:
+            self.score += SCORES[lines_cleared] * (self.level + 1)  # Points for lines, times the level.
+            self.total_lines += lines_cleared
+            new_level = self.total_lines // 10  # Every 10 lines, level up!
+            if new_level > self.level:
+                self.level = new_level
+                self.fall_speed = max(0.1, 0.5 - self.level * 0.05)  # Pieces fall faster (but not below 0.1 seconds).
+        self.spawn()
+        return lines_cleared
+
+    def place(self, rotation, x):
+        # Put the falling piece straight into its final spot: turn it, slide it to column x and
+        # hard drop it (what a bot does). Returns lines cleared.
+        self.current_rotation = rotation
+        self.current_x = x
+        self.ghost_y = self.board.drop_y(self.current_type, rotation, x, self.current_y)
+        return self.hard_drop()
+
+    def fill_junk(self, rows):
+        # Start with the bottom rows full of junk, a gap in each (tetris.py's stress mode)
+        self.board.fill_junk(rows, self.rng, JUNK_COLOR)
+        self.ghost_y = self.board.drop_y(self.current_type, self.current_rotation, self.current_x, self.current_y)
@@ -0,0 +1,190 @@
+# Tetris replays: a tiny file that remembers a whole game, so it can be played back and checked.
+# Instead of a video, a replay only keeps what it takes to play the exact same game again:
+#   - the seed (so the same pieces come in the same order)
+#   - every key press the game used, and the tick it happened on (5 bytes each)
+#   - at the end: the final score, lines, level and board, so playback can check it got there too
+# tetris.py records every game it plays into replay_dir(). Check them with:
+#     python replay.py                      (every replay in replay_dir())
+#     python replay.py some/folder a.tetr   (replays in a folder, or single files)
+# Playback needs no window, and it skips straight over the ticks where nothing but gravity
+# happens, so it runs thousands of times faster than the real game.
+#
+# The file: MAGIC and a HEADER (the seed), then a RECORD (tick, action) for every key press.
+# When the game ends, one last RECORD with action END and then the RESULT. Every record is
+# just added to the end of the file, so a game cut short is still a good replay (it just
+# can't be checked).
+import mmap
+import os
+import struct
+import sys
+import time
+
+from bitboard import BOARD_HEIGHT
+from engine import TetrisGame, TICKS_PER_SECOND
+
+MAGIC = b"TETRPLY1"
+HEADER = struct.Struct("<Q")              # The seed
+RECORD = struct.Struct("<IB")             # Tick, action
+RESULT = struct.Struct(f"<IIIIB{BOARD_HEIGHT}H")  # Score, lines, level, pieces, game over, the board's rows
+FOOTER_SIZE = RECORD.size + RESULT.size
+EXTENSION = ".tetr"
+
+# The actions (what the keys in tetris.py do)
+LEFT, RIGHT, DOWN, ROTATE, DROP = range(5)
+END = 255  # Not a key: marks the end of the game, with the RESULT after it
+
+
+def replay_dir():
+    # Where tetris.py saves replays. Set ARCADE_REPLAY_DIR to put them somewhere else.
+    if "ARCADE_REPLAY_DIR" in os.environ:
+        return os.environ["ARCADE_REPLAY_DIR"]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "arcade_arcadia", "tetris_replays")
+
+
+def apply(game, action):
+    # Do what a key press does (the same as the keys in tetris.py)
+    if game.game_over:
+        return
+    if action == LEFT:
+        game.move(-1)
+    elif action == RIGHT:
+        game.move(1)
+    elif action == DOWN:
+        game.soft_drop()
+    elif action == ROTATE:
+        game.rotate()
+    elif action == DROP:
+        game.hard_drop()
+
+
+def result_of(game):
+    return (game.score, game.total_lines, game.level, game.pieces, game.game_over, *game.board.rows)
+
+
+class Recorder:
+    # Writes one game's replay as it's played. Key presses collect in a buffer and go to the
+    # disk in big chunks, so recording costs next to nothing while you play.
+    def __init__(self, seed, path=None):
+        if path is None:
+            path = os.path.join(replay_dir(), time.strftime("%Y%m%d-%H%M%S") + f"-{seed}{EXTENSION}")
+        self.path = path
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.file = open(path, "ab", buffering=64 * 1024)
+            self.file.write(MAGIC + HEADER.pack(seed))
+        except OSError:
+            self.file = None  # Can't save it? The game still works, it just isn't recorded
+
+    def record(self, tick, action):
+        if self.file is not None:
+            self.file.write(RECORD.pack(tick, action))
+
+    def finish(self, game, tick):
+        # Write the end of the game and close the file (only the first call does anything)
+        if self.file is not None:
+            self.file.write(RECORD.pack(tick, END) + RESULT.pack(*result_of(game)))
+            self.file.close()
+            self.file = None
+
+
+class Replay:
+    # Reads a replay file. It's memory-mapped, so even a big pile of replays is only read
+    # from the disk as playback gets to it.
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < len(MAGIC) + HEADER.size:
+                raise ValueError(f"{path}: too short to be a replay")
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a Tetris replay")
+        self.seed, = HEADER.unpack_from(self.map, len(MAGIC))
+        start = len(MAGIC) + HEADER.size
+        end = len(self.map)
+        self.result = None   # The final score and board, if the game got to the end
+        self.end_tick = None
+        footer = end - FOOTER_SIZE
+        if footer >= start and (footer - start) % RECORD.size == 0 and self.map[footer + 4] == END:
+            self.end_tick = RECORD.unpack_from(self.map, footer)[0]
+            self.result = RESULT.unpack_from(self.map, footer + RECORD.size)
+            end = footer
+        end -= (end - start) % RECORD.size  # A key press that was only half written is dropped
+        self.records = memoryview(self.map)[start:end]
+
+    def actions(self):
+        # Every (tick, action), in order
+        return RECORD.iter_unpack(self.records)
+
+    def close(self):
+        self.records.release()
+        self.map.close()
+
+
+def play_back(replay):
+    # Play the replay's game with no window. Returns the finished TetrisGame and how many ticks it ran.
+    game = TetrisGame(replay.seed)
+    tick = 0
+    for stamp, action in replay.actions():
+        game.advance(stamp - tick)  # Gravity between key presses (the key comes before that tick's gravity)
+        tick = stamp
+        apply(game, action)
+    if replay.end_tick is not None:
+        game.advance(replay.end_tick - tick)
+        tick = replay.end_tick
+    return game, tick
+
+
+def verify(path):
+    # Play a replay back and check it ends exactly as recorded. Returns (status, ticks played).
+    replay = Replay(path)
+    try:
+        game, ticks = play_back(replay)
+        if replay.result is None:
+            return "unfinished", ticks  # Nothing to check against
+        if result_of(game) != replay.result:
+            expected, got = replay.result, result_of(game)
+            return (f"MISMATCH score {got[0]} (recorded {expected[0]}), lines {got[1]} "
+                    f"(recorded {expected[1]}), board {'same' if got[5:] == expected[5:] else 'different'}"), ticks
+        return "ok", ticks
+    finally:
+        replay.close()
+
+
+def replay_files(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(EXTENSION):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def main():
+    files = list(replay_files(sys.argv[1:] or [replay_dir()]))
+    counts = {}
+    total_ticks = 0
+    start = time.perf_counter()
+    for path in files:
+        try:
+            status, ticks = verify(path)
+        except (OSError, ValueError) as error:
+            status, ticks = f"UNREADABLE {error}", 0
+        total_ticks += ticks
+        counts[status.split()[0]] = counts.get(status.split()[0], 0) + 1
+        if status != "ok":
+            print(f"{path}: {status}")
+    elapsed = time.perf_counter() - start
+    game_seconds = total_ticks / TICKS_PER_SECOND
+    print(f"{len(files)} replays: " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    if elapsed > 0 and total_ticks:
+        print(f"{game_seconds / 60:,.1f} minutes of play checked in {elapsed:.2f} s "
+              f"({game_seconds / elapsed:,.0f}x real time)")
+    if any(status not in ("ok", "unfinished") for status in counts):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,259 +1,315 @@
-# Import Pygame for graphics and sound, and random for picking Tetriminos
+# Import Pygame for graphics and sound (the game picks its random Tetriminos in engine.py)
 import pygame  # This is a library that helps us make games with graphics, sound, and input handling.
-import random  # This lets us pick random numbers, which we’ll use to choose the next Tetris piece.
-import numpy as np  # A math library we’ll use to create sound effects with waves.
-
-# Start Pygame
-pygame.init()  # This wakes up Pygame so it’s ready to handle graphics, sound, and more.
-
-# Set up the game window: 475x600 pixels
-WIDTH, HEIGHT = 475, 600  # These are the width and height of our game window in pixels.
-screen = pygame.display.set_mode((WIDTH, HEIGHT))  # Creates the window we’ll draw everything on.
-pygame.display.set_caption("Tetris")  # Sets the window title to "Tetris" – neat, right?
-
-# Define colors in RGB format (Red, Green, Blue values from 0 to 255)
-BLACK = (0, 0, 0)    # Pure black for the background – all zeros mean no color.
-WHITE = (255, 255, 255)  # Bright white for text – all 255s mean full color.
-GRAY = (128, 128, 128)   # A medium gray for block borders – halfway between black and white.
-
-# Define the game board: 10x20 grid, 30x30 pixel cells
-BOARD_WIDTH, BOARD_HEIGHT = 10, 20  # The board is 10 cells wide and 20 cells tall.
-CELL_SIZE = 30  # Each cell (or square) on the board is 30 pixels by 30 pixels.
-
-# Define Tetriminos (shapes, colors, and rotations)
-# Tetriminos are the falling pieces in Tetris. Each has a color and 4 possible shapes (for rotations).
-tetriminos = [
-    # 'I' piece: a long straight line
-    {'color': (0, 255, 255), 'shapes': [[(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)], [(0,0), (1,0), (2,0), (3,0)], [(0,0), (0,1), (0,2), (0,3)]]},  # Cyan
-    # 'O' piece: a square (no rotation needed, so it’s the same 4 times)
-    {'color': (255, 255, 0), 'shapes': [[(0,0), (1,0), (0,1), (1,1)] for _ in range(4)]},  # Yellow
-    # 'T' piece: a T-shape
-    {'color': (128, 0, 128), 'shapes': [[(1,0), (0,1), (1,1), (2,1)], [(0,1), (1,0), (1,1), (1,2)], [(0,1), (1,1), (2,1), (1,2)], [(1,0), (1,1), (1,2), (2,1)]]},  # Purple
-    # 'S' piece: a zigzag
-    {'color': (0, 255, 0), 'shapes': [[(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)], [(1,0), (2,0), (0,1), (1,1)], [(0,0), (0,1), (1,1), (1,2)]]},  # Green
-    # 'Z' piece: an opposite zigzag
-    {'color': (255, 0, 0), 'shapes': [[(0,0), (1,0), (1,1), (2,1)], [(1,0), (0,1), (1,1), (0,2)], [(0,0), (1,0), (1,1), (2,1)], [(1,0), (0,1), (1,1), (0,2)]]},  # Red
-    # 'J' piece: an L-shape flipped
-    {'color': (0, 0, 255), 'shapes': [[(0,0), (0,1), (1,1), (2,1)], [(1,0), (0,0), (0,1), (0,2)], [(0,1), (1,1), (2,1), (2,2)], [(1,2), (0,0), (0,1), (0,2)]]},  # Blue
-    # 'L' piece: an L-shape
-    {'color': (255, 165, 0), 'shapes': [[(2,0), (0,1), (1,1), (2,1)], [(0,0), (0,1), (0,2), (1,2)], [(0,1), (1,1), (2,1), (0,2)], [(1,0), (0,0), (0,1), (0,2)]]}  # Orange
-]
-# Each shape is a list of (x, y) coordinates showing where the blocks are relative to a starting point.
-
-# Create an empty game board
-# This makes a 20-row, 10-column grid where each spot starts as None (empty).
-board = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
-
-# Set up clock and font
-clock = pygame.time.Clock()  # Helps control the game speed – like a metronome!
-font = pygame.font.SysFont("Arial", 24)  # Sets up a font (Arial, size 24) for text like the score.
-
-# Initialize Pygame's sound system
-pygame.mixer.init(frequency=44100, size=-16, channels=1)  # Sets up sound: 44100 Hz (standard audio rate), 16-bit, mono (1 channel).
-
-# Load and play background music
-pygame.mixer.music.load('/your/file/path/here/tetris/Tetris_remix.wav')  # Loads a music file (Change the file path to what's relevant to your computer!).
-pygame.mixer.music.set_volume(0.5)  # Sets volume to half strength (0.0 to 1.0 scale).
-pygame.mixer.music.play(-1)  # Plays the music in a loop forever (-1 means infinite).
-
-# Function to generate a simple sine wave sound
-def generate_sound(frequency, duration):
-    # This creates a sound effect by making a sine wave (a smooth beep or tone).
-    sample_rate = 44100  # How many sound samples per second – 44100 is CD quality.
-    n_samples = int(sample_rate * duration)  # Total samples based on how long the sound lasts.
-    t = np.linspace(0, duration, n_samples, False)  # Splits time into tiny steps for the wave.
-    audio = 32767 * np.sin(2 * np.pi * frequency * t)  # Makes a sine wave at the given frequency (pitch).
-    sound_array = audio.astype(np.int16)  # Turns the wave into a format Pygame understands (16-bit numbers).
-    stereo_array = np.column_stack((sound_array, sound_array))  # Makes it stereo by duplicating for left and right speakers.
-    return pygame.sndarray.make_sound(stereo_array)  # Turns it into a playable sound.
-
-# Create sound effects with different frequencies and durations
-move_sound = generate_sound(440, 0.1)      # A short beep (A4 note) when moving left or right.
-rotate_sound = generate_sound(523, 0.1)    # A higher beep (C5) for rotating a piece.
-land_sound = generate_sound(261, 0.2)      # A deeper thud (C4) when a piece lands.
-line_sound = generate_sound(659, 0.3)      # A longer chime (E5) when you clear a line.
-gameover_sound = generate_sound(196, 0.5)  # A low tone (G3) for game over – sounds dramatic!
-
-# Game variables
-score = 0  # Keeps track of your points.
-level = 0  # Starts at level 0; increases with more lines cleared.
-total_lines = 0  # Counts how many lines you’ve cleared.
-fall_speed = 0.5  # How fast pieces fall (in seconds per drop) – starts slow.
-fall_time = 0  # Tracks time since the last drop.
-game_over = False  # False means the game is still going; True means it’s done.
-next_type = random.randint(0, 6)  # Picks a random number (0-6) for the next Tetrimino type.
-
-# Spawn a new Tetrimino
-def spawn_new_tetrimino():
-    global current_type, current_rotation, current_x, current_y, next_type, game_over  # These are variables we’ll change everywhere.
-    current_type = next_type  # The current piece becomes the one that was next.
-    next_type = random.randint(0, 6)  # Pick a new random piece for next time.
-    current_rotation = 0  # Start with the first rotation (0 out of 4).
-    current_x = 3  # Start near the middle of the board (column 3 out of 10).
-    shape = tetriminos[current_type]['shapes'][current_rotation]  # Get the shape of this piece.
-    max_dy = max(dy for dx, dy in shape)  # Find the tallest part of the shape (highest y value).
-    current_y = -max_dy  # Start above the board so it drops in smoothly.
-    for dx, dy in shape:  # Check each block in the shape.
-        board_x = current_x + dx  # Where it lands horizontally.
-        board_y = current_y + dy  # Where it lands vertically.
-        if board_y >= 0 and board[board_y][board_x] is not None:  # If it’s on the board and hits something...
-            game_over = True  # Game ends because the board is too full!
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # So we can find arcade_common
+from arcade_common import synth  # The sound maker all the games share – it makes our beeps from waves.
+from arcade_common.game_loop import GameLoop, SEED  # The game loop all the games share – a steady 60 ticks a second.
+from arcade_common import text  # Text pictures made once and reused (see arcade_common/text.py).
+from arcade_common.frame_timer import FrameTimer  # Where each frame's time goes (F3, see arcade_common/frame_timer.py).
+
+def main():
+    # Everything from here on happens when the game starts: "python tetris.py", or picking
+    # it in the arcade launcher (arcade_common/launcher.py). Importing this file doesn't open a
+    # window or make a sound, so the launcher can load it quietly in the background.
+    # Start Pygame
+    pygame.init()  # This wakes up Pygame so it’s ready to handle graphics, sound, and more.
+
+    # Set up the game window: 475x600 pixels
+    WIDTH, HEIGHT = 475, 600  # These are the width and height of our game window in pixels.
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))  # Creates the window we’ll draw everything on.
+    pygame.display.set_caption("Tetris")  # Sets the window title to "Tetris" – neat, right?
+
+    # Define colors in RGB format (Red, Green, Blue values from 0 to 255)
+    BLACK = (0, 0, 0)    # Pure black for the background – all zeros mean no color.
+    WHITE = (255, 255, 255)  # Bright white for text – all 255s mean full color.
+    GRAY = (128, 128, 128)   # A medium gray for block borders – halfway between black and white.
+
+    # The game board lives in bitboard.py: 10x20 cells, one number per row (see that file for how it works)
+    from bitboard import BOARD_WIDTH, BOARD_HEIGHT, tetriminos  # The board’s size and the Tetriminos (shapes and colors)
+    # The rules (moving, landing, scoring, levels) live in engine.py, so bots can play without a window
+    from engine import TetrisGame
+    # Every game is saved as a tiny replay (the seed and your key presses) - see replay.py
+    import replay
+    CELL_SIZE = 30  # Each cell (or square) on the board is 30 pixels by 30 pixels.
+
+    # Set up the game loop and font
+    loop = GameLoop()  # Keeps the game ticking at a steady speed – like a metronome!
+    timer = FrameTimer()  # Press F3 to see where each frame's time goes.
+    font = text.sysfont("Arial", 24)  # Sets up a font (Arial, size 24) for text like the score (shared, see arcade_common/text.py).
+
+    # Initialize Pygame's sound system
+    pygame.mixer.init(frequency=44100, size=-16, channels=1)  # Sets up sound: 44100 Hz (standard audio rate), 16-bit, mono (1 channel).
+
+    # Load and play background music
+    try:
+        pygame.mixer.music.load('/your/file/path/here/tetris/Tetris_remix.wav')  # Loads a music file (Change the file path to what's relevant to your computer!).
+        pygame.mixer.music.set_volume(0.5)  # Sets volume to half strength (0.0 to 1.0 scale).
+        pygame.mixer.music.play(-1)  # Plays the music in a loop forever (-1 means infinite).
+    except pygame.error:
+        pass  # No music file there? The game still works, just without the music.
+
+    # Create sound effects with different frequencies and durations – smooth sine wave tones
+    # from the shared synth (they're saved in a sound bank, so the next start is instant).
+    move_sound = synth.tone(440, 0.1, wave="sine")      # A short beep (A4 note) when moving left or right.
+    rotate_sound = synth.tone(523, 0.1, wave="sine")    # A higher beep (C5) for rotating a piece.
+    land_sound = synth.tone(261, 0.2, wave="sine")      # A deeper thud (C4) when a piece lands.
+    line_sound = synth.tone(659, 0.3, wave="sine")      # A longer chime (E5) when you clear a line.
+    gameover_sound = synth.tone(196, 0.5, wave="sine", release=0.2)  # A low tone (G3) for game over – fades out, sounds dramatic!
+
+    # Stress mode: ARCADE_STRESS_FILL=14 starts every game with the bottom 14 rows full of junk (a
+    # gap in each), and a new game starts as soon as one is over. Handy for seeing how fast the
+    # game really is with a busy board.
+    stress_fill = int(os.environ.get("ARCADE_STRESS_FILL", "0"))
+
+    def new_game():
+        game = TetrisGame(seed=SEED)  # (SEED is None - new pieces every game - unless ARCADE_SEED is set)
+        if stress_fill:
+            game.fill_junk(stress_fill)
+        return game
+
+    # The game itself: the board, the falling piece, the next piece, score, level and lines all live in here
+    game = new_game()
+    recorder = replay.Recorder(game.seed, os.devnull if stress_fill else None)  # Writes this game's replay as you play (not junk games - they can't be replayed)
+    # The keys a replay remembers, and the action each one is saved as
+    KEY_ACTIONS = {pygame.K_LEFT: replay.LEFT, pygame.K_RIGHT: replay.RIGHT, pygame.K_DOWN: replay.DOWN,
+                   pygame.K_UP: replay.ROTATE, pygame.K_SPACE: replay.DROP}
+
+    # Land a Tetrimino on the board (the game does the landing, clearing and scoring - we do the sounds and drawing)
+    def land_tetrimino():
+        shape = tetriminos[game.current_type]['shapes'][game.current_rotation]
+        top = game.current_y + min(dy for dx, dy in shape)  # The rows the piece landed in...
+        bottom = game.current_y + max(dy for dx, dy in shape)
+        lines_cleared = game.land()  # Lock it in, remove full rows, add points, and bring in the next piece.
+        land_sound.play()  # Play a thud sound – it’s landed!
+        # ...changed, and if lines were cleared, everything above them slid down too
+        redraw_board_rows(0 if lines_cleared else top, bottom)
+        if lines_cleared > 0:  # If we cleared any lines...
+            line_sound.play()  # Play a happy chime!
+        if game.game_over:  # No room for the next piece?
             gameover_sound.play()  # Play that sad game-over sound.
-            break  # Stop checking – it’s over.
-
-# Check if a move or rotation is possible
-def can_move(x, y, rotation):
-    shape = tetriminos[current_type]['shapes'][rotation]  # Get the shape for this rotation.
-    for dx, dy in shape:  # Look at each block in the shape.
-        board_x = x + dx  # New x position.
-        board_y = y + dy  # New y position.
-        if board_x < 0 or board_x >= BOARD_WIDTH or board_y >= BOARD_HEIGHT:  # Off the sides or bottom?
-            return False  # Can’t move there.
-        if board_y >= 0 and board[board_y][board_x] is not None:  # Hits another block?
-            return False  # Can’t move there either.
-    return True  # All clear – move is okay!
-
-# Land a Tetrimino on the board
-def land_tetrimino():
-    global score, total_lines, level, fall_speed  # Update these game stats.
-    shape = tetriminos[current_type]['shapes'][current_rotation]  # Get the current shape.
-    for dx, dy in shape:  # For each block in the shape...
-        board_x = current_x + dx  # Where it lands horizontally.
-        board_y = current_y + dy  # Where it lands vertically.
-        if board_y >= 0:  # If it’s on the board (not above it)...
-            board[board_y][board_x] = tetriminos[current_type]['color']  # Paint it with the piece’s color.
-    land_sound.play()  # Play a thud sound – it’s landed!
-    lines_cleared = 0  # Count how many lines we clear.
-    for row in range(BOARD_HEIGHT - 1, -1, -1):  # Check each row from bottom to top.
-        if all(cell is not None for cell in board[row]):  # If every cell in the row is filled...
-            del board[row]  # Remove that row.
-            board.insert(0, [None for _ in range(BOARD_WIDTH)])  # Add an empty row at the top.
-            lines_cleared += 1  # Add to our line count.
-    if lines_cleared > 0:  # If we cleared any lines...
-        line_sound.play()  # Play a happy chime!
-        score += [0, 40, 100, 300, 1200][lines_cleared] * (level + 1)  # Add points based on lines cleared and level.
-        total_lines += lines_cleared  # Update total lines.
-        new_level = total_lines // 10  # Every 10 lines, level up!
-        if new_level > level:  # If we hit a new level...
-            level = new_level  # Update the level.
-            fall_speed = max(0.1, 0.5 - level * 0.05)  # Pieces fall faster (but not below 0.1 seconds).
-    spawn_new_tetrimino()  # Bring in the next piece.
-
-# Function to create a pronounced gradient effect for blocks
-def draw_gradient_block(surface, x, y, size, base_color):
-    # This makes blocks look fancy with a light-to-dark gradient.
-    light_color = tuple(min(c + 70, 255) for c in base_color)  # Brighten the color (but not past 255).
-    dark_color = tuple(max(c - 70, 0) for c in base_color)     # Darken the color (but not below 0).
-    for i in range(size):  # Draw the block line by line.
-        r = int(light_color[0] + (dark_color[0] - light_color[0]) * i / size)  # Blend red.
-        g = int(light_color[1] + (dark_color[1] - light_color[1]) * i / size)  # Blend green.
-        b = int(light_color[2] + (dark_color[2] - light_color[2]) * i / size)  # Blend blue.
-        pygame.draw.line(surface, (r, g, b), (x, y + i), (x + size - 1, y + i))  # Draw a horizontal line.
-    pygame.draw.rect(surface, GRAY, (x, y, size, size), 1)  # Add a gray border around the block.
-
-# Draw the game board with gradient blocks
-def draw_board():
-    for row in range(BOARD_HEIGHT):  # Go through every row.
-        for col in range(BOARD_WIDTH):  # And every column.
-            if board[row][col] is not None:  # If there’s a block there...
-                draw_gradient_block(screen, col * CELL_SIZE, row * CELL_SIZE, CELL_SIZE, board[row][col])  # Draw it!
-
-# Draw the current Tetrimino with gradient blocks
-def draw_tetrimino(x, y, type, rotation):
-    shape = tetriminos[type]['shapes'][rotation]  # Get the shape of the falling piece.
-    color = tetriminos[type]['color']  # Get its color.
-    for dx, dy in shape:  # For each block in the shape...
-        board_x = x + dx  # Where it is horizontally.
-        board_y = y + dy  # Where it is vertically.
-        if board_y >= 0:  # If it’s on the visible board (not above it)...
-            draw_gradient_block(screen, board_x * CELL_SIZE, board_y * CELL_SIZE, CELL_SIZE, color)  # Draw it!
-
-# Draw the next Tetrimino with gradient blocks
-def draw_next_tetrimino():
-    shape = tetriminos[next_type]['shapes'][0]  # Get the shape of the next piece (first rotation).
-    color = tetriminos[next_type]['color']  # Get its color.
-    for dx, dy in shape:  # For each block...
-        draw_x = 330 + dx * 15  # Position it on the right side of the screen (smaller scale: 15 pixels).
-        draw_y = 50 + dy * 15  # Position it near the top.
-        draw_gradient_block(screen, draw_x, draw_y, 15, color)  # Draw a smaller version.
-
-# Draw score and level
-def draw_score():
-    score_text = font.render(f"Score: {score}", True, WHITE)  # Make text showing the score.
-    screen.blit(score_text, (330, 200))  # Put it on the right side of the screen.
-
-def draw_level():
-    level_text = font.render(f"Level: {level}", True, WHITE)  # Make text showing the level.
-    screen.blit(level_text, (330, 250))  # Put it below the score.
-
-# Draw controls on the HUD (heads-up display)
-def draw_controls():
-    controls = [
-        "Controls:", "Left: ←", "Right: →", "Down: ↓", "Rotate: ↑", "Drop: Space"
-    ]  # List of instructions.
-    y_offset = 300  # Start position below the level text.
-    for line in controls:  # For each line...
-        text = font.render(line, True, WHITE)  # Make it into white text.
-        screen.blit(text, (330, y_offset))  # Draw it on the right side.
-        y_offset += 30  # Move down for the next line.
-
-# Draw game over text
-def draw_game_over():
-    game_over_text = font.render("Game Over", True, WHITE)  # Make "Game Over" text.
-    screen.blit(game_over_text, (150, 300))  # Put it near the center of the screen.
-
-# Start the game
-spawn_new_tetrimino()  # Drop the first piece into play.
-
-# Main game loop
-running = True  # Keeps the game going until we say stop.
-while running:  # This loop runs over and over until the game ends.
-    for event in pygame.event.get():  # Check for things like key presses or closing the window.
-        if event.type == pygame.QUIT:  # If you click the window’s close button...
-            running = False  # Stop the game.
-        elif event.type == pygame.KEYDOWN and not game_over:  # If a key is pressed and the game isn’t over...
-            if event.key == pygame.K_LEFT:  # Left arrow?
-                if can_move(current_x - 1, current_y, current_rotation):  # Can we move left?
-                    current_x -= 1  # Move the piece left.
-                    move_sound.play()  # Beep!
-            elif event.key == pygame.K_RIGHT:  # Right arrow?
-                if can_move(current_x + 1, current_y, current_rotation):  # Can we move right?
-                    current_x += 1  # Move the piece right.
-                    move_sound.play()  # Beep!
-            elif event.key == pygame.K_DOWN:  # Down arrow?
-                if can_move(current_x, current_y + 1, current_rotation):  # Can we move down?
-                    current_y += 1  # Move the piece down faster.
-            elif event.key == pygame.K_UP:  # Up arrow?
-                new_rotation = (current_rotation + 1) % 4  # Try the next rotation (0 to 3, then back to 0).
-                if can_move(current_x, current_y, new_rotation):  # Can we rotate?
-                    current_rotation = new_rotation  # Update the rotation.
-                    rotate_sound.play()  # Higher beep!
-            elif event.key == pygame.K_SPACE:  # Spacebar?
-                while can_move(current_x, current_y + 1, current_rotation):  # Keep moving down until we can’t.
-                    current_y += 1
-                land_tetrimino()  # Land it immediately.
-
-    if not game_over:  # If the game is still going...
-        fall_time += clock.get_rawtime()  # Add up time since the last frame (in milliseconds).
-        if fall_time / 1000 > fall_speed:  # If enough time has passed (converted to seconds)...
-            if can_move(current_x, current_y + 1, current_rotation):  # Can the piece fall?
-                current_y += 1  # Move it down.
+
+    # Function to create a pronounced gradient effect for blocks
+    def draw_gradient_block(surface, x, y, size, base_color):
+        # This makes blocks look fancy with a light-to-dark gradient.
+        light_color = tuple(min(c + 70, 255) for c in base_color)  # Brighten the color (but not past 255).
+        dark_color = tuple(max(c - 70, 0) for c in base_color)     # Darken the color (but not below 0).
+        for i in range(size):  # Draw the block line by line.
+            r = int(light_color[0] + (dark_color[0] - light_color[0]) * i / size)  # Blend red.
+            g = int(light_color[1] + (dark_color[1] - light_color[1]) * i / size)  # Blend green.
+            b = int(light_color[2] + (dark_color[2] - light_color[2]) * i / size)  # Blend blue.
+            pygame.draw.line(surface, (r, g, b), (x, y + i), (x + size - 1, y + i))  # Draw a horizontal line.
+        pygame.draw.rect(surface, GRAY, (x, y, size, size), 1)  # Add a gray border around the block.
+
+    # Pre-drawn blocks. A gradient block takes 31 draw calls, so each (color, size) is drawn just
+    # once onto its own little surface, and after that we only stamp (blit) the finished picture.
+    block_cache = {}
+    def get_block(color, size):
+        block = block_cache.get((color, size))
+        if block is None:  # First time we need this one? Draw it now and keep it.
+            block = pygame.Surface((size, size)).convert()
+            draw_gradient_block(block, 0, 0, size, color)
+            block_cache[(color, size)] = block
+        return block
+
+    # The landed blocks live on their own picture (the board layer). It only changes when a piece
+    # lands, so we only repaint the rows that changed - not the whole board every frame.
+    BOARD_RECT = pygame.Rect(0, 0, BOARD_WIDTH * CELL_SIZE, BOARD_HEIGHT * CELL_SIZE)  # Where the board is on screen
+    board_layer = pygame.Surface(BOARD_RECT.size).convert()
+    board_layer.fill(BLACK)
+    board_dirty = []  # Parts of the board layer that changed and still need copying to the screen
+
+    def redraw_board_rows(first, last):
+        first, last = max(first, 0), min(last, BOARD_HEIGHT - 1)  # Stay on the board
+        for row in range(first, last + 1):  # Repaint each changed row from the board’s colors.
+            board_layer.fill(BLACK, (0, row * CELL_SIZE, BOARD_RECT.width, CELL_SIZE))
+            for col, color in enumerate(game.board.colors[row]):
+                if color is not None:
+                    board_layer.blit(get_block(color, CELL_SIZE), (col * CELL_SIZE, row * CELL_SIZE))
+        board_dirty.append(pygame.Rect(0, first * CELL_SIZE, BOARD_RECT.width, (last - first + 1) * CELL_SIZE))
+    redraw_board_rows(0, BOARD_HEIGHT - 1)  # (Empty - unless stress mode filled it with junk)
+
+    # Draw the ghost piece: an outline showing where the falling piece would land.
+    # ghost_y is only worked out when the piece moves sideways, rotates or spawns (falling
+    # straight down doesn’t change where it lands), so drawing it is just 4 outlines.
+    def draw_ghost():
+        for dx, dy in tetriminos[game.current_type]['shapes'][game.current_rotation]:  # For each block in the shape...
+            if game.ghost_y + dy >= 0:  # If it’s on the visible board...
+                pygame.draw.rect(screen, GRAY, ((game.current_x + dx) * CELL_SIZE, (game.ghost_y + dy) * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+
+    # Draw the current Tetrimino with gradient blocks
+    def draw_tetrimino(x, y, type, rotation):
+        shape = tetriminos[type]['shapes'][rotation]  # Get the shape of the falling piece.
+        block = get_block(tetriminos[type]['color'], CELL_SIZE)  # Its ready-made block picture.
+        for dx, dy in shape:  # For each block in the shape...
+            board_x = x + dx  # Where it is horizontally.
+            board_y = y + dy  # Where it is vertically.
+            if board_y >= 0:  # If it’s on the visible board (not above it)...
+                screen.blit(block, (board_x * CELL_SIZE, board_y * CELL_SIZE))  # Draw it!
+
+    # The part of the screen the falling piece and its ghost cover - from the top of the piece
+    # down to the bottom of the ghost, across the piece’s columns.
+    def piece_area():
+        shape = tetriminos[game.current_type]['shapes'][game.current_rotation]
+        left = game.current_x + min(dx for dx, dy in shape)
+        right = game.current_x + max(dx for dx, dy in shape) + 1
+        top = max(0, game.current_y + min(dy for dx, dy in shape))
+        bottom = max(top, game.ghost_y + max(dy for dx, dy in shape) + 1)
+        return pygame.Rect(left * CELL_SIZE, top * CELL_SIZE, (right - left) * CELL_SIZE, (bottom - top) * CELL_SIZE)
+
+    # Draw the next Tetrimino with gradient blocks
+    NEXT_RECT = pygame.Rect(330, 50, 4 * 15, 4 * 15)  # Room for any piece at the small size
+    def draw_next_tetrimino():
+        screen.fill(BLACK, NEXT_RECT)  # Rub out the old one.
+        shape = tetriminos[game.next_type]['shapes'][0]  # Get the shape of the next piece (first rotation).
+        block = get_block(tetriminos[game.next_type]['color'], 15)  # A smaller version of its block.
+        for dx, dy in shape:  # For each block...
+            draw_x = 330 + dx * 15  # Position it on the right side of the screen (smaller scale: 15 pixels).
+            draw_y = 50 + dy * 15  # Position it near the top.
+            screen.blit(block, (draw_x, draw_y))
+
+    # Draw score and level (only when they change - see draw_frame)
+    SCORE_RECT = pygame.Rect(330, 200, WIDTH - 330, 30)
+    LEVEL_RECT = pygame.Rect(330, 250, WIDTH - 330, 30)
+    def draw_score():
+        screen.fill(BLACK, SCORE_RECT)  # Rub out the old score.
+        text.draw(screen, font, WHITE, (330, 200), "Score: ", game.score)  # Show the score on the right side of the screen.
+
+    def draw_level():
+        screen.fill(BLACK, LEVEL_RECT)  # Rub out the old level.
+        text.draw(screen, font, WHITE, (330, 250), "Level: ", game.level)  # Show the level below the score.
+
+    # Draw controls on the HUD (heads-up display)
+    def draw_controls():
+        controls = [
+            "Controls:", "Left: ←", "Right: →", "Down: ↓", "Rotate: ↑", "Drop: Space"
+        ]  # List of instructions.
+        y_offset = 300  # Start position below the level text.
+        for line in controls:  # For each line...
+            screen.blit(text.render(font, line, WHITE), (330, y_offset))  # Draw it in white on the right side.
+            y_offset += 30  # Move down for the next line.
+
+    # Draw game over text
+    def draw_game_over():
+        game_over_text = text.render(font, "Game Over", WHITE)  # Make "Game Over" text.
+        screen.blit(game_over_text, (150, 300))  # Put it near the center of the screen.
+
+    # What’s on the screen right now, so each frame we only redraw what changed
+    shown = {'piece': None, 'next': None, 'score': None, 'level': None, 'game_over': None, 'overlay': None}
+
+    # Draw one frame. Instead of clearing and redrawing everything, we fix up only the parts
+    # that changed (the "dirty rectangles"), and the main loop tells pygame to send just those to the screen.
+    def draw_frame():
+        dirty = []  # Rectangles of the screen we changed this frame
+        if shown['game_over'] != game.game_over:  # First frame, or the game just ended: draw it all.
+            screen.fill(BLACK)
+            if game.game_over:
+                draw_game_over()  # If it’s over, show "Game Over".
             else:
-                land_tetrimino()  # If not, land it.
-            fall_time = 0  # Reset the fall timer.
-
-    screen.fill(BLACK)  # Clear the screen with black before drawing.
-    if not game_over:  # If the game is still on...
-        draw_board()  # Draw the landed pieces.
-        draw_tetrimino(current_x, current_y, current_type, current_rotation)  # Draw the falling piece.
-        draw_next_tetrimino()  # Show the next piece on the side.
-        draw_score()  # Show the score.
-        draw_level()  # Show the level.
-        draw_controls()  # Show the control instructions.
-    else:
-        draw_game_over()  # If it’s over, show "Game Over".
-
-    pygame.display.flip()  # Update the screen with everything we drew.
-    clock.tick(60)  # Aim for 60 frames per second – keeps the game smooth.
-
-pygame.quit()  # Clean up and close Pygame when the game ends.
\ No newline at end of file
+                screen.blit(board_layer, BOARD_RECT)  # The landed pieces.
+                draw_controls()  # The control instructions never change, so they’re drawn just this once.
+            for thing in shown:
+                shown[thing] = None  # Everything else gets drawn fresh below
+            shown['game_over'] = game.game_over
+            board_dirty.clear()
+            dirty.append(screen.get_rect())
+        if game.game_over:
+            return dirty
+        # Copy the changed board rows, then rub out the falling piece where it was last frame
+        # (and where it is now) by copying the board layer back over it.
+        area = piece_area()
+        for rect in board_dirty + [shown['piece'], area]:
+            if rect:
+                screen.blit(board_layer, rect, rect)
+                dirty.append(rect)
+        board_dirty.clear()
+        draw_ghost()  # Show where the falling piece will land.
+        draw_tetrimino(game.current_x, game.current_y, game.current_type, game.current_rotation)  # Draw the falling piece.
+        shown['piece'] = area
+        if shown['next'] != game.next_type:  # Only when a new piece spawns
+            draw_next_tetrimino()  # Show the next piece on the side.
+            shown['next'] = game.next_type
+            dirty.append(NEXT_RECT)
+        if shown['score'] != game.score:
+            draw_score()  # Show the score.
+            shown['score'] = game.score
+            dirty.append(SCORE_RECT)
+        if shown['level'] != game.level:
+            draw_level()  # Show the level.
+            shown['level'] = game.level
+            dirty.append(LEVEL_RECT)
+        return dirty
+
+    # The frame timer's numbers, bottom right under the controls (only when it's on). Last frame's
+    # copy gets rubbed out first, putting back any bit of the controls it was covering.
+    def draw_overlay():
+        dirty = []
+        if shown['overlay']:
+            screen.fill(BLACK, shown['overlay'])
+            if not game.game_over:
+                screen.set_clip(shown['overlay'])  # Only redraw the controls inside the rubbed-out part
+                draw_controls()
+                screen.set_clip(None)
+            dirty.append(shown['overlay'])
+        shown['overlay'] = None
+        if timer.enabled and timer.overlay:
+            width, height = timer.overlay.get_size()
+            shown['overlay'] = timer.draw(screen, (WIDTH - width, HEIGHT - height))
+            dirty.append(shown['overlay'])
+        return dirty
+
+    # Main game loop
+    running = True  # Keeps the game going until we say stop.
+    while running and not loop.finished:  # This loop runs over and over until the game ends.
+        events = pygame.event.get()  # Check for things like key presses or closing the window.
+        timer.mark("input")
+        for event in events:
+            timer.handle(event)
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):  # If you click the window’s close button (or press Esc)...
+                running = False  # Stop the game.
+            elif event.type == pygame.KEYDOWN and not game.game_over:  # If a key is pressed and the game isn’t over...
+                if event.key in KEY_ACTIONS:
+                    recorder.record(loop.ticks, KEY_ACTIONS[event.key])  # Save it in the replay (with the tick it happened on)
+                if event.key == pygame.K_LEFT:  # Left arrow?
+                    if game.move(-1):  # Move the piece left, if there’s room.
+                        move_sound.play()  # Beep!
+                elif event.key == pygame.K_RIGHT:  # Right arrow?
+                    if game.move(1):  # Move the piece right, if there’s room.
+                        move_sound.play()  # Beep!
+                elif event.key == pygame.K_DOWN:  # Down arrow?
+                    game.soft_drop()  # Move the piece down faster.
+                elif event.key == pygame.K_UP:  # Up arrow?
+                    if game.rotate():  # Try the next rotation (0 to 3, then back to 0).
+                        rotate_sound.play()  # Higher beep!
+                elif event.key == pygame.K_SPACE:  # Spacebar?
+                    game.current_y = game.ghost_y  # Jump straight to where the ghost piece says it lands.
+                    land_tetrimino()  # Land it immediately.
+        timer.mark("update")  # (Moving the piece for the keys - landing and clearing lines too - counts as update)
+
+        for _ in timer.wait(loop.ticks_due()):  # However many ticks are due (usually 1)...
+            if not game.game_over and game.gravity():  # Is it time for the piece to fall (every fall_speed seconds)?
+                if not game.soft_drop():  # Can the piece fall? Move it down.
+                    land_tetrimino()  # If not, land it.
+            timer.mark("update")
+        if game.game_over:
+            recorder.finish(game, loop.ticks)  # Save the final score and board at the end of the replay
+            if stress_fill:
+                game = new_game()  # Stress mode: straight into the next game
+                redraw_board_rows(0, BOARD_HEIGHT - 1)
+
+        if loop.render:  # Skip drawing when there's no screen (see arcade_common/game_loop.py)
+            dirty = draw_frame() + draw_overlay()  # Draw only what changed...
+            timer.mark("render")
+            pygame.display.update(dirty)  # ...and send only the changed parts to the screen.
+            timer.mark("flip")
+
+        timer.count("blocks", sum(bin(row).count("1") for row in game.board.rows))
+        timer.end()
+
+    recorder.finish(game, loop.ticks)  # Closed the window mid-game? The replay still gets its ending.
+    timer.close()
+
+
+if __name__ == "__main__":
+    main()
+    pygame.quit()  # Clean up and close Pygame when the game ends.
\ No newline at end of file